@@ -13,22 +13,34 @@ import { LifeCore } from '@/components/shell/LifeCore'
 import { FloatingDock } from '@/components/shell/FloatingDock'
 import { WorkoutProvider } from '@/context/WorkoutContext'
 import { useKeyboardAvoidance } from '@/hooks/use-keyboard-avoidance'
+import { signalReady } from '@/lib/readiness'
+import { moduleLoaders, prefetchAfterMount } from '@/lib/module-prefetch'
 
 // @ts-expect-error virtual:pwa-register is dynamically generated
 import { registerSW } from 'virtual:pwa-register'
 
-// Lazy load all modules to reduce initial bundle size
-const Dashboard = lazy(() => import('@/components/modules/Dashboard').then(module => ({ default: module.Dashboard })))
-const Habits = lazy(() => import('@/components/modules/Habits').then(module => ({ default: module.Habits })))
-const Finance = lazy(() => import('@/components/modules/Finance').then(module => ({ default: module.Finance })))
-const Tasks = lazy(() => import('@/components/modules/Tasks').then(module => ({ default: module.Tasks })))
-const Workouts = lazy(() => import('@/components/modules/Workouts').then(module => ({ default: module.Workouts })))
-const Knox = lazy(() => import('@/components/modules/Knox').then(module => ({ default: module.Knox })))
-const Shopping = lazy(() => import('@/components/modules/Shopping').then(module => ({ default: module.Shopping })))
-const Calendar = lazy(() => import('@/components/modules/Calendar').then(module => ({ default: module.Calendar })))
-const Settings = lazy(() => import('@/components/modules/Settings').then(module => ({ default: module.Settings })))
-const GolfSwing = lazy(() => import('@/components/modules/GolfSwing').then(module => ({ default: module.GolfSwing })))
-const Connections = lazy(() => import('@/components/modules/Connections').then(module => ({ default: module.Connections })))
+// Lazy load all modules to reduce initial bundle size (see module-prefetch for the loaders)
+const Dashboard = lazy(() => moduleLoaders.dashboard().then(module => ({ default: module.Dashboard })))
+const Habits = lazy(() => moduleLoaders.habits().then(module => ({ default: module.Habits })))
+const Finance = lazy(() => moduleLoaders.finance().then(module => ({ default: module.Finance })))
+const Tasks = lazy(() => moduleLoaders.tasks().then(module => ({ default: module.Tasks })))
+const Workouts = lazy(() => moduleLoaders.workouts().then(module => ({ default: module.Workouts })))
+const Knox = lazy(() => moduleLoaders.knox().then(module => ({ default: module.Knox })))
+const Shopping = lazy(() => moduleLoaders.shopping().then(module => ({ default: module.Shopping })))
+const Calendar = lazy(() => moduleLoaders.calendar().then(module => ({ default: module.Calendar })))
+const Settings = lazy(() => moduleLoaders.settings().then(module => ({ default: module.Settings })))
+const GolfSwing = lazy(() => moduleLoaders.golf().then(module => ({ default: module.GolfSwing })))
+const Connections = lazy(() => moduleLoaders.connections().then(module => ({ default: module.Connections })))
+
+// Rendered next to the active module inside Suspense, so its effect only runs
+// once the lazy chunk has resolved and the module has committed.
+const ModuleMounted = ({ id }: { id: Module }) => {
+  useEffect(() => {
+    signalReady('module-mounted', id)
+    prefetchAfterMount(id)
+  }, [id])
+  return null
+}
 
 function App() {
   const [activeModule, setActiveModule] = useState<Module>('dashboard')
@@ -69,6 +81,10 @@ function App() {
     clearData()
   }, [])
 
+  useEffect(() => {
+    if (!isLoading) signalReady('app-ready')
+  }, [isLoading])
+
   const handleModuleChange = (moduleId: string) => {
     setActiveModule(moduleId as Module)
     
@@ -117,6 +133,7 @@ function App() {
               return <Dashboard onNavigate={handleModuleChange} />
           }
         })()}
+        <ModuleMounted key={activeModule} id={activeModule} />
       </Suspense>
     )
   }
@@ -1,10 +1,22 @@
 import { useEffect, useRef } from 'react'
-import { SwingPoseData, SwingLandmark } from '@/lib/types'
+import { SwingPoseData } from '@/lib/types'
 import { cn } from '@/lib/utils'
+import {
+  type Bone,
+  MIN_VISIBILITY,
+  clearCanvas,
+  drawSprite,
+  fitCanvas,
+  poseFrameAt,
+  sprite,
+  strokeBones,
+  watchVideoFrames
+} from '@/lib/golf/pose-renderer'
 
 interface OverlayCanvasProps {
   poseData: SwingPoseData[]
-  currentFrame: number // Index of the current frame
+  // The overlay redraws once per frame this video presents
+  videoRef: React.RefObject<HTMLVideoElement | null>
   className?: string
   showOverlay: boolean
 }
@@ -31,188 +43,173 @@ const LANDMARK_INDICES = {
   RIGHT_FOOT_INDEX: 32
 }
 
+// Colors
+// Right Side (User's Right) -> Red/Pink
+const RIGHT_COLOR = '#FF4F4F'
+// Left Side (User's Left) -> Cyan/Blue
+const LEFT_COLOR = '#2E8AF7'
+// Center -> White
+const CENTER_COLOR = '#FFFFFF'
+
+const L = LANDMARK_INDICES
+
+// Bones grouped by stroke style, so each group is one path
+const BONE_GROUPS: { color: string; width: number; bones: Bone[] }[] = [
+  // 1. Torso Box
+  { color: CENTER_COLOR, width: 4, bones: [[L.LEFT_SHOULDER, L.RIGHT_SHOULDER], [L.LEFT_HIP, L.RIGHT_HIP]] },
+  { color: LEFT_COLOR, width: 3, bones: [[L.LEFT_SHOULDER, L.LEFT_HIP]] },
+  { color: RIGHT_COLOR, width: 3, bones: [[L.RIGHT_SHOULDER, L.RIGHT_HIP]] },
+  // 2. Arms and 3. Legs
+  {
+    color: LEFT_COLOR,
+    width: 4,
+    bones: [
+      [L.LEFT_SHOULDER, L.LEFT_ELBOW], [L.LEFT_ELBOW, L.LEFT_WRIST],
+      [L.LEFT_HIP, L.LEFT_KNEE], [L.LEFT_KNEE, L.LEFT_ANKLE]
+    ]
+  },
+  {
+    color: RIGHT_COLOR,
+    width: 4,
+    bones: [
+      [L.RIGHT_SHOULDER, L.RIGHT_ELBOW], [L.RIGHT_ELBOW, L.RIGHT_WRIST],
+      [L.RIGHT_HIP, L.RIGHT_KNEE], [L.RIGHT_KNEE, L.RIGHT_ANKLE]
+    ]
+  },
+  // Feet
+  {
+    color: LEFT_COLOR,
+    width: 2,
+    bones: [[L.LEFT_ANKLE, L.LEFT_HEEL], [L.LEFT_HEEL, L.LEFT_FOOT_INDEX], [L.LEFT_ANKLE, L.LEFT_FOOT_INDEX]]
+  },
+  {
+    color: RIGHT_COLOR,
+    width: 2,
+    bones: [[L.RIGHT_ANKLE, L.RIGHT_HEEL], [L.RIGHT_HEEL, L.RIGHT_FOOT_INDEX], [L.RIGHT_ANKLE, L.RIGHT_FOOT_INDEX]]
+  },
+]
+
+// 4. Joints (Draw over lines)
+const JOINTS = [
+  { idx: L.LEFT_SHOULDER, color: LEFT_COLOR },
+  { idx: L.RIGHT_SHOULDER, color: RIGHT_COLOR },
+  { idx: L.LEFT_ELBOW, color: LEFT_COLOR },
+  { idx: L.RIGHT_ELBOW, color: RIGHT_COLOR },
+  { idx: L.LEFT_WRIST, color: LEFT_COLOR },
+  { idx: L.RIGHT_WRIST, color: RIGHT_COLOR },
+  { idx: L.LEFT_HIP, color: LEFT_COLOR },
+  { idx: L.RIGHT_HIP, color: RIGHT_COLOR },
+  { idx: L.LEFT_KNEE, color: LEFT_COLOR },
+  { idx: L.RIGHT_KNEE, color: RIGHT_COLOR },
+  { idx: L.LEFT_ANKLE, color: LEFT_COLOR },
+  { idx: L.RIGHT_ANKLE, color: RIGHT_COLOR },
+]
+
+const JOINT_SIZE = 14
+
+// Joint marker, painted once per color: a colored dot with a thin dark ring and a white core
+const jointSprite = (color: string) => sprite(`overlay-joint-${color}`, JOINT_SIZE, ctx => {
+  ctx.beginPath()
+  ctx.arc(0, 0, 5, 0, 2 * Math.PI)
+  ctx.strokeStyle = 'rgba(0,0,0,0.5)'
+  ctx.lineWidth = 1
+  ctx.stroke()
+  ctx.fillStyle = color
+  ctx.fill()
+  ctx.beginPath()
+  ctx.arc(0, 0, 2, 0, 2 * Math.PI)
+  ctx.fillStyle = 'white'
+  ctx.fill()
+})
+
 export function OverlayCanvas({
   poseData,
-  currentFrame,
+  videoRef,
   className,
   showOverlay
 }: OverlayCanvasProps) {
   const canvasRef = useRef<HTMLCanvasElement>(null)
 
-  // Draw loop
+  // Draw loop: one draw per presented video frame, skipped when the pose frame is unchanged
   useEffect(() => {
     const canvas = canvasRef.current
-    if (!canvas) return
+    const video = videoRef.current
+    if (!canvas || !video) return
 
     const ctx = canvas.getContext('2d')
     if (!ctx) return
 
-    // Resize handling
-    const updateCanvasSize = () => {
-      const parent = canvas.parentElement
-      if (parent) {
-        const rect = parent.getBoundingClientRect()
-        const dpr = window.devicePixelRatio || 1
-        // Avoid infinite loop resizing, trust parent dimensions
-        if (canvas.width !== rect.width * dpr || canvas.height !== rect.height * dpr) {
-            canvas.width = rect.width * dpr
-            canvas.height = rect.height * dpr
-            canvas.style.width = `${rect.width}px`
-            canvas.style.height = `${rect.height}px`
-            ctx.scale(dpr, dpr)
-        }
+    let width = 0
+    let height = 0
+    let drawnFrame = -1
+
+    const draw = (time: number, force = false) => {
+      const frame = showOverlay ? poseFrameAt(time, video.duration, poseData.length) : -1
+      if (frame === drawnFrame && !force) return
+      drawnFrame = frame
+
+      clearCanvas(canvas, ctx)
+      const pose = poseData[frame]
+      if (!pose || !pose.landmarks) return
+      const landmarks = pose.landmarks
+
+      ctx.lineCap = 'round'
+      for (const group of BONE_GROUPS) {
+        ctx.strokeStyle = group.color
+        ctx.lineWidth = group.width
+        strokeBones(ctx, landmarks, group.bones, width, height)
       }
-    }
-
-    updateCanvasSize()
-
-    if (!showOverlay) {
-      ctx.clearRect(0, 0, canvas.width / window.devicePixelRatio, canvas.height / window.devicePixelRatio)
-      return
-    }
-
-    const pose = poseData[currentFrame]
-    if (!pose || !pose.landmarks) {
-      ctx.clearRect(0, 0, canvas.width / window.devicePixelRatio, canvas.height / window.devicePixelRatio)
-      return
-    }
-
-    const width = canvas.width / window.devicePixelRatio
-    const height = canvas.height / window.devicePixelRatio
-
-    ctx.clearRect(0, 0, width, height)
-
-    // Helper to get coordinates
-    const getPoint = (idx: number) => {
-        const lm = pose.landmarks[idx]
-        return { x: lm.x * width, y: lm.y * height, v: lm.visibility }
-    }
-
-    const drawLine = (idx1: number, idx2: number, color: string, width = 3) => {
-        const p1 = getPoint(idx1)
-        const p2 = getPoint(idx2)
-        if (p1.v > 0.5 && p2.v > 0.5) {
-            ctx.beginPath()
-            ctx.moveTo(p1.x, p1.y)
-            ctx.lineTo(p2.x, p2.y)
-            ctx.strokeStyle = color
-            ctx.lineWidth = width
-            ctx.lineCap = 'round'
-            ctx.stroke()
-        }
-    }
 
-    const drawPoint = (idx: number, color: string, radius = 4) => {
-        const p = getPoint(idx)
-        if (p.v > 0.5) {
-            ctx.beginPath()
-            ctx.arc(p.x, p.y, radius, 0, 2 * Math.PI)
-            ctx.fillStyle = color
-            ctx.fill()
-            ctx.strokeStyle = 'rgba(0,0,0,0.5)'
-            ctx.lineWidth = 1
-            ctx.stroke()
+      for (const joint of JOINTS) {
+        const lm = landmarks[joint.idx]
+        if (lm && lm.visibility > MIN_VISIBILITY) {
+          drawSprite(ctx, jointSprite(joint.color), JOINT_SIZE, lm.x * width, lm.y * height)
         }
-    }
-
-    // --- SKELETON RENDERER ---
-
-    // Colors
-    // Right Side (User's Right) -> Red/Pink
-    const RIGHT_COLOR = '#FF4F4F'
-    // Left Side (User's Left) -> Cyan/Blue
-    const LEFT_COLOR = '#2E8AF7'
-    // Center -> White
-    const CENTER_COLOR = '#FFFFFF'
-
-    // 1. Torso Box
-    drawLine(LANDMARK_INDICES.LEFT_SHOULDER, LANDMARK_INDICES.RIGHT_SHOULDER, CENTER_COLOR, 4)
-    drawLine(LANDMARK_INDICES.LEFT_HIP, LANDMARK_INDICES.RIGHT_HIP, CENTER_COLOR, 4)
-    drawLine(LANDMARK_INDICES.LEFT_SHOULDER, LANDMARK_INDICES.LEFT_HIP, LEFT_COLOR, 3)
-    drawLine(LANDMARK_INDICES.RIGHT_SHOULDER, LANDMARK_INDICES.RIGHT_HIP, RIGHT_COLOR, 3)
-
-    // 2. Arms
-    // Left Arm
-    drawLine(LANDMARK_INDICES.LEFT_SHOULDER, LANDMARK_INDICES.LEFT_ELBOW, LEFT_COLOR, 4)
-    drawLine(LANDMARK_INDICES.LEFT_ELBOW, LANDMARK_INDICES.LEFT_WRIST, LEFT_COLOR, 4)
-    // Right Arm
-    drawLine(LANDMARK_INDICES.RIGHT_SHOULDER, LANDMARK_INDICES.RIGHT_ELBOW, RIGHT_COLOR, 4)
-    drawLine(LANDMARK_INDICES.RIGHT_ELBOW, LANDMARK_INDICES.RIGHT_WRIST, RIGHT_COLOR, 4)
-
-    // 3. Legs
-    // Left Leg
-    drawLine(LANDMARK_INDICES.LEFT_HIP, LANDMARK_INDICES.LEFT_KNEE, LEFT_COLOR, 4)
-    drawLine(LANDMARK_INDICES.LEFT_KNEE, LANDMARK_INDICES.LEFT_ANKLE, LEFT_COLOR, 4)
-    drawLine(LANDMARK_INDICES.LEFT_ANKLE, LANDMARK_INDICES.LEFT_HEEL, LEFT_COLOR, 2)
-    drawLine(LANDMARK_INDICES.LEFT_HEEL, LANDMARK_INDICES.LEFT_FOOT_INDEX, LEFT_COLOR, 2)
-    drawLine(LANDMARK_INDICES.LEFT_ANKLE, LANDMARK_INDICES.LEFT_FOOT_INDEX, LEFT_COLOR, 2)
-
-    // Right Leg
-    drawLine(LANDMARK_INDICES.RIGHT_HIP, LANDMARK_INDICES.RIGHT_KNEE, RIGHT_COLOR, 4)
-    drawLine(LANDMARK_INDICES.RIGHT_KNEE, LANDMARK_INDICES.RIGHT_ANKLE, RIGHT_COLOR, 4)
-    drawLine(LANDMARK_INDICES.RIGHT_ANKLE, LANDMARK_INDICES.RIGHT_HEEL, RIGHT_COLOR, 2)
-    drawLine(LANDMARK_INDICES.RIGHT_HEEL, LANDMARK_INDICES.RIGHT_FOOT_INDEX, RIGHT_COLOR, 2)
-    drawLine(LANDMARK_INDICES.RIGHT_ANKLE, LANDMARK_INDICES.RIGHT_FOOT_INDEX, RIGHT_COLOR, 2)
-
-    // 4. Joints (Draw over lines)
-    const joints = [
-        { idx: LANDMARK_INDICES.LEFT_SHOULDER, color: LEFT_COLOR },
-        { idx: LANDMARK_INDICES.RIGHT_SHOULDER, color: RIGHT_COLOR },
-        { idx: LANDMARK_INDICES.LEFT_ELBOW, color: LEFT_COLOR },
-        { idx: LANDMARK_INDICES.RIGHT_ELBOW, color: RIGHT_COLOR },
-        { idx: LANDMARK_INDICES.LEFT_WRIST, color: LEFT_COLOR },
-        { idx: LANDMARK_INDICES.RIGHT_WRIST, color: RIGHT_COLOR },
-        { idx: LANDMARK_INDICES.LEFT_HIP, color: LEFT_COLOR },
-        { idx: LANDMARK_INDICES.RIGHT_HIP, color: RIGHT_COLOR },
-        { idx: LANDMARK_INDICES.LEFT_KNEE, color: LEFT_COLOR },
-        { idx: LANDMARK_INDICES.RIGHT_KNEE, color: RIGHT_COLOR },
-        { idx: LANDMARK_INDICES.LEFT_ANKLE, color: LEFT_COLOR },
-        { idx: LANDMARK_INDICES.RIGHT_ANKLE, color: RIGHT_COLOR },
-    ]
-
-    joints.forEach(j => drawPoint(j.idx, 'white', 3)) // White inner
-    joints.forEach(j => drawPoint(j.idx, j.color, 5)) // Color outer ring? No, drawPoint fills.
-
-    // Let's make joints pop
-    joints.forEach(j => {
-        const p = getPoint(j.idx)
-        if (p.v > 0.5) {
-             ctx.beginPath()
-             ctx.arc(p.x, p.y, 5, 0, 2 * Math.PI)
-             ctx.fillStyle = j.color
-             ctx.fill()
-             ctx.beginPath()
-             ctx.arc(p.x, p.y, 2, 0, 2 * Math.PI)
-             ctx.fillStyle = 'white'
-             ctx.fill()
-        }
-    })
-
-    // 5. Head
-    // Draw line from nose to mid-shoulder
-    const nose = getPoint(LANDMARK_INDICES.NOSE)
-    const lShoulder = getPoint(LANDMARK_INDICES.LEFT_SHOULDER)
-    const rShoulder = getPoint(LANDMARK_INDICES.RIGHT_SHOULDER)
-    const midShoulder = { x: (lShoulder.x + rShoulder.x) / 2, y: (lShoulder.y + rShoulder.y) / 2 }
+      }
 
-    if (nose.v > 0.5) {
+      // 5. Head
+      // Draw line from nose to mid-shoulder
+      const nose = landmarks[L.NOSE]
+      const lShoulder = landmarks[L.LEFT_SHOULDER]
+      const rShoulder = landmarks[L.RIGHT_SHOULDER]
+      if (nose && lShoulder && rShoulder && nose.visibility > MIN_VISIBILITY) {
+        const x = nose.x * width
+        const y = nose.y * height
         ctx.beginPath()
-        ctx.moveTo(nose.x, nose.y)
-        ctx.lineTo(midShoulder.x, midShoulder.y)
-        ctx.strokeStyle = CENTER_COLOR
-        ctx.lineWidth = 2
-        ctx.stroke()
-
+        ctx.moveTo(x, y)
+        ctx.lineTo((lShoulder.x + rShoulder.x) / 2 * width, (lShoulder.y + rShoulder.y) / 2 * height)
         // Head circle
-        ctx.beginPath()
-        ctx.arc(nose.x, nose.y, 15 * (width/1000 + 0.5), 0, 2 * Math.PI) // Scale roughly
+        ctx.moveTo(x + 15 * (width / 1000 + 0.5), y)
+        ctx.arc(x, y, 15 * (width / 1000 + 0.5), 0, 2 * Math.PI) // Scale roughly
         ctx.strokeStyle = CENTER_COLOR
         ctx.lineWidth = 2
         ctx.stroke()
+      }
     }
 
+    // Resize handling: trust parent dimensions, redraw the frame on screen
+    const resize = () => {
+      const parent = canvas.parentElement
+      if (!parent) return
+      const rect = parent.getBoundingClientRect()
+      width = rect.width
+      height = rect.height
+      fitCanvas(canvas, ctx, width, height)
+      draw(video.currentTime, true)
+    }
 
-  }, [poseData, currentFrame, showOverlay])
+    resize()
+    const resizeObserver = new ResizeObserver(resize)
+    if (canvas.parentElement) resizeObserver.observe(canvas.parentElement)
+    const stopWatching = watchVideoFrames(video, draw)
+    video.addEventListener('loadedmetadata', resize)
+
+    return () => {
+      stopWatching()
+      resizeObserver.disconnect()
+      video.removeEventListener('loadedmetadata', resize)
+    }
+  }, [poseData, videoRef, showOverlay])
 
   return (
     <canvas
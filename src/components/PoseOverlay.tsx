@@ -2,6 +2,16 @@ import { useEffect, useRef, useState } from 'react'
 import { SwingPoseData } from '@/lib/types'
 import { cn } from '@/lib/utils'
 import { Eye, EyeSlash } from '@phosphor-icons/react'
+import {
+  MIN_VISIBILITY,
+  clearCanvas,
+  drawSprite,
+  fitCanvas,
+  poseFrameAt,
+  sprite,
+  strokeBones,
+  watchVideoFrames
+} from '@/lib/golf/pose-renderer'
 
 interface PoseOverlayProps {
   videoRef: React.RefObject<HTMLVideoElement | null>
@@ -67,6 +77,24 @@ const getJointColor = (index: number): string => {
   return JOINT_COLORS.foot
 }
 
+const KEYPOINT_GLOW = 10
+const keypointSize = (radius: number) => 2 * (radius + KEYPOINT_GLOW + 2)
+
+// Keypoint marker with its glow and ring, painted once per color and size
+const keypointSprite = (color: string, radius: number) =>
+  sprite(`pose-keypoint-${color}-${radius}`, keypointSize(radius), ctx => {
+    ctx.shadowColor = color
+    ctx.shadowBlur = KEYPOINT_GLOW
+    ctx.fillStyle = color
+    ctx.beginPath()
+    ctx.arc(0, 0, radius, 0, 2 * Math.PI)
+    ctx.fill()
+    ctx.shadowBlur = 0
+    ctx.strokeStyle = 'rgba(255, 255, 255, 0.8)'
+    ctx.lineWidth = 2
+    ctx.stroke()
+  })
+
 export function PoseOverlay({
   videoRef,
   poseData,
@@ -79,38 +107,9 @@ export function PoseOverlay({
   keypointRadius = 5
 }: PoseOverlayProps) {
   const canvasRef = useRef<HTMLCanvasElement>(null)
-  const animationFrameRef = useRef<number | undefined>(undefined)
   const [currentFrame, setCurrentFrame] = useState(0)
   const [isVisible, setIsVisible] = useState(true)
 
-  useEffect(() => {
-    const video = videoRef.current
-    const canvas = canvasRef.current
-    if (!video || !canvas) return
-
-    const ctx = canvas.getContext('2d')
-    if (!ctx) return
-
-    const updateCanvasSize = () => {
-      const rect = video.getBoundingClientRect()
-      const dpr = window.devicePixelRatio || 1
-      canvas.width = rect.width * dpr
-      canvas.height = rect.height * dpr
-      canvas.style.width = `${rect.width}px`
-      canvas.style.height = `${rect.height}px`
-      ctx.scale(dpr, dpr)
-    }
-
-    updateCanvasSize()
-
-    const resizeObserver = new ResizeObserver(updateCanvasSize)
-    resizeObserver.observe(video)
-
-    return () => {
-      resizeObserver.disconnect()
-    }
-  }, [videoRef])
-
   useEffect(() => {
     const video = videoRef.current
     const canvas = canvasRef.current
@@ -119,134 +118,67 @@ export function PoseOverlay({
     const ctx = canvas.getContext('2d')
     if (!ctx) return
 
-    const drawPose = () => {
-      if (!isVisible) {
-        ctx.clearRect(0, 0, canvas.width, canvas.height)
-        return
-      }
+    let width = 0
+    let height = 0
+    let drawnFrame = -1
 
-      const videoDuration = video.duration
-      const currentTime = video.currentTime
-      
-      if (videoDuration === 0 || isNaN(currentTime)) return
+    // Called once per presented video frame; a frame already on screen is not drawn again
+    const drawPose = (time: number, force = false) => {
+      const frameIndex = poseFrameAt(time, video.duration, poseData.length)
+      if (frameIndex < 0 || (frameIndex === drawnFrame && !force)) return
+      drawnFrame = frameIndex
+      setCurrentFrame(frameIndex)
 
-      const frameIndex = Math.floor((currentTime / videoDuration) * poseData.length)
-      const clampedIndex = Math.max(0, Math.min(frameIndex, poseData.length - 1))
-      
-      if (clampedIndex !== currentFrame) {
-        setCurrentFrame(clampedIndex)
-      }
+      clearCanvas(canvas, ctx)
+      if (!isVisible) return
 
-      const pose = poseData[clampedIndex]
+      const pose = poseData[frameIndex]
       if (!pose || !pose.landmarks) return
 
-      ctx.clearRect(0, 0, canvas.width, canvas.height)
-
-      const scaleX = canvas.width
-      const scaleY = canvas.height
-
-      const visibleLandmarks = pose.landmarks.filter(
-        landmark => landmark.visibility > 0.5
-      )
-
       if (showSkeleton) {
         ctx.lineWidth = lineWidth
         ctx.lineCap = 'round'
         ctx.lineJoin = 'round'
-
-        POSE_CONNECTIONS.forEach(([startIdx, endIdx]) => {
-          const start = pose.landmarks[startIdx]
-          const end = pose.landmarks[endIdx]
-
-          if (start && end && start.visibility > 0.5 && end.visibility > 0.5) {
-            const gradient = ctx.createLinearGradient(
-              start.x * scaleX,
-              start.y * scaleY,
-              end.x * scaleX,
-              end.y * scaleY
-            )
-            
-            const startColor = getJointColor(startIdx)
-            const endColor = getJointColor(endIdx)
-            gradient.addColorStop(0, startColor)
-            gradient.addColorStop(1, endColor)
-
-            ctx.strokeStyle = skeletonColor
-            ctx.shadowColor = skeletonColor
-            ctx.shadowBlur = 8
-            
-            ctx.beginPath()
-            ctx.moveTo(start.x * scaleX, start.y * scaleY)
-            ctx.lineTo(end.x * scaleX, end.y * scaleY)
-            ctx.stroke()
-            
-            ctx.shadowBlur = 0
-          }
-        })
+        ctx.strokeStyle = skeletonColor
+        ctx.shadowColor = skeletonColor
+        ctx.shadowBlur = 8
+        strokeBones(ctx, pose.landmarks, POSE_CONNECTIONS, width, height)
+        ctx.shadowBlur = 0
       }
 
       if (showKeypoints) {
-        visibleLandmarks.forEach((landmark, index) => {
-          const x = landmark.x * scaleX
-          const y = landmark.y * scaleY
-          const alpha = landmark.visibility
-
-          const color = keypointColor || getJointColor(index)
-          
-          ctx.shadowColor = color
-          ctx.shadowBlur = 10
-          
-          ctx.fillStyle = color.replace(')', `, ${alpha})`)
-          ctx.beginPath()
-          ctx.arc(x, y, keypointRadius, 0, 2 * Math.PI)
-          ctx.fill()
-
-          ctx.strokeStyle = `rgba(255, 255, 255, ${alpha * 0.8})`
-          ctx.lineWidth = 2
-          ctx.stroke()
-          
-          ctx.shadowBlur = 0
+        const size = keypointSize(keypointRadius)
+        pose.landmarks.forEach((landmark, index) => {
+          if (landmark.visibility <= MIN_VISIBILITY) return
+          ctx.globalAlpha = landmark.visibility
+          const image = keypointSprite(keypointColor || getJointColor(index), keypointRadius)
+          drawSprite(ctx, image, size, landmark.x * width, landmark.y * height)
         })
+        ctx.globalAlpha = 1
       }
-
-      animationFrameRef.current = requestAnimationFrame(drawPose)
-    }
-
-    const handlePlay = () => {
-      if (animationFrameRef.current) {
-        cancelAnimationFrame(animationFrameRef.current)
-      }
-      drawPose()
-    }
-
-    const handlePause = () => {
-      if (animationFrameRef.current) {
-        cancelAnimationFrame(animationFrameRef.current)
-      }
-      drawPose()
     }
 
-    const handleSeeked = () => {
-      drawPose()
+    const updateCanvasSize = () => {
+      const rect = video.getBoundingClientRect()
+      width = rect.width
+      height = rect.height
+      fitCanvas(canvas, ctx, width, height)
+      drawPose(video.currentTime, true)
     }
 
-    video.addEventListener('play', handlePlay)
-    video.addEventListener('pause', handlePause)
-    video.addEventListener('seeked', handleSeeked)
-    video.addEventListener('timeupdate', drawPose)
+    updateCanvasSize()
 
-    drawPose()
+    const resizeObserver = new ResizeObserver(updateCanvasSize)
+    resizeObserver.observe(video)
+    const stopWatching = watchVideoFrames(video, drawPose)
+    video.addEventListener('loadedmetadata', updateCanvasSize)
 
     return () => {
-      if (animationFrameRef.current) {
-        cancelAnimationFrame(animationFrameRef.current)
-      }
-      video.removeEventListener('play', handlePlay)
-      video.removeEventListener('pause', handlePause)
-      video.removeEventListener('seeked', handleSeeked)
-      video.removeEventListener('timeupdate', drawPose)
+      stopWatching()
+      resizeObserver.disconnect()
+      video.removeEventListener('loadedmetadata', updateCanvasSize)
     }
-  }, [videoRef, poseData, currentFrame, showSkeleton, showKeypoints, skeletonColor, keypointColor, lineWidth, keypointRadius, isVisible])
+  }, [videoRef, poseData, showSkeleton, showKeypoints, skeletonColor, keypointColor, lineWidth, keypointRadius, isVisible])
 
   if (!poseData || poseData.length === 0) {
     return null
@@ -43,7 +43,6 @@ export function VideoPlayerContainer({
   const [internalIsPlaying, setInternalIsPlaying] = useState(false)
   const [currentTime, setCurrentTime] = useState(0)
   const [duration, setDuration] = useState(0)
-  const [currentFrameIndex, setCurrentFrameIndex] = useState(0)
   const [isFullscreen, setIsFullscreen] = useState(false)
   const containerRef = useRef<HTMLDivElement>(null)
   const [canvasStyle, setCanvasStyle] = useState<React.CSSProperties>({})
@@ -146,14 +145,6 @@ export function VideoPlayerContainer({
     const handleTimeUpdate = () => {
       setCurrentTime(video.currentTime)
       onTimeUpdate?.(video.currentTime, video.duration)
-
-      if (poseData && poseData.length > 0) {
-          const frame = Math.min(
-              Math.floor((video.currentTime / video.duration) * poseData.length),
-              poseData.length - 1
-          )
-          setCurrentFrameIndex(frame)
-      }
     }
 
     const handlePlay = () => {
@@ -189,7 +180,7 @@ export function VideoPlayerContainer({
       video.removeEventListener('pause', handlePause)
       video.removeEventListener('ended', handleEnded)
     }
-  }, [poseData, onTimeUpdate, onPlaybackStatusChange])
+  }, [onTimeUpdate, onPlaybackStatusChange])
 
   const togglePlayPause = () => {
     if (videoRef.current) {
@@ -271,7 +262,7 @@ export function VideoPlayerContainer({
             <div style={canvasStyle} className="z-10 pointer-events-none">
                 <OverlayCanvas
                     poseData={poseData}
-                    currentFrame={currentFrameIndex}
+                    videoRef={videoRef}
                     showOverlay={showOverlay}
                     className="w-full h-full"
                 />
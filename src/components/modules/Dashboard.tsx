@@ -19,6 +19,7 @@ import { Progress } from '@/components/ui/progress'
 import { Sparkline, TrendIndicator } from '@/components/Sparkline'
 import { QuickActionsFab } from '@/components/QuickActionsFab'
 import { motion } from 'framer-motion'
+import { findEntry } from '@/lib/streaks'
 
 interface DashboardProps {
   onNavigate: (module: Module) => void
@@ -61,7 +62,7 @@ const calculateHabitStats = (habits: Habit[] | null, today: string) => {
   let longestStreak = 0
 
   allHabits.forEach(habit => {
-    const todayEntry = habit.entries?.find(e => e.date === today)
+    const todayEntry = findEntry(habit.entries, today)
     if (todayEntry) {
       if (habit.trackingType === 'boolean' && todayEntry.completed) {
         completedToday++
@@ -87,7 +88,7 @@ const calculateHabitStats = (habits: Habit[] | null, today: string) => {
     const dateStr = date.toISOString().split('T')[0]
     let completedOnDate = 0
     allHabits.forEach(habit => {
-      const entry = habit.entries?.find(e => e.date === dateStr)
+      const entry = findEntry(habit.entries, dateStr)
       if (entry) {
         if (habit.trackingType === 'boolean' && entry.completed) {
           completedOnDate++
@@ -12,6 +12,7 @@ import { Input } from '@/components/ui/input'
 import { Confetti } from '@/components/Confetti'
 import { IconPicker } from '@/components/IconPicker'
 import { EditHabitDialog } from '@/components/EditHabitDialog'
+import { applyHabitDay, findEntry, findEntryIndex, isEntryComplete } from '@/lib/streaks'
 
 const trackingTypeOptions = [
   { value: 'boolean' as TrackingType, icon: Check, label: 'Simple Checkbox', description: 'Just mark it done' },
@@ -94,7 +95,7 @@ export function Habits() {
         if (habit.id !== habitId) return habit
 
         const entries = [...(habit.entries || [])]
-        const todayIndex = entries.findIndex(e => e.date === today)
+        const todayIndex = findEntryIndex(entries, today)
         
         const currentValue = todayIndex > -1 
           ? (habit.trackingType === 'numerical' ? (entries[todayIndex].value || 0) : (entries[todayIndex].minutes || 0))
@@ -117,7 +118,8 @@ export function Habits() {
           entries.push(newEntry)
         }
 
-        const newStreak = calculateStreak(entries, habit)
+        const updatedHabit = applyHabitDay(habit, entries, today, today)
+        const newStreak = updatedHabit.streak
         
         if (isNowComplete && !wasAlreadyComplete) {
           setShowConfetti(true)
@@ -133,7 +135,7 @@ export function Habits() {
           }
         }
 
-        return { ...habit, entries, streak: newStreak }
+        return updatedHabit
       })
       return updated
     })
@@ -147,7 +149,7 @@ export function Habits() {
         if (habit.id !== habitId) return habit
 
         const entries = [...(habit.entries || [])]
-        const todayIndex = entries.findIndex(e => e.date === today)
+        const todayIndex = findEntryIndex(entries, today)
         
         if (todayIndex === -1) return habit
         
@@ -170,9 +172,7 @@ export function Habits() {
           entries[todayIndex] = newEntry
         }
 
-        const newStreak = calculateStreak(entries, habit)
-
-        return { ...habit, entries, streak: newStreak }
+        return applyHabitDay(habit, entries, today, today)
       })
       return updated
     })
@@ -186,17 +186,21 @@ export function Habits() {
         if (habit.id !== habitId || habit.trackingType !== 'boolean') return habit
 
         const entries = [...(habit.entries || [])]
-        const todayIndex = entries.findIndex(e => e.date === today)
+        const todayIndex = findEntryIndex(entries, today)
 
         if (todayIndex > -1) {
           entries.splice(todayIndex, 1)
         } else {
           entries.push({ date: today, completed: true })
-          
+        }
+
+        const updatedHabit = applyHabitDay(habit, entries, today, today)
+
+        if (todayIndex === -1) {
           setShowConfetti(true)
           setTimeout(() => setShowConfetti(false), 4000)
           
-          const newStreak = calculateStreak([...entries, { date: today, completed: true }], habit)
+          const newStreak = updatedHabit.streak
           
           setAnimatingStreak(habitId)
           setTimeout(() => setAnimatingStreak(null), 600)
@@ -208,47 +212,12 @@ export function Habits() {
           }
         }
 
-        const newStreak = calculateStreak(entries, habit)
-
-        return { ...habit, entries, streak: newStreak }
+        return updatedHabit
       })
       return updated
     })
   }
 
-  const calculateStreak = (entries: HabitEntry[], habit: Habit): number => {
-    if (entries.length === 0) return 0
-
-    const sortedEntries = [...entries].sort((a, b) => 
-      new Date(b.date).getTime() - new Date(a.date).getTime()
-    )
-
-    let streak = 0
-    let checkDate = new Date()
-    
-    for (const entry of sortedEntries) {
-      const entryDate = new Date(entry.date)
-      const daysDiff = Math.floor((checkDate.getTime() - entryDate.getTime()) / (1000 * 60 * 60 * 24))
-      
-      if (daysDiff > streak + 1) break
-
-      const isComplete = habit.trackingType === 'boolean' 
-        ? entry.completed 
-        : habit.trackingType === 'numerical'
-        ? (entry.value || 0) >= (habit.target || 0)
-        : (entry.minutes || 0) >= (habit.target || 0)
-
-      if (isComplete) {
-        streak++
-        checkDate = entryDate
-      } else {
-        break
-      }
-    }
-
-    return streak
-  }
-
   const deleteHabit = (habitId: string) => {
     setHabits((current) => current ? current.filter(h => h.id !== habitId) : [])
     toast.success('Habit removed')
@@ -264,21 +233,12 @@ export function Habits() {
   }
 
   const getTodayEntry = (habit: Habit): HabitEntry | undefined => {
-    return habit.entries?.find(e => e.date === today)
+    return findEntry(habit.entries, today)
   }
 
   const isCompletedToday = (habit: Habit): boolean => {
     const todayEntry = getTodayEntry(habit)
-    if (!todayEntry) return false
-
-    if (habit.trackingType === 'boolean') {
-      return todayEntry.completed === true
-    } else if (habit.trackingType === 'numerical') {
-      return (todayEntry.value || 0) >= (habit.target || 0)
-    } else if (habit.trackingType === 'time') {
-      return (todayEntry.minutes || 0) >= (habit.target || 0)
-    }
-    return false
+    return todayEntry ? isEntryComplete(todayEntry, habit) : false
   }
 
   const getIconComponent = (iconName: HabitIcon, habitName?: string) => {
@@ -1,4 +1,4 @@
-import { useState, useMemo } from 'react'
+import { useState, useMemo, useEffect } from 'react'
 import { Command, CommandEmpty, CommandGroup, CommandInput, CommandItem, CommandList } from '@/components/ui/command'
 import { Badge } from '@/components/ui/badge'
 import { getMasterExercises } from '@/lib/master-exercises'
@@ -7,6 +7,7 @@ import { Check, Plus } from 'lucide-react'
 import { Button } from '@/components/ui/button'
 import { ScrollArea } from '@/components/ui/scroll-area'
 import { Dialog, DialogContent, DialogHeader, DialogTitle } from '@/components/ui/dialog'
+import { signalReady } from '@/lib/readiness'
 
 interface ExercisePickerProps {
   open: boolean
@@ -17,6 +18,17 @@ interface ExercisePickerProps {
 export function ExercisePicker({ open, onOpenChange, onSelect }: ExercisePickerProps) {
   const allExercises = useMemo(() => getMasterExercises(), [])
   const [selectedCategory, setSelectedCategory] = useState<string | null>(null)
+  const [search, setSearch] = useState('')
+
+  // Start each picker session with an empty query, as the uncontrolled input did
+  useEffect(() => {
+    if (!open) setSearch('')
+  }, [open])
+
+  // cmdk filters synchronously, so once this effect runs the list reflects `search`
+  useEffect(() => {
+    if (open) signalReady('search-settled', search)
+  }, [open, search, selectedCategory])
 
   // Extract unique categories
   const categories = useMemo(() => {
@@ -60,7 +72,7 @@ export function ExercisePicker({ open, onOpenChange, onSelect }: ExercisePickerP
 
         <Command className="bg-transparent">
           <div className="p-2">
-            <CommandInput placeholder="Search exercises..." className="h-9" />
+            <CommandInput placeholder="Search exercises..." className="h-9" value={search} onValueChange={setSearch} />
           </div>
 
           <div className="flex gap-1.5 px-3 pb-2 overflow-x-auto no-scrollbar mask-fade-right">
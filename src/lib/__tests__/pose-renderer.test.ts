@@ -0,0 +1,76 @@
+import { describe, it, expect, jest, afterEach } from '@jest/globals'
+import { poseFrameAt, watchVideoFrames } from '../golf/pose-renderer'
+
+describe('poseFrameAt', () => {
+  it('spreads the pose frames over the video duration', () => {
+    expect(poseFrameAt(0, 10, 2400)).toBe(0)
+    expect(poseFrameAt(5, 10, 2400)).toBe(1200)
+    expect(poseFrameAt(10, 10, 2400)).toBe(2399)
+    expect(poseFrameAt(12, 10, 2400)).toBe(2399)
+  })
+
+  it('has no frame until the duration is known', () => {
+    expect(poseFrameAt(0, NaN, 10)).toBe(-1)
+    expect(poseFrameAt(0, Infinity, 10)).toBe(-1)
+    expect(poseFrameAt(0, 0, 10)).toBe(-1)
+    expect(poseFrameAt(1, 10, 0)).toBe(-1)
+  })
+})
+
+describe('watchVideoFrames', () => {
+  afterEach(() => {
+    jest.restoreAllMocks()
+  })
+
+  it('calls back once per presented frame with its media time', () => {
+    const pending = new Map<number, (now: number, metadata: { mediaTime: number }) => void>()
+    let nextHandle = 0
+    const video = {
+      requestVideoFrameCallback: (callback: (now: number, metadata: { mediaTime: number }) => void) => {
+        pending.set(++nextHandle, callback)
+        return nextHandle
+      },
+      cancelVideoFrameCallback: (handle: number) => pending.delete(handle),
+    }
+    const present = (mediaTime: number) => {
+      const callbacks = [...pending.values()]
+      pending.clear()
+      callbacks.forEach(callback => callback(0, { mediaTime }))
+    }
+
+    const frames: number[] = []
+    const stop = watchVideoFrames(video as unknown as HTMLVideoElement, time => frames.push(time))
+    present(0.033)
+    present(0.067)
+    expect(frames).toEqual([0.033, 0.067])
+    expect(pending.size).toBe(1)
+
+    stop()
+    present(0.1)
+    expect(frames).toEqual([0.033, 0.067])
+    expect(pending.size).toBe(0)
+  })
+
+  it('falls back to animation frames and skips frames where the time did not move', () => {
+    const pending: FrameRequestCallback[] = []
+    jest.spyOn(window, 'requestAnimationFrame').mockImplementation(callback => pending.push(callback))
+    jest.spyOn(window, 'cancelAnimationFrame').mockImplementation(() => pending.splice(0))
+    const tick = () => pending.splice(0).forEach(callback => callback(0))
+
+    const video = { currentTime: 0 } as HTMLVideoElement
+    const frames: number[] = []
+    const stop = watchVideoFrames(video, time => frames.push(time))
+
+    tick()
+    tick()
+    video.currentTime = 0.5
+    tick()
+    tick()
+    expect(frames).toEqual([0, 0.5])
+
+    stop()
+    video.currentTime = 1
+    tick()
+    expect(frames).toEqual([0, 0.5])
+  })
+})
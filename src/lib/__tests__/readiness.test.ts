@@ -0,0 +1,45 @@
+import { describe, it, expect, beforeEach, jest } from '@jest/globals'
+import { READINESS_EVENT, signalReady, whenAnimationIdle } from '../readiness'
+
+describe('readiness signals', () => {
+  beforeEach(() => {
+    delete window.__readiness
+    document.body.innerHTML = '<main id="main-content"><div id="box"></div></main>'
+  })
+
+  it('counts emissions per signal and keeps the latest detail', () => {
+    signalReady('module-mounted', 'dashboard')
+    signalReady('module-mounted', 'workouts')
+    signalReady('app-ready')
+
+    expect(window.__readiness?.['module-mounted']).toMatchObject({ count: 2, detail: 'workouts' })
+    expect(window.__readiness?.['app-ready']).toMatchObject({ count: 1, detail: null })
+  })
+
+  it('dispatches a DOM event for each emission', () => {
+    const listener = jest.fn()
+    window.addEventListener(READINESS_EVENT, listener as EventListener)
+
+    signalReady('search-settled', 'press')
+
+    expect(listener).toHaveBeenCalledTimes(1)
+    const event = listener.mock.calls[0][0] as CustomEvent
+    expect(event.detail).toMatchObject({ signal: 'search-settled', detail: 'press', count: 1 })
+    window.removeEventListener(READINESS_EVENT, listener as EventListener)
+  })
+
+  it('resolves animation idle once styles stop changing', async () => {
+    const box = document.getElementById('box')!
+    let writes = 0
+    const animate = () => {
+      box.style.opacity = String(writes / 10)
+      if (++writes < 5) requestAnimationFrame(animate)
+    }
+    requestAnimationFrame(animate)
+
+    await whenAnimationIdle('#main-content')
+
+    expect(writes).toBe(5)
+    expect(window.__readiness?.['animation-idle']).toMatchObject({ count: 1, detail: '#main-content' })
+  })
+})
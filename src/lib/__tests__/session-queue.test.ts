@@ -0,0 +1,61 @@
+import { describe, it, expect } from '@jest/globals'
+import { generateSessionQueue, WorkStep } from '../workout/session-queue'
+import { Exercise, WorkoutSession } from '@/types/workout'
+
+const exercise = (name: string, overrides: Partial<Exercise> = {}): Exercise => ({
+  id: name,
+  name,
+  type: 'strength',
+  sets: 2,
+  reps: 10,
+  restSeconds: 30,
+  ...overrides,
+})
+
+const session = (blocks: WorkoutSession['blocks']): WorkoutSession => ({
+  id: 's1',
+  title: 'Test',
+  description: '',
+  totalDurationMin: 30,
+  difficulty: 'intermediate',
+  blocks,
+})
+
+describe('generateSessionQueue', () => {
+  it('expands strength blocks by set and supersets by round', () => {
+    const queue = generateSessionQueue(session([
+      { id: 'b0', type: 'strength', rounds: 1, exercises: [exercise('Squat')] },
+      {
+        id: 'b1',
+        type: 'superset',
+        rounds: 2,
+        exercises: [exercise('Curl', { restSeconds: 0 }), exercise('Plank', { durationSeconds: 45 })],
+      },
+    ]))
+
+    expect(queue.map(step => step.id)).toEqual([
+      'work-b0-ex0-s1', 'rest-b0-ex0-s1',
+      'work-b0-ex0-s2', 'rest-b0-ex0-s2',
+      'work-b1-r1-ex0', 'work-b1-r1-ex1', 'rest-b1-r1-end',
+      'work-b1-r2-ex0', 'work-b1-r2-ex1',
+    ])
+    expect((queue[5] as WorkStep).target).toEqual({ type: 'time', value: 45, weight: 0 })
+  })
+
+  it('points every step at the next work step', () => {
+    const queue = generateSessionQueue(session([
+      { id: 'b0', type: 'strength', rounds: 1, exercises: [exercise('Squat', { sets: 1 }), exercise('Row', { sets: 1, reps: 8 })] },
+    ]))
+
+    expect(queue.map(step => step.nextUp?.name)).toEqual(['Row', 'Row', 'Complete'])
+    expect(queue[1].nextUp).toEqual({ name: 'Row', type: 'reps', value: 8 })
+  })
+
+  it('handles sessions with thousands of sets', () => {
+    const exercises = Array.from({ length: 2000 }, (_, i) => exercise(`Move ${i}`, { sets: 5 }))
+    const queue = generateSessionQueue(session([{ id: 'b0', type: 'strength', rounds: 1, exercises }]))
+
+    expect(queue).toHaveLength(2000 * 5 * 2 - 1)
+    expect(queue[queue.length - 2].nextUp?.name).toBe('Move 1999')
+  })
+})
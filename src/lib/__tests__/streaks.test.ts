@@ -0,0 +1,155 @@
+import { describe, it, expect } from '@jest/globals'
+import { StreakLedger, applyHabitDay, dayNumber, habitLedger, habitStreak } from '../streaks'
+import { Habit } from '../types'
+
+const day = (n: number) => new Date(Date.UTC(2025, 0, 1 + n)).toISOString().slice(0, 10)
+
+// Straightforward reference: walk back day by day.
+function bruteForce(days: Set<number>, today: number) {
+  let longest = 0
+  for (const d of days) {
+    if (days.has(d - 1)) continue
+    let end = d
+    while (days.has(end + 1)) end++
+    longest = Math.max(longest, end - d + 1)
+  }
+  let last = days.has(today) ? today : today - 1
+  let current = 0
+  while (days.has(last)) {
+    current++
+    last--
+  }
+  return { longest, current }
+}
+
+const habit = (overrides: Partial<Habit> = {}): Habit => ({
+  id: 'h1',
+  name: 'Read',
+  trackingType: 'boolean',
+  streak: 0,
+  entries: [],
+  ...overrides,
+})
+
+describe('StreakLedger', () => {
+  it('joins runs when a gap day is completed', () => {
+    const ledger = new StreakLedger([day(0), day(1), day(3), day(4), day(5)])
+    expect(ledger.longest).toBe(3)
+    expect(ledger.runEndingOn(day(1))).toBe(2)
+
+    ledger.add(day(2))
+    expect(ledger.longest).toBe(6)
+    expect(ledger.runEndingOn(day(5))).toBe(6)
+    expect(ledger.runEndingOn(day(3))).toBe(4)
+    expect(ledger.size).toBe(6)
+  })
+
+  it('counts the current streak through yesterday while today is open', () => {
+    const ledger = new StreakLedger([day(8), day(9)])
+    expect(ledger.current(day(10))).toBe(2)
+    expect(ledger.current(day(11))).toBe(0)
+
+    ledger.add(day(10))
+    expect(ledger.current(day(10))).toBe(3)
+  })
+
+  it('splits a run and shrinks the longest streak on delete', () => {
+    const ledger = new StreakLedger([day(0), day(1), day(2), day(3), day(4), day(10)])
+    ledger.delete(day(2))
+    expect(ledger.longest).toBe(2)
+    expect(ledger.runEndingOn(day(4))).toBe(2)
+    expect(ledger.runEndingOn(day(1))).toBe(2)
+
+    ledger.delete(day(4))
+    ledger.delete(day(3))
+    expect(ledger.longest).toBe(2)
+    expect(ledger.has(day(3))).toBe(false)
+  })
+
+  it('matches a brute-force count over random edits', () => {
+    let seed = 7
+    const random = () => {
+      seed = (seed * 1103515245 + 12345) % 2147483648
+      return seed / 2147483648
+    }
+    const ledger = new StreakLedger()
+    const days = new Set<number>()
+    const today = 60
+
+    for (let i = 0; i < 2000; i++) {
+      const n = Math.floor(random() * 61)
+      if (random() < 0.65) {
+        ledger.add(day(n))
+        days.add(dayNumber(day(n)))
+      } else {
+        ledger.delete(day(n))
+        days.delete(dayNumber(day(n)))
+      }
+      const expected = bruteForce(days, dayNumber(day(today)))
+      expect(ledger.longest).toBe(expected.longest)
+      expect(ledger.current(day(today))).toBe(expected.current)
+    }
+  })
+})
+
+describe('applyHabitDay', () => {
+  it('extends yesterday\'s run when today is completed and undoes it', () => {
+    const read = habit({ entries: [0, 1, 2].map(n => ({ date: day(n), completed: true })) })
+
+    const done = applyHabitDay(read, [...read.entries!, { date: day(3), completed: true }], day(3), day(3))
+    expect(done.streak).toBe(4)
+    expect(habitLedger(done).has(day(3))).toBe(true)
+
+    const undone = applyHabitDay(done, done.entries!.slice(0, 3), day(3), day(3))
+    expect(undone.streak).toBe(3)
+    expect(habitLedger(undone).has(day(3))).toBe(false)
+  })
+
+  it('ends the streak while today\'s entry is short of the target', () => {
+    const pushups = habit({ trackingType: 'numerical', target: 20, entries: [{ date: day(0), value: 25 }] })
+    expect(habitStreak(pushups, day(1))).toBe(1)
+
+    const partial = applyHabitDay(pushups, [...pushups.entries!, { date: day(1), value: 10 }], day(1), day(1))
+    expect(partial.streak).toBe(0)
+
+    const entries = [...partial.entries!]
+    entries[1] = { date: day(1), value: 20 }
+    expect(applyHabitDay(partial, entries, day(1), day(1)).streak).toBe(2)
+  })
+
+  it('breaks the streak at a day with no entry', () => {
+    // The old sort-and-scan count gave 2 here: it skipped gaps shorter than the streak.
+    const read = habit({ id: 'h3', entries: [0, 2].map(n => ({ date: day(n), completed: true })) })
+    expect(habitStreak(read, day(3))).toBe(1)
+
+    const done = applyHabitDay(read, [...read.entries!, { date: day(3), completed: true }], day(3), day(3))
+    expect(done.streak).toBe(2)
+  })
+
+  it('keeps the ledger across a JSON round trip of the habit', () => {
+    const read = habit({ id: 'h2', entries: [0, 1].map(n => ({ date: day(n), completed: true })) })
+    const ledger = habitLedger(read)
+
+    // useKV re-reads what it just wrote, so the next toggle sees new arrays.
+    const stored: Habit = JSON.parse(JSON.stringify(read))
+    const done = applyHabitDay(stored, [...stored.entries!, { date: day(2), completed: true }], day(2), day(2))
+    expect(done.streak).toBe(3)
+    expect(habitLedger(JSON.parse(JSON.stringify(done)))).toBe(ledger)
+
+    // Edited elsewhere (another tab): the count no longer matches, so it is rebuilt.
+    const edited: Habit = { ...done, entries: done.entries!.slice(1) }
+    expect(habitLedger(edited)).not.toBe(ledger)
+    expect(habitLedger(edited).has(day(0))).toBe(false)
+  })
+
+  it('rebuilds the ledger when handed an older copy of the habit', () => {
+    const read = habit({ entries: [{ date: day(0), completed: true }] })
+    habitLedger(read)
+    applyHabitDay(read, [...read.entries!, { date: day(1), completed: true }], day(1), day(1))
+
+    // e.g. a StrictMode re-run of the same state updater
+    const again = applyHabitDay(read, [...read.entries!, { date: day(1), completed: true }], day(1), day(1))
+    expect(again.streak).toBe(2)
+    expect(habitLedger(read).has(day(1))).toBe(false)
+  })
+})
@@ -0,0 +1,69 @@
+import { describe, it, expect, beforeEach, jest } from '@jest/globals'
+import { accountantSync } from '../finance/sync-storage'
+
+// In-memory stand-in for the one object store AccountantSync uses.
+jest.mock('idb', () => {
+  const rows = new Map<string, any>()
+  const store = {
+    put: async (value: any) => {
+      rows.set(value.id, { ...value })
+      return value.id
+    },
+    get: async (id: string) => (rows.has(id) ? { ...rows.get(id) } : undefined),
+    delete: async (id: string) => {
+      rows.delete(id)
+    },
+  }
+  const db = {
+    put: (_store: string, value: any) => store.put(value),
+    get: (_store: string, id: string) => store.get(id),
+    getAllFromIndex: async (_store: string, _index: string, status: string) =>
+      [...rows.values()].filter(row => row.status === status),
+    transaction: jest.fn(() => ({ store, done: Promise.resolve() })),
+  }
+  return { openDB: async () => db, rows, db }
+})
+
+const { rows, db } = jest.requireMock('idb') as { rows: Map<string, any>; db: { transaction: jest.Mock } }
+
+const entries = (count: number) =>
+  Array.from({ length: count }, (_, i) => ({ amount: i + 1, categoryName: 'Food', description: `Lunch ${i}` }))
+
+describe('AccountantSync batching', () => {
+  beforeEach(() => {
+    rows.clear()
+    db.transaction.mockClear()
+  })
+
+  it('queues a batch in one transaction', async () => {
+    const queued = await accountantSync.queueTransactions(entries(500))
+
+    expect(db.transaction).toHaveBeenCalledTimes(1)
+    expect(queued).toHaveLength(500)
+    expect(new Set(queued.map(tx => tx.id)).size).toBe(500)
+    expect(queued.every(tx => tx.status === 'pending' && tx.retryCount === 0 && tx.date === queued[0].date)).toBe(true)
+    expect(await accountantSync.getPendingTransactions()).toHaveLength(500)
+  })
+
+  it('updates statuses in one transaction and skips unknown ids', async () => {
+    const queued = await accountantSync.queueTransactions(entries(10))
+    db.transaction.mockClear()
+
+    const updated = await accountantSync.updateTransactionStatuses(
+      [...queued.slice(0, 4).map(tx => tx.id), 'missing'],
+      'synced'
+    )
+
+    expect(updated).toBe(4)
+    expect(db.transaction).toHaveBeenCalledTimes(1)
+    expect(await accountantSync.getPendingTransactions()).toHaveLength(6)
+    expect(rows.get(queued[0].id).status).toBe('synced')
+  })
+
+  it('keeps the single-entry API equivalent', async () => {
+    const tx = await accountantSync.queueTransaction(12.5, 'Food', 'Coffee')
+    await accountantSync.updateTransactionStatus(tx.id, 'failed')
+
+    expect(rows.get(tx.id)).toMatchObject({ amount: 12.5, categoryName: 'Food', description: 'Coffee', status: 'failed' })
+  })
+})
@@ -0,0 +1,53 @@
+/**
+ * Dev-only probe for the session queue benchmark
+ * (verification/verify_session_queue.py).
+ *
+ * Mounts `ActiveWorkout` for a plan in a full-screen overlay on its own
+ * root, inside a React Profiler, and reports how long the first commit took.
+ * That includes building the session queue, which ActiveWorkout does in its
+ * state initializer.
+ */
+import { Profiler, type ProfilerOnRenderCallback } from 'react'
+import { createRoot, type Root } from 'react-dom/client'
+import { flushSync } from 'react-dom'
+import { ActiveWorkout } from '@/components/workout/ActiveWorkout'
+import type { WorkoutPlan } from '@/lib/types'
+
+export interface ActiveWorkoutProbe {
+  /** Time from render start to the first commit, in ms. */
+  mountMs: number
+  /** React render time of the first commit, in ms. */
+  renderMs: number
+  unmount(): void
+}
+
+export function mountActiveWorkoutProbe(workout: WorkoutPlan): ActiveWorkoutProbe {
+  const host = document.createElement('div')
+  host.style.cssText = 'position:fixed;inset:0;z-index:2147483647;background:#0b0b12;color:#fff'
+  document.body.appendChild(host)
+  const root: Root = createRoot(host)
+
+  let renderMs = 0
+  const onRender: ProfilerOnRenderCallback = (_id, phase, actualDuration) => {
+    if (phase === 'mount') renderMs = actualDuration
+  }
+
+  const started = performance.now()
+  flushSync(() =>
+    root.render(
+      <Profiler id="active-workout" onRender={onRender}>
+        <ActiveWorkout workout={workout} onFinish={() => {}} />
+      </Profiler>
+    )
+  )
+  const mountMs = performance.now() - started
+
+  return {
+    mountMs,
+    renderMs,
+    unmount() {
+      root.unmount()
+      host.remove()
+    },
+  }
+}
@@ -0,0 +1,54 @@
+/**
+ * Dev-only probe for the pose overlay benchmark
+ * (verification/verify_pose_overlay.py).
+ *
+ * Mounts `PoseOverlay` over a muted, looping `<video>` of `videoUrl` in a
+ * full-screen overlay on its own root, with `poseData` passed straight in,
+ * so pose tracks too large for localStorage can be played back. The
+ * benchmark drives the returned video and watches the overlay canvas.
+ */
+import { createRef } from 'react'
+import { createRoot, type Root } from 'react-dom/client'
+import { flushSync } from 'react-dom'
+import { PoseOverlay } from '@/components/PoseOverlay'
+import type { SwingPoseData } from '@/lib/types'
+
+export interface PoseOverlayProbe {
+  video: HTMLVideoElement
+  /** The overlay's canvas. */
+  canvas: HTMLCanvasElement
+  unmount(): void
+}
+
+export function mountPoseOverlayProbe(videoUrl: string, poseData: SwingPoseData[]): PoseOverlayProbe {
+  const host = document.createElement('div')
+  host.style.cssText = 'position:fixed;inset:0;z-index:2147483647;background:#000'
+  document.body.appendChild(host)
+  const root: Root = createRoot(host)
+
+  const videoRef = createRef<HTMLVideoElement>()
+  const Probe = () => (
+    <div className="relative w-full h-full">
+      <video
+        ref={videoRef}
+        src={videoUrl}
+        className="w-full h-full object-contain"
+        playsInline
+        muted
+        loop
+      />
+      <PoseOverlay videoRef={videoRef} poseData={poseData} />
+    </div>
+  )
+
+  flushSync(() => root.render(<Probe />))
+
+  return {
+    video: videoRef.current!,
+    canvas: host.querySelector('canvas')!,
+    unmount() {
+      root.unmount()
+      host.remove()
+    },
+  }
+}
@@ -0,0 +1,59 @@
+/**
+ * Dev-only probe for the useKV data-volume benchmark
+ * (verification/verify_kv_scaling.py).
+ *
+ * Mounts a hidden component on a separate root that subscribes to one key,
+ * then times the hook's mount (localStorage read + JSON.parse) and its
+ * setter (JSON.stringify, setItem and the sync events that make every other
+ * `useKV` instance for the key re-read).
+ */
+import { createRoot, type Root } from 'react-dom/client'
+import { flushSync } from 'react-dom'
+import { useKV } from '@/hooks/use-kv'
+
+type Setter = (value: unknown[] | ((prev: unknown[]) => unknown[])) => void
+
+export interface KVProbe {
+  /** Time from render start to the probe's commit, in ms. */
+  mountMs: number
+  /** Apply `update` through the hook; returns the synchronous cost and the time to the next frame. */
+  set(update: (prev: unknown[]) => unknown[]): Promise<{ syncMs: number; frameMs: number }>
+  unmount(): void
+}
+
+const EMPTY: unknown[] = []
+
+function Probe({ storageKey, onSetter }: { storageKey: string; onSetter: (set: Setter) => void }) {
+  const [, setValue] = useKV<unknown[]>(storageKey, EMPTY)
+  onSetter(setValue)
+  return null
+}
+
+const nextFrame = () => new Promise<void>(resolve => requestAnimationFrame(() => setTimeout(resolve, 0)))
+
+export function mountKVProbe(storageKey: string): KVProbe {
+  const host = document.createElement('div')
+  host.hidden = true
+  document.body.appendChild(host)
+  const root: Root = createRoot(host)
+  let setter: Setter | null = null
+
+  const started = performance.now()
+  flushSync(() => root.render(<Probe storageKey={storageKey} onSetter={set => { setter = set }} />))
+  const mountMs = performance.now() - started
+
+  return {
+    mountMs,
+    async set(update) {
+      const t0 = performance.now()
+      flushSync(() => setter?.(update))
+      const syncMs = performance.now() - t0
+      await nextFrame()
+      return { syncMs, frameMs: performance.now() - t0 }
+    },
+    unmount() {
+      root.unmount()
+      host.remove()
+    },
+  }
+}
@@ -0,0 +1,104 @@
+/**
+ * Dev-only probe for the list scroll benchmark
+ * (verification/verify_list_scroll.py).
+ *
+ * Mounts `VirtualList` (and so `useVirtualScroll`) with `count` generated
+ * rows in a full-screen overlay on its own root, inside a React Profiler.
+ * Every scroll event sets state in the hook; the probe pairs each event with
+ * the commit it causes and records how long that took and how long React
+ * spent rendering.
+ */
+import { Profiler, type ProfilerOnRenderCallback } from 'react'
+import { createRoot, type Root } from 'react-dom/client'
+import { flushSync } from 'react-dom'
+import { VirtualList } from '@/components/VirtualList'
+
+export interface ScrollCommit {
+  /** Scroll event to the commit of the re-render it triggered, in ms. */
+  handlerToCommitMs: number
+  /** React render time of that commit, in ms. */
+  renderMs: number
+}
+
+export interface VirtualListProbe {
+  /** Time from render start to the first commit, in ms. */
+  mountMs: number
+  /** The scrolling element; drive it by setting `scrollTop`. */
+  scroller: HTMLElement
+  /** Rows currently in the DOM. */
+  rows(): number
+  commits: ScrollCommit[]
+  unmount(): void
+}
+
+export interface VirtualListProbeOptions {
+  itemHeight?: number
+  containerHeight?: number
+  overscan?: number
+}
+
+interface Row {
+  id: number
+  title: string
+  done: boolean
+}
+
+const SCROLLER_CLASS = 'bench-virtual-list'
+
+export function mountVirtualListProbe(count: number, options: VirtualListProbeOptions = {}): VirtualListProbe {
+  const { itemHeight = 72, containerHeight = window.innerHeight, overscan = 3 } = options
+  const items: Row[] = Array.from({ length: count }, (_, i) => ({ id: i, title: `Item ${i}`, done: i % 3 === 0 }))
+
+  const host = document.createElement('div')
+  host.style.cssText = 'position:fixed;inset:0;z-index:2147483647;background:#0b0b12;color:#fff'
+  document.body.appendChild(host)
+  const root: Root = createRoot(host)
+
+  const commits: ScrollCommit[] = []
+  let scrolledAt: number | null = null
+  const onRender: ProfilerOnRenderCallback = (_id, phase, actualDuration, _base, _start, commitTime) => {
+    if (phase === 'mount' || scrolledAt === null) return
+    commits.push({ handlerToCommitMs: commitTime - scrolledAt, renderMs: actualDuration })
+    scrolledAt = null
+  }
+
+  const started = performance.now()
+  flushSync(() =>
+    root.render(
+      <Profiler id="virtual-list" onRender={onRender}>
+        <VirtualList
+          items={items}
+          itemHeight={itemHeight}
+          containerHeight={containerHeight}
+          overscan={overscan}
+          className={SCROLLER_CLASS}
+          renderItem={item => (
+            <div data-bench-row className="flex items-center gap-3 px-4 h-full border-b border-white/10">
+              <span className={item.done ? 'opacity-50 line-through' : ''}>{item.title}</span>
+            </div>
+          )}
+        />
+      </Profiler>
+    )
+  )
+  const mountMs = performance.now() - started
+
+  const scroller = host.querySelector<HTMLElement>(`.${SCROLLER_CLASS}`)!
+  // Capture phase runs before React's own listener dispatches to the hook.
+  const onScroll = (e: Event) => {
+    scrolledAt ??= e.timeStamp
+  }
+  scroller.addEventListener('scroll', onScroll, { capture: true })
+
+  return {
+    mountMs,
+    scroller,
+    rows: () => host.querySelectorAll('[data-bench-row]').length,
+    commits,
+    unmount() {
+      scroller.removeEventListener('scroll', onScroll, { capture: true })
+      root.unmount()
+      host.remove()
+    },
+  }
+}
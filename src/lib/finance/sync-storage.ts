@@ -19,9 +19,21 @@ interface FinanceDB extends DBSchema {
   };
 }
 
+type TransactionInput = Pick<QueuedTransaction, 'amount' | 'categoryName' | 'description'>;
+
 const DB_NAME = 'finance-v3-db';
 const STORE_NAME = 'transaction_queue';
 
+function newTransaction(entry: TransactionInput, date: string): QueuedTransaction {
+  return {
+    id: uuidv4(),
+    ...entry,
+    date,
+    status: 'pending',
+    retryCount: 0,
+  };
+}
+
 class AccountantSync {
   private dbPromise: Promise<IDBPDatabase<FinanceDB>>;
 
@@ -42,21 +54,29 @@ class AccountantSync {
     categoryName: string,
     description: string
   ): Promise<QueuedTransaction> {
-    const tx: QueuedTransaction = {
-      id: uuidv4(),
-      amount,
-      categoryName,
-      description,
-      date: new Date().toISOString(),
-      status: 'pending',
-      retryCount: 0,
-    };
+    const tx = newTransaction({ amount, categoryName, description }, new Date().toISOString());
 
     const db = await this.dbPromise;
     await db.put(STORE_NAME, tx);
     return tx;
   }
 
+  /**
+   * Queues many transactions in a single IDB transaction instead of one per entry.
+   */
+  async queueTransactions(entries: TransactionInput[]): Promise<QueuedTransaction[]> {
+    const date = new Date().toISOString();
+    const queued = entries.map((entry) => newTransaction(entry, date));
+
+    const db = await this.dbPromise;
+    const tx = db.transaction(STORE_NAME, 'readwrite');
+    await Promise.all([
+      ...queued.map((item) => tx.store.put(item)),
+      tx.done
+    ]);
+    return queued;
+  }
+
   /**
    * Retrieves all pending transactions.
    */
@@ -77,6 +97,28 @@ class AccountantSync {
     }
   }
 
+  /**
+   * Updates the status of many transactions in a single IDB transaction.
+   * Unknown ids are skipped; returns how many were updated.
+   */
+  async updateTransactionStatuses(ids: string[], status: 'synced' | 'failed'): Promise<number> {
+    const db = await this.dbPromise;
+    const tx = db.transaction(STORE_NAME, 'readwrite');
+    let updated = 0;
+    await Promise.all([
+      ...ids.map(async (id) => {
+        const item = await tx.store.get(id);
+        if (item) {
+          item.status = status;
+          await tx.store.put(item);
+          updated++;
+        }
+      }),
+      tx.done
+    ]);
+    return updated;
+  }
+
   /**
    * Clears synced transactions to keep the DB clean.
    */
@@ -101,4 +143,4 @@ class AccountantSync {
 }
 
 export const accountantSync = new AccountantSync();
-export type { QueuedTransaction };
+export type { QueuedTransaction, TransactionInput };
@@ -0,0 +1,148 @@
+/**
+ * Drawing pose overlays in step with a playing video.
+ *
+ * `watchVideoFrames` calls back once per video frame the browser presents
+ * (requestVideoFrameCallback), including the frame shown after a seek while
+ * paused. Browsers without it get an animation-frame loop that only calls
+ * back when currentTime has moved. Either way an overlay draws at most once
+ * per video frame, instead of on every animation frame plus every
+ * timeupdate.
+ *
+ * The rest are the static parts of a draw, cached so a frame only has to
+ * place them: canvas sizing happens on resize rather than per draw, joint
+ * markers are pre-rendered sprites (glow and rings included), and bones
+ * that share a style go out as one path and one stroke.
+ */
+import type { SwingLandmark } from '../types'
+
+/** Landmarks below this visibility are not drawn. */
+export const MIN_VISIBILITY = 0.5
+
+export type Bone = readonly [number, number]
+
+interface VideoFrameMetadata {
+  mediaTime: number
+}
+
+type FrameCallbackVideo = HTMLVideoElement & {
+  requestVideoFrameCallback(callback: (now: number, metadata: VideoFrameMetadata) => void): number
+  cancelVideoFrameCallback(handle: number): void
+}
+
+/** Index into `count` pose frames spread over `duration` seconds for `time`; -1 while the duration is unknown. */
+export function poseFrameAt(time: number, duration: number, count: number): number {
+  if (!count || !duration || !Number.isFinite(duration) || Number.isNaN(time)) return -1
+  return Math.max(0, Math.min(Math.floor((time / duration) * count), count - 1))
+}
+
+/**
+ * Calls `onFrame` with the media time of each frame `video` presents.
+ * Returns a function that stops watching.
+ */
+export function watchVideoFrames(video: HTMLVideoElement, onFrame: (mediaTime: number) => void): () => void {
+  let stopped = false
+
+  if ('requestVideoFrameCallback' in video) {
+    const frames = video as FrameCallbackVideo
+    const tick = (_now: number, metadata: VideoFrameMetadata) => {
+      if (stopped) return
+      handle = frames.requestVideoFrameCallback(tick)
+      onFrame(metadata.mediaTime)
+    }
+    let handle = frames.requestVideoFrameCallback(tick)
+    return () => {
+      stopped = true
+      frames.cancelVideoFrameCallback(handle)
+    }
+  }
+
+  let last = NaN
+  const poll = () => {
+    if (stopped) return
+    handle = requestAnimationFrame(poll)
+    if (video.currentTime !== last) {
+      last = video.currentTime
+      onFrame(last)
+    }
+  }
+  let handle = requestAnimationFrame(poll)
+  return () => {
+    stopped = true
+    cancelAnimationFrame(handle)
+  }
+}
+
+/**
+ * Sizes `canvas` to `width` x `height` CSS pixels at the device pixel ratio,
+ * with `ctx` scaled so drawing uses CSS pixels. No-op when nothing changed.
+ */
+export function fitCanvas(canvas: HTMLCanvasElement, ctx: CanvasRenderingContext2D, width: number, height: number): void {
+  const dpr = window.devicePixelRatio || 1
+  const backingWidth = Math.round(width * dpr)
+  const backingHeight = Math.round(height * dpr)
+  if (canvas.width === backingWidth && canvas.height === backingHeight) return
+  canvas.width = backingWidth
+  canvas.height = backingHeight
+  canvas.style.width = `${width}px`
+  canvas.style.height = `${height}px`
+  ctx.setTransform(dpr, 0, 0, dpr, 0, 0)
+}
+
+/** Clears a canvas sized by `fitCanvas`. */
+export function clearCanvas(canvas: HTMLCanvasElement, ctx: CanvasRenderingContext2D): void {
+  ctx.save()
+  ctx.setTransform(1, 0, 0, 1, 0, 0)
+  ctx.clearRect(0, 0, canvas.width, canvas.height)
+  ctx.restore()
+}
+
+/**
+ * Strokes every bone whose ends are both visible as a single path, in the
+ * context's current stroke style. `width`/`height` map normalised landmarks
+ * to canvas pixels.
+ */
+export function strokeBones(
+  ctx: CanvasRenderingContext2D,
+  landmarks: SwingLandmark[],
+  bones: readonly Bone[],
+  width: number,
+  height: number
+): void {
+  ctx.beginPath()
+  for (const [from, to] of bones) {
+    const a = landmarks[from]
+    const b = landmarks[to]
+    if (!a || !b || a.visibility <= MIN_VISIBILITY || b.visibility <= MIN_VISIBILITY) continue
+    ctx.moveTo(a.x * width, a.y * height)
+    ctx.lineTo(b.x * width, b.y * height)
+  }
+  ctx.stroke()
+}
+
+const sprites = new Map<string, HTMLCanvasElement>()
+
+/**
+ * A `size` x `size` (CSS pixels) canvas painted once by `paint`, centred on
+ * (0, 0), at the current device pixel ratio. Cached under `key`.
+ */
+export function sprite(key: string, size: number, paint: (ctx: CanvasRenderingContext2D) => void): HTMLCanvasElement {
+  const dpr = window.devicePixelRatio || 1
+  const cacheKey = `${key}@${dpr}`
+  let canvas = sprites.get(cacheKey)
+  if (!canvas) {
+    canvas = document.createElement('canvas')
+    canvas.width = canvas.height = Math.ceil(size * dpr)
+    const ctx = canvas.getContext('2d')
+    if (ctx) {
+      ctx.setTransform(dpr, 0, 0, dpr, canvas.width / 2, canvas.height / 2)
+      paint(ctx)
+    }
+    sprites.set(cacheKey, canvas)
+  }
+  return canvas
+}
+
+/** Draws a `sprite` of `size` CSS pixels centred on (`x`, `y`). */
+export function drawSprite(ctx: CanvasRenderingContext2D, image: HTMLCanvasElement, size: number, x: number, y: number): void {
+  ctx.drawImage(image, x - size / 2, y - size / 2, size, size)
+}
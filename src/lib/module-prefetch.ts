@@ -0,0 +1,163 @@
+/**
+ * Chunk loaders for the lazy app modules, and optional prefetching.
+ *
+ * App.tsx builds its `lazy()` components from `moduleLoaders`, so a module
+ * that was prefetched here is already evaluated when the user taps it and
+ * only has to render. The mode is read from localStorage
+ * (`module-prefetch`):
+ *
+ * - `off` (default): chunks load on first tap.
+ * - `idle`: once a module has mounted, every other module is loaded one at
+ *   a time in idle callbacks.
+ * - `predictive`: only the modules most often opened next from the current
+ *   one are loaded (transition counts are learned in this mode and kept in
+ *   `module-transitions`), falling back to the FloatingDock neighbours
+ *   while there is no history.
+ *
+ * Each load is bracketed by `module-load:<id>:start|end` performance marks,
+ * and each prefetch emits the `module-prefetched` readiness signal.
+ */
+import { Module } from '@/lib/types'
+import { signalReady } from '@/lib/readiness'
+
+export type PrefetchMode = 'off' | 'idle' | 'predictive'
+
+export const PREFETCH_MODE_KEY = 'module-prefetch'
+const TRANSITIONS_KEY = 'module-transitions'
+/** How many likely-next modules predictive mode loads. */
+const PREDICTIONS = 2
+
+// FloatingDock order; predictive mode falls back to the neighbours of the active module.
+const DOCK_ORDER: Module[] = [
+  'dashboard', 'habits', 'finance', 'tasks', 'workouts', 'knox',
+  'shopping', 'calendar', 'golf', 'connections', 'settings',
+]
+
+const importers = {
+  dashboard: () => import('@/components/modules/Dashboard'),
+  habits: () => import('@/components/modules/Habits'),
+  finance: () => import('@/components/modules/Finance'),
+  tasks: () => import('@/components/modules/Tasks'),
+  workouts: () => import('@/components/modules/Workouts'),
+  knox: () => import('@/components/modules/Knox'),
+  shopping: () => import('@/components/modules/Shopping'),
+  calendar: () => import('@/components/modules/Calendar'),
+  golf: () => import('@/components/modules/GolfSwing'),
+  connections: () => import('@/components/modules/Connections'),
+  settings: () => import('@/components/modules/Settings'),
+}
+
+type Importers = typeof importers
+type LoadableModule = keyof Importers
+
+const pending = new Map<LoadableModule, Promise<unknown>>()
+
+function load<K extends LoadableModule>(id: K): ReturnType<Importers[K]> {
+  let promise = pending.get(id)
+  if (!promise) {
+    performance.mark(`module-load:${id}:start`)
+    promise = importers[id]().then(
+      module => {
+        performance.mark(`module-load:${id}:end`)
+        return module
+      },
+      error => {
+        // Let the next attempt (a tap, or Suspense retrying) fetch again.
+        pending.delete(id)
+        throw error
+      }
+    )
+    pending.set(id, promise)
+  }
+  return promise as ReturnType<Importers[K]>
+}
+
+/** One memoized loader per module; pass these to `lazy()`. */
+export const moduleLoaders = Object.fromEntries(
+  (Object.keys(importers) as LoadableModule[]).map(id => [id, () => load(id)])
+) as { [K in LoadableModule]: () => ReturnType<Importers[K]> }
+
+function isLoadable(id: string): id is LoadableModule {
+  return id in importers
+}
+
+export function getPrefetchMode(): PrefetchMode {
+  try {
+    const mode = localStorage.getItem(PREFETCH_MODE_KEY)
+    return mode === 'idle' || mode === 'predictive' ? mode : 'off'
+  } catch {
+    return 'off'
+  }
+}
+
+type Transitions = Partial<Record<Module, Partial<Record<Module, number>>>>
+
+function readTransitions(): Transitions {
+  try {
+    return JSON.parse(localStorage.getItem(TRANSITIONS_KEY) ?? '{}')
+  } catch {
+    return {}
+  }
+}
+
+function recordTransition(from: Module, to: Module) {
+  const transitions = readTransitions()
+  const counts = (transitions[from] ??= {})
+  counts[to] = (counts[to] ?? 0) + 1
+  try {
+    localStorage.setItem(TRANSITIONS_KEY, JSON.stringify(transitions))
+  } catch {
+    // Quota exceeded: predictions just stop learning.
+  }
+}
+
+function predictNext(from: Module): Module[] {
+  const counts = readTransitions()[from] ?? {}
+  const seen = (Object.entries(counts) as [Module, number][])
+    .sort((a, b) => b[1] - a[1])
+    .map(([id]) => id)
+  const index = DOCK_ORDER.indexOf(from)
+  const neighbours = [DOCK_ORDER[index + 1], DOCK_ORDER[index - 1]].filter(Boolean)
+  return [...new Set([...seen, ...neighbours])].filter(id => id !== from).slice(0, PREDICTIONS)
+}
+
+const whenIdle = (callback: () => void) =>
+  'requestIdleCallback' in window ? window.requestIdleCallback(callback) : window.setTimeout(callback, 200)
+
+let previous: Module | null = null
+let queue: LoadableModule[] = []
+let draining = false
+
+function drain() {
+  const id = queue.shift()
+  if (!id) {
+    draining = false
+    return
+  }
+  const alreadyLoaded = pending.has(id)
+  load(id)
+    .then(() => {
+      if (!alreadyLoaded) signalReady('module-prefetched', id)
+    })
+    .catch(() => {})
+    .finally(() => whenIdle(drain))
+}
+
+/**
+ * Called once `active` has mounted. Depending on the mode, queues other
+ * modules to load while the main thread is idle (and, in predictive mode,
+ * records the transition that led here).
+ */
+export function prefetchAfterMount(active: Module) {
+  const mode = getPrefetchMode()
+  if (mode === 'predictive' && previous && previous !== active) recordTransition(previous, active)
+  previous = active
+  if (mode === 'off') return
+
+  const targets = mode === 'idle' ? DOCK_ORDER : predictNext(active)
+  queue = targets.filter((id): id is LoadableModule => id !== active && isLoadable(id) && !pending.has(id))
+  if (!draining && queue.length) {
+    draining = true
+    whenIdle(drain)
+  }
+}
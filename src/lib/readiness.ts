@@ -0,0 +1,97 @@
+/**
+ * Readiness signals for automation.
+ *
+ * Components announce when a state the verification harness cares about has
+ * actually been committed (app shell mounted, module rendered, search list
+ * filtered). The harness waits on these instead of sleeping for a guessed
+ * duration. Signals are cheap bookkeeping on `window.__readiness` plus a DOM
+ * event, so they are always on.
+ */
+
+export type ReadinessSignal =
+  | 'app-ready'
+  | 'module-mounted'
+  | 'module-prefetched'
+  | 'search-settled'
+  | 'animation-idle'
+
+export interface ReadinessEntry {
+  /** Monotonic per-signal counter; the harness waits for it to advance. */
+  count: number
+  /** Detail of the most recent emission (e.g. the module id). */
+  detail: string | null
+  /** performance.now() of the most recent emission. */
+  at: number
+}
+
+export type ReadinessState = Partial<Record<ReadinessSignal, ReadinessEntry>>
+
+export const READINESS_EVENT = 'app-readiness'
+
+declare global {
+  interface Window {
+    __readiness?: ReadinessState
+    __whenAnimationIdle?: (selector?: string, quietFrames?: number) => Promise<void>
+  }
+}
+
+export function signalReady(signal: ReadinessSignal, detail: string | null = null): void {
+  if (typeof window === 'undefined') return
+
+  const state = (window.__readiness ??= {})
+  const entry: ReadinessEntry = {
+    count: (state[signal]?.count ?? 0) + 1,
+    detail,
+    at: performance.now(),
+  }
+  state[signal] = entry
+
+  window.dispatchEvent(new CustomEvent(READINESS_EVENT, { detail: { signal, ...entry } }))
+}
+
+/**
+ * Resolves once nothing under `selector` is animating: no running finite
+ * Web Animations / CSS transitions and no inline-style writes (framer-motion's
+ * JS-driven animations) for `quietFrames` consecutive frames.
+ */
+export function whenAnimationIdle(selector = '#main-content', quietFrames = 2): Promise<void> {
+  return new Promise(resolve => {
+    const root = document.querySelector(selector) ?? document.body
+    let dirty = false
+    let quiet = 0
+
+    const observer = new MutationObserver(() => {
+      dirty = true
+    })
+    observer.observe(root, { attributes: true, attributeFilter: ['style', 'class'], subtree: true })
+
+    const isAnimating = () =>
+      (document.getAnimations?.() ?? []).some(animation => {
+        const target = (animation.effect as KeyframeEffect | null)?.target
+        const iterations = animation.effect?.getTiming().iterations
+        return (
+          animation.playState === 'running' &&
+          iterations !== Infinity &&
+          (!target || root.contains(target))
+        )
+      })
+
+    const tick = () => {
+      if (observer.takeRecords().length) dirty = true
+      quiet = dirty || isAnimating() ? 0 : quiet + 1
+      dirty = false
+      if (quiet >= quietFrames) {
+        observer.disconnect()
+        signalReady('animation-idle', selector)
+        resolve()
+        return
+      }
+      requestAnimationFrame(tick)
+    }
+    requestAnimationFrame(tick)
+  })
+}
+
+if (typeof window !== 'undefined') {
+  window.__whenAnimationIdle = whenAnimationIdle
+}
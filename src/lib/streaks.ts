@@ -0,0 +1,253 @@
+/**
+ * Streaks over completed days, kept up to date incrementally.
+ *
+ * A `StreakLedger` stores completed days ('YYYY-MM-DD', UTC like
+ * getTodayKey) as runs of consecutive days, indexed by both ends. Completing
+ * a day joins it to the runs on either side, and un-completing the first or
+ * last day of a run shortens it, both in O(1). The current streak is the
+ * run ending today (or yesterday, while today is still open). Building a
+ * ledger from a history is O(n), with no sorting and no Date per entry.
+ *
+ * Each habit keeps one ledger, cached by habit id (`habitLedger`).
+ * `applyHabitDay` applies a one-day change to it, instead of re-reading
+ * years of history on every toggle. The cache is keyed by id rather than by
+ * entries array because useKV re-parses its JSON after every write, so the
+ * habit coming back from state is never the array the ledger was built for.
+ */
+import type { Habit, HabitEntry } from './types'
+import { getTodayKey } from './utils'
+
+const DAY_MS = 24 * 60 * 60 * 1000
+
+/** Days since 1970-01-01 for a 'YYYY-MM-DD' key (or an ISO timestamp's date). */
+export function dayNumber(key: string): number {
+  return Date.UTC(+key.slice(0, 4), +key.slice(5, 7) - 1, +key.slice(8, 10)) / DAY_MS
+}
+
+export class StreakLedger {
+  private days = new Set<number>()
+  /** Run end -> run start. */
+  private starts = new Map<number, number>()
+  /** Run start -> run end. */
+  private ends = new Map<number, number>()
+  /** Run length -> how many runs have it. */
+  private lengths = new Map<number, number>()
+  private longestRun = 0
+
+  constructor(days: Iterable<string> = []) {
+    for (const day of days) this.add(day)
+  }
+
+  /** Number of completed days. */
+  get size(): number {
+    return this.days.size
+  }
+
+  /** Longest run of consecutive completed days. */
+  get longest(): number {
+    return this.longestRun
+  }
+
+  has(day: string): boolean {
+    return this.days.has(dayNumber(day))
+  }
+
+  /** Marks `day` completed. O(1). */
+  add(day: string): void {
+    const n = dayNumber(day)
+    if (this.days.has(n)) return
+    this.days.add(n)
+
+    let start = n
+    let end = n
+    const before = this.starts.get(n - 1)
+    if (before !== undefined) {
+      start = before
+      this.dropRun(before, n - 1, false)
+    }
+    const after = this.ends.get(n + 1)
+    if (after !== undefined) {
+      end = after
+      this.dropRun(n + 1, after, false)
+    }
+    this.addRun(start, end)
+  }
+
+  /** Un-marks `day`. O(1) at either end of a run, O(run length) inside one. */
+  delete(day: string): void {
+    const n = dayNumber(day)
+    if (!this.days.has(n)) return
+    const start = this.runStart(n)
+    const end = this.ends.get(start)!
+    this.days.delete(n)
+    this.dropRun(start, end)
+    if (start < n) this.addRun(start, n - 1)
+    if (n < end) this.addRun(n + 1, end)
+  }
+
+  /** Length of the run of completed days ending on `day`; 0 if `day` is not completed. */
+  runEndingOn(day: string): number {
+    const n = dayNumber(day)
+    return this.days.has(n) ? n - this.runStart(n) + 1 : 0
+  }
+
+  /** Consecutive completed days up to `today`, or up to yesterday while today is not completed. */
+  current(today: string = getTodayKey()): number {
+    const n = dayNumber(today)
+    const last = this.days.has(n) ? n : n - 1
+    return this.days.has(last) ? last - this.runStart(last) + 1 : 0
+  }
+
+  private runStart(n: number): number {
+    const start = this.starts.get(n)
+    if (start !== undefined) return start
+    // Inside a run (later days are completed too): walk back to its start.
+    let day = n
+    while (!this.ends.has(day)) day--
+    return day
+  }
+
+  private addRun(start: number, end: number) {
+    this.starts.set(end, start)
+    this.ends.set(start, end)
+    const length = end - start + 1
+    this.lengths.set(length, (this.lengths.get(length) ?? 0) + 1)
+    if (length > this.longestRun) this.longestRun = length
+  }
+
+  /** `rescan` is off when merging: the merged run is at least as long as any it replaces. */
+  private dropRun(start: number, end: number, rescan = true) {
+    this.starts.delete(end)
+    this.ends.delete(start)
+    const length = end - start + 1
+    const left = this.lengths.get(length)! - 1
+    if (left) {
+      this.lengths.set(length, left)
+    } else {
+      this.lengths.delete(length)
+      if (rescan && length === this.longestRun) this.longestRun = Math.max(0, ...this.lengths.keys())
+    }
+  }
+}
+
+// --- Habits ---
+
+/** Whether `entry` meets `habit`'s daily goal. */
+export function isEntryComplete(entry: HabitEntry, habit: Habit): boolean {
+  if (habit.trackingType === 'boolean') return entry.completed === true
+  if (habit.trackingType === 'numerical') return (entry.value || 0) >= (habit.target || 0)
+  if (habit.trackingType === 'time') return (entry.minutes || 0) >= (habit.target || 0)
+  return false
+}
+
+/**
+ * Index of the entry for `date`, or -1. Searches from the end, where the
+ * app appends new days, so today's entry is found in O(1).
+ */
+export function findEntryIndex(entries: HabitEntry[] | undefined, date: string): number {
+  if (!entries) return -1
+  for (let i = entries.length - 1; i >= 0; i--) {
+    if (entries[i].date === date) return i
+  }
+  return -1
+}
+
+export function findEntry(entries: HabitEntry[] | undefined, date: string): HabitEntry | undefined {
+  const index = findEntryIndex(entries, date)
+  return index > -1 ? entries![index] : undefined
+}
+
+interface CachedLedger {
+  ledger: StreakLedger
+  // What completion was judged against; editing the goal rebuilds the ledger.
+  trackingType: Habit['trackingType']
+  target: Habit['target']
+  // Which entries it holds. The app only ever changes today's entry, which
+  // is the last one, so its count and last entry tell a stale ledger apart.
+  count: number
+  last: string
+}
+
+const ledgers = new Map<string, CachedLedger>()
+
+function entryKey(entry: HabitEntry | undefined): string {
+  return entry ? `${entry.date}|${entry.completed}|${entry.value}|${entry.minutes}` : ''
+}
+
+function buildLedger(habit: Habit): StreakLedger {
+  const ledger = new StreakLedger()
+  for (const entry of habit.entries ?? []) {
+    if (isEntryComplete(entry, habit)) ledger.add(entry.date)
+  }
+  return ledger
+}
+
+function cache(habit: Habit, entries: HabitEntry[], ledger: StreakLedger) {
+  ledgers.set(habit.id, {
+    ledger,
+    trackingType: habit.trackingType,
+    target: habit.target,
+    count: entries.length,
+    last: entryKey(entries[entries.length - 1]),
+  })
+}
+
+function cachedLedger(habit: Habit): StreakLedger | undefined {
+  const cached = ledgers.get(habit.id)
+  const entries = habit.entries ?? []
+  if (
+    cached &&
+    cached.trackingType === habit.trackingType &&
+    cached.target === habit.target &&
+    cached.count === entries.length &&
+    cached.last === entryKey(entries[entries.length - 1])
+  ) {
+    return cached.ledger
+  }
+  return undefined
+}
+
+/** The ledger of `habit`'s completed days (read-only); built once per habit and kept up to date by `applyHabitDay`. */
+export function habitLedger(habit: Habit): StreakLedger {
+  let ledger = cachedLedger(habit)
+  if (!ledger) {
+    ledger = buildLedger(habit)
+    cache(habit, habit.entries ?? [], ledger)
+  }
+  return ledger
+}
+
+/**
+ * `habit`'s current streak: consecutive completed days up to today, or up
+ * to yesterday while today has no entry yet. An entry for today that misses
+ * the goal (a numerical habit part-way there) ends the streak at 0.
+ *
+ * A day with no entry breaks the streak. The count Habits used before this
+ * module let such gaps through as long as each was no longer than the
+ * streak so far, so completions on D-1 and D-3 counted 2 there and count 1
+ * here. It never counts more than that code did.
+ */
+export function habitStreak(habit: Habit, today: string = getTodayKey()): number {
+  const entry = findEntry(habit.entries, today)
+  if (entry && !isEntryComplete(entry, habit)) return 0
+  return habitLedger(habit).current(today)
+}
+
+/**
+ * `habit` with `entries`, a copy of its entries in which only `day` changed,
+ * and its streak brought up to date. The habit's cached ledger takes the
+ * change in O(1); a stale one (e.g. a StrictMode re-run of the same state
+ * updater) is rebuilt first.
+ */
+export function applyHabitDay(habit: Habit, entries: HabitEntry[], day: string, today: string = getTodayKey()): Habit {
+  const ledger = cachedLedger(habit) ?? buildLedger(habit)
+  const entry = findEntry(entries, day)
+  if (entry && isEntryComplete(entry, habit)) {
+    ledger.add(day)
+  } else {
+    ledger.delete(day)
+  }
+  cache(habit, entries, ledger)
+  const updated = { ...habit, entries }
+  return { ...updated, streak: habitStreak(updated, today) }
+}
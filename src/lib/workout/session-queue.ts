@@ -140,8 +140,12 @@ export function generateSessionQueue(session: WorkoutSession): SessionStep[] {
   }
 
   // 2. Populate 'nextUp'
-  for (let i = 0; i < queue.length - 1; i++) {
-    const nextWorkStep = queue.slice(i + 1).find(s => s.type === 'work') as WorkStep | undefined;
+  // Walk backwards, carrying the nearest following work step, so long
+  // sessions stay linear instead of searching ahead from every step.
+  let nextWorkStep: WorkStep | undefined;
+  for (let i = queue.length - 2; i >= 0; i--) {
+    const following = queue[i + 1];
+    if (following.type === 'work') nextWorkStep = following;
 
     if (nextWorkStep) {
       queue[i].nextUp = {
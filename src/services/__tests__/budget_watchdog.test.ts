@@ -0,0 +1,102 @@
+import { describe, it, expect, beforeEach, afterEach, jest } from '@jest/globals'
+import { BudgetWatchdog, InterventionEventDetail } from '../accountant/BudgetWatchdog'
+
+const audit = (liquidAssets: number) => ({
+  version: '2.0',
+  status: 'completed',
+  monthlyIncome: 5000,
+  liquidAssets,
+  categories: [
+    {
+      id: 'c1',
+      name: 'Food',
+      subcategories: [
+        { id: 's1', name: 'Groceries', amount: 80, dateAdded: '2025-03-02T10:00:00.000Z' },
+        // Last month: counts towards the runway, not towards this month's variance.
+        { id: 's2', name: 'Dining', amount: 500, dateAdded: '2025-02-20T10:00:00.000Z' },
+      ],
+    },
+  ],
+  flags: [],
+  resolutions: [],
+  lastUpdated: '2025-03-01T00:00:00.000Z',
+})
+
+const report = {
+  version: '2.0',
+  executiveSummary: '',
+  spendingAnalysis: [],
+  proposedBudget: [{ categoryId: 'c1', categoryName: 'Food', allocatedAmount: 100, subcategories: [] }],
+  moneyManagementAdvice: [],
+  reportGeneratedAt: '2025-03-01T00:00:00.000Z',
+}
+
+const store = (liquidAssets: number) => {
+  localStorage.setItem('finance-audit-v2', JSON.stringify(audit(liquidAssets)))
+  localStorage.setItem('finance-report-v2', JSON.stringify(report))
+}
+
+describe('BudgetWatchdog', () => {
+  let alerts: InterventionEventDetail[]
+  const onIntervention = (e: Event) => alerts.push((e as CustomEvent<InterventionEventDetail>).detail)
+
+  beforeEach(() => {
+    jest.useFakeTimers()
+    jest.setSystemTime(new Date('2025-03-05T12:00:00.000Z'))
+    localStorage.clear()
+    alerts = []
+    window.addEventListener('finance-intervention', onIntervention)
+    BudgetWatchdog.configure({ incremental: true })
+    BudgetWatchdog.stats.checks = 0
+    BudgetWatchdog.stats.parses = 0
+  })
+
+  afterEach(() => {
+    window.removeEventListener('finance-intervention', onIntervention)
+    jest.useRealTimers()
+  })
+
+  it('reuses the parsed data until the stored blobs change', async () => {
+    store(1_000_000)
+    await BudgetWatchdog.runChecks()
+    await BudgetWatchdog.runChecks()
+    await BudgetWatchdog.runChecks()
+    expect(BudgetWatchdog.stats).toEqual({ checks: 3, parses: 1 })
+
+    store(2_000_000)
+    await BudgetWatchdog.runChecks()
+    expect(BudgetWatchdog.stats).toEqual({ checks: 4, parses: 2 })
+  })
+
+  it('re-parses on every check when incremental mode is off', async () => {
+    BudgetWatchdog.configure({ incremental: false })
+    store(1_000_000)
+    await BudgetWatchdog.runChecks()
+    await BudgetWatchdog.runChecks()
+    expect(BudgetWatchdog.stats).toEqual({ checks: 2, parses: 2 })
+  })
+
+  it.each([true, false])('raises the same runway alert once per cooldown (incremental: %s)', async incremental => {
+    BudgetWatchdog.configure({ incremental })
+    // 580 spent in the last 30 days against 100 in the bank: about 5 days of runway.
+    store(100)
+    await BudgetWatchdog.runChecks()
+    await BudgetWatchdog.runChecks()
+
+    expect(alerts).toHaveLength(2)
+    expect(alerts[0]).toMatchObject({ type: 'Runway' })
+    expect(alerts[0].message).toContain('5 days of liquidity')
+    // Runway is cooling down on the second check, so variance gets its turn; then both are quiet.
+    expect(alerts[1]).toMatchObject({ type: 'Variance' })
+    await BudgetWatchdog.runChecks()
+    expect(alerts).toHaveLength(2)
+  })
+
+  it('counts only this month towards the variance alert', async () => {
+    store(1_000_000)
+    await BudgetWatchdog.runChecks()
+
+    expect(alerts).toHaveLength(1)
+    expect(alerts[0].message).toBe('Variance Alert: You have spent 80% of your Food budget in the first 5 days.')
+  })
+})
@@ -1,7 +1,7 @@
 import { FinancialAudit, FinancialReport } from '@/types/financial_report'; // Wait, types might be mixed. Let's check imports carefully.
 import { FinancialAudit } from '@/types/accountant';
 import { FinancialReport } from '@/types/financial_report';
-import { differenceInDays, parseISO, isSameMonth } from 'date-fns';
+import { differenceInDays, parseISO, startOfMonth, endOfMonth } from 'date-fns';
 
 export type InterventionType = 'Runway' | 'Variance';
 
@@ -11,11 +11,46 @@ export interface InterventionEventDetail {
     data?: any;
 }
 
+export interface WatchdogOptions {
+    /**
+     * Reuse the parsed audit/report while the stored strings are unchanged,
+     * instead of re-parsing both blobs (and every dateAdded) on each check.
+     */
+    incremental: boolean;
+}
+
+export interface WatchdogStats {
+    checks: number;
+    parses: number;
+}
+
+/** A dated spend entry with its timestamp already parsed. */
+interface Spend {
+    time: number;
+    amount: number;
+}
+
+interface Snapshot {
+    auditStr: string;
+    reportStr: string;
+    audit: FinancialAudit;
+    report: FinancialReport;
+    /** Dated spend per audit category, in `audit.categories` order. */
+    spend: Spend[][];
+    /** First audit category index per name (checkVariance matches by name). */
+    categoryIndex: Map<string, number>;
+}
+
 const COOLDOWN_HOURS = 24;
 const CHECK_INTERVAL_MS = 15 * 60 * 1000; // 15 Minutes
 
 class BudgetWatchdogService {
     private intervalId: NodeJS.Timeout | null = null;
+    private options: WatchdogOptions = { incremental: true };
+    private snapshot: Snapshot | null = null;
+
+    /** Check and parse counters, for benchmarks and tests. */
+    public readonly stats: WatchdogStats = { checks: 0, parses: 0 };
 
     constructor() {
         // Bind methods
@@ -50,8 +85,16 @@ class BudgetWatchdogService {
         }
     }
 
-    private async runChecks() {
+    public configure(options: Partial<WatchdogOptions>) {
+        this.options = { ...this.options, ...options };
+        this.snapshot = null;
+    }
+
+    /** One pass over both conditions; runs on start and every CHECK_INTERVAL_MS. */
+    public async runChecks() {
         try {
+            this.stats.checks++;
+
             // 1. Load Data
             // We use direct localStorage access because we are in a service, not a React component hook.
             const auditStr = localStorage.getItem('finance-audit-v2');
@@ -59,12 +102,11 @@ class BudgetWatchdogService {
 
             if (!auditStr || !reportStr) return;
 
-            const audit: FinancialAudit = JSON.parse(auditStr);
-            const report: FinancialReport = JSON.parse(reportStr);
+            const snapshot = this.load(auditStr, reportStr);
 
             // 2. Check Runway (Condition A)
             if (!this.isCoolingDown('Runway')) {
-                const runwayAlert = this.checkRunway(audit);
+                const runwayAlert = this.checkRunway(snapshot);
                 if (runwayAlert) {
                     this.dispatchIntervention('Runway', runwayAlert);
                     return; // Prioritize Runway over Variance
@@ -73,7 +115,7 @@ class BudgetWatchdogService {
 
             // 3. Check Variance (Condition B)
             if (!this.isCoolingDown('Variance')) {
-                const varianceAlert = this.checkVariance(audit, report);
+                const varianceAlert = this.checkVariance(snapshot);
                 if (varianceAlert) {
                     this.dispatchIntervention('Variance', varianceAlert);
                 }
@@ -84,11 +126,42 @@ class BudgetWatchdogService {
         }
     }
 
+    /**
+     * Parse the stored blobs and pre-parse every dated spend entry.
+     * In incremental mode the result is reused until either string changes.
+     */
+    private load(auditStr: string, reportStr: string): Snapshot {
+        const cached = this.snapshot;
+        if (cached && cached.auditStr === auditStr && cached.reportStr === reportStr) {
+            return cached;
+        }
+
+        this.stats.parses++;
+        const audit: FinancialAudit = JSON.parse(auditStr);
+        const report: FinancialReport = JSON.parse(reportStr);
+
+        const categoryIndex = new Map<string, number>();
+        const spend = audit.categories.map((cat, index) => {
+            if (!categoryIndex.has(cat.name)) categoryIndex.set(cat.name, index);
+            const entries: Spend[] = [];
+            cat.subcategories.forEach(sub => {
+                if (sub.dateAdded && sub.amount) {
+                    entries.push({ time: parseISO(sub.dateAdded).getTime(), amount: sub.amount });
+                }
+            });
+            return entries;
+        });
+
+        const snapshot = { auditStr, reportStr, audit, report, spend, categoryIndex };
+        this.snapshot = this.options.incremental ? snapshot : null;
+        return snapshot;
+    }
+
     /**
      * Condition A: Runway Risk
      * Rolling 30-Day Runway < 30 Days
      */
-    private checkRunway(audit: FinancialAudit): string | null {
+    private checkRunway({ audit, spend }: Snapshot): string | null {
         const liquidAssets = audit.liquidAssets || 0;
         if (liquidAssets <= 0) return "Critical: Liquid assets are depleted.";
 
@@ -97,16 +170,15 @@ class BudgetWatchdogService {
         const now = new Date();
         const thirtyDaysAgo = new Date();
         thirtyDaysAgo.setDate(thirtyDaysAgo.getDate() - 30);
+        const from = thirtyDaysAgo.getTime();
+        const to = now.getTime();
 
         let totalSpentLast30Days = 0;
 
-        audit.categories.forEach(cat => {
-            cat.subcategories.forEach(sub => {
-                if (sub.dateAdded && sub.amount) {
-                    const date = parseISO(sub.dateAdded);
-                    if (date >= thirtyDaysAgo && date <= now) {
-                        totalSpentLast30Days += sub.amount;
-                    }
+        spend.forEach(entries => {
+            entries.forEach(({ time, amount }) => {
+                if (time >= from && time <= to) {
+                    totalSpentLast30Days += amount;
                 }
             });
         });
@@ -129,13 +201,16 @@ class BudgetWatchdogService {
      * Condition B: High Variance
      * Major category spend > 50% in first 7 days
      */
-    private checkVariance(audit: FinancialAudit, report: FinancialReport): string | null {
+    private checkVariance({ report, spend, categoryIndex }: Snapshot): string | null {
         const now = new Date();
         const currentDay = now.getDate(); // 1-31
 
         // Only check within the first 7 days
         if (currentDay > 7) return null;
 
+        const monthStart = startOfMonth(now).getTime();
+        const monthEnd = endOfMonth(now).getTime();
+
         // Iterate through categories in the PROPOSED BUDGET (source of truth for limits)
         for (const budgetCat of report.proposedBudget) {
             const budgetLimit = budgetCat.allocatedAmount;
@@ -146,17 +221,14 @@ class BudgetWatchdogService {
             // Ideally use ID if possible. V2/V3 report usually has categoryId.
 
             // Find corresponding category in Audit (Actuals)
-            const auditCat = audit.categories.find(c => c.name === budgetCat.categoryName); // Fallback to name match or ID
-            if (!auditCat) continue;
+            const auditIndex = categoryIndex.get(budgetCat.categoryName); // Fallback to name match or ID
+            if (auditIndex === undefined) continue;
 
             let currentMonthSpend = 0;
 
-            auditCat.subcategories.forEach(sub => {
-                if (sub.dateAdded && sub.amount) {
-                    const date = parseISO(sub.dateAdded);
-                    if (isSameMonth(date, now)) {
-                        currentMonthSpend += sub.amount;
-                    }
+            spend[auditIndex].forEach(({ time, amount }) => {
+                if (time >= monthStart && time <= monthEnd) {
+                    currentMonthSpend += amount;
                 }
             });
 
@@ -0,0 +1,52 @@
+"""Shared harness for the verify_* Playwright scripts.
+
+Scripts register their entry point with ``@scenario`` and keep a standalone
+``__main__`` via ``run_standalone``. ``python verification/run.py`` discovers
+every registered scenario and runs them in parallel on a warm browser pool.
+"""
+
+from . import datasets, fixtures  # noqa: F401  (register the shared fixtures)
+from .clock import advance_clock, skip_loading_screen, use_virtual_clock
+from .config import BASE_URL, IPHONE_16, IPHONE_USER_AGENT
+from .execution import RunOptions, ScenarioResult, record, step
+from .offline import MockLLM, use_offline
+from .profiling import profile
+from .readiness import (
+    expect_signal,
+    fill_search,
+    open_module,
+    wait_for_animation_idle,
+    wait_for_app_ready,
+    wait_for_signal,
+)
+from .registry import Scenario, discover, scenario
+from .runner import run, run_standalone
+from .storage import fixture
+
+__all__ = [
+    "BASE_URL",
+    "IPHONE_16",
+    "IPHONE_USER_AGENT",
+    "MockLLM",
+    "RunOptions",
+    "Scenario",
+    "ScenarioResult",
+    "advance_clock",
+    "discover",
+    "expect_signal",
+    "fill_search",
+    "fixture",
+    "open_module",
+    "profile",
+    "record",
+    "run",
+    "run_standalone",
+    "scenario",
+    "skip_loading_screen",
+    "step",
+    "use_offline",
+    "use_virtual_clock",
+    "wait_for_animation_idle",
+    "wait_for_app_ready",
+    "wait_for_signal",
+]
@@ -0,0 +1,311 @@
+"""Asyncio flavour of the harness.
+
+A scenario written as ``async def verify_x(page)`` gets an async-API page.
+The runner schedules every coroutine scenario on one event loop against one
+browser, each in its own context, with at most ``concurrency`` in flight. So
+storage-state preparation, navigations, waits and screenshots overlap instead
+of queuing behind each other. A scenario can open more tabs with
+``await page.context.new_page()``; tabs in one context share localStorage,
+which is how cross-tab behaviour is exercised.
+
+The helpers here mirror readiness.py, offline.py, clock.py, frames.py and
+profiling.py with the same names and arguments, so a script only changes its
+imports and adds ``await``.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from .clock import LOADING_SCREEN_MS, SEEDED_RANDOM_JS, SETTLE_JS, START
+from .coverage import BINDING as COVERAGE_BINDING
+from .coverage import SCREEN_JS, START_COVERAGE, STOP_COVERAGE, Coverage
+from .devices import throttle_commands
+from .devices import get as get_device
+from .execution import (
+    RunOptions,
+    ScenarioResult,
+    _active,
+    _metrics,
+    _steps,
+    context_kwargs,
+    failure_screenshot_path,
+    make_result,
+)
+from .frames import DEFAULT_REFRESH_HZ, FRAMES_JS, frame_stats
+from .offline import MockLLM, StandIns, stand_ins_for
+from .profiling import DEFAULT_TOP, SAMPLING_INTERVAL_US, scenario_target, step_paths, store
+from .readiness import ANIMATION_IDLE_JS, DEFAULT_TIMEOUT, DOCK, SIGNAL_AFTER_JS, SIGNAL_STATE_JS
+from .registry import Scenario
+from .vitals import BINDING, FLUSH_JS, VITALS_JS, rounded
+
+DEFAULT_CONCURRENCY = 8
+
+
+# --- Readiness (see readiness.py) ---
+
+async def signal_state(page, signal):
+    return await page.evaluate(SIGNAL_STATE_JS, signal)
+
+
+async def signal_count(page, signal) -> int:
+    state = await signal_state(page, signal)
+    return state["count"] if state else 0
+
+
+async def wait_for_signal(page, signal, detail=None, after=0, timeout=DEFAULT_TIMEOUT):
+    await page.wait_for_function(SIGNAL_AFTER_JS, arg=[signal, detail, after], timeout=timeout)
+
+
+@asynccontextmanager
+async def expect_signal(page, signal, detail=None, timeout=DEFAULT_TIMEOUT):
+    before = await signal_count(page, signal)
+    yield
+    await wait_for_signal(page, signal, detail, after=before, timeout=timeout)
+
+
+async def wait_for_app_ready(page, timeout=DEFAULT_TIMEOUT):
+    await wait_for_signal(page, "app-ready", timeout=timeout)
+
+
+async def open_module(page, module, timeout=DEFAULT_TIMEOUT):
+    await wait_for_app_ready(page, timeout)
+    button = page.locator(DOCK).get_by_label(module, exact=True)
+    state = await signal_state(page, "module-mounted")
+    if state and state["detail"] == module:
+        await button.click()
+        return
+    async with expect_signal(page, "module-mounted", module, timeout):
+        await button.click()
+
+
+async def fill_search(page, locator, text, timeout=DEFAULT_TIMEOUT):
+    async with expect_signal(page, "search-settled", text, timeout):
+        await locator.fill(text)
+
+
+async def wait_for_animation_idle(page, selector="#main-content", timeout=DEFAULT_TIMEOUT):
+    async with expect_signal(page, "animation-idle", selector, timeout):
+        await page.evaluate(ANIMATION_IDLE_JS, selector)
+
+
+# --- Stand-ins and vitals (see offline.py / vitals.py) ---
+
+async def use_offline(page, llm: Optional[MockLLM] = None, mediapipe: bool = True) -> StandIns:
+    stand_ins, created = stand_ins_for(page.context, llm, mediapipe)
+    if created:
+        await stand_ins.install_async(page.context)
+    return stand_ins
+
+
+class VitalsCollector:
+    def __init__(self, context):
+        self.segments = []
+        self._context = context
+
+    def _report(self, source, segments):
+        self.segments.extend(segments)
+
+    async def install(self):
+        await self._context.expose_binding(BINDING, self._report)
+        await self._context.add_init_script(VITALS_JS)
+
+    async def finish(self) -> list:
+        for page in self._context.pages:
+            try:
+                self.segments.extend(await page.evaluate(FLUSH_JS))
+            except Exception:
+                pass
+        return [rounded(s) for s in self.segments]
+
+
+# --- Coverage (see coverage.py) ---
+
+class CoverageCollector(Coverage):
+    def __init__(self, page):
+        super().__init__()
+        self._page = page
+        self._cdp = None
+
+    async def install(self):
+        self._cdp = await self._page.context.new_cdp_session(self._page)
+        await self._page.expose_binding(COVERAGE_BINDING, self.set_screen)
+        await self._page.add_init_script(SCREEN_JS)
+        self._cdp.on("Network.requestWillBeSent", self.on_request)
+        self._cdp.on("CSS.styleSheetAdded", self.on_sheet)
+        self._cdp.on("Page.frameStartedLoading", self._on_navigation)
+        for method, params in START_COVERAGE:
+            await self._cdp.send(method, params)
+        self.main_frame = (await self._cdp.send("Page.getFrameTree"))["frameTree"]["frame"]["id"]
+
+    async def _on_navigation(self, event):
+        # Runs as a task: unlike the sync collector it can lose a fast reload's document.
+        if self.is_main_navigation(event):
+            try:
+                await self._take()
+            except Exception:
+                pass
+
+    async def _take(self):
+        self.ingest((await self._cdp.send("Profiler.takePreciseCoverage"))["result"],
+                    (await self._cdp.send("CSS.takeCoverageDelta"))["coverage"])
+
+    async def finish(self) -> list:
+        try:
+            await self._take()
+            for method, params in STOP_COVERAGE:
+                await self._cdp.send(method, params)
+        except Exception:
+            pass
+        return self.rows()
+
+
+# --- Device profiles (see devices.py) ---
+
+async def apply_device(page, profile):
+    if profile is None:
+        return None
+    cdp = await page.context.new_cdp_session(page)
+    for method, params in throttle_commands(profile):
+        await cdp.send(method, params)
+    if profile.network == "offline":
+        async def go_offline(_):
+            await page.context.set_offline(True)
+
+        page.once("load", go_offline)
+    return cdp
+
+
+# --- Virtual time (see clock.py) ---
+
+async def use_virtual_clock(page, start=START, seed: int = 0):
+    await page.context.clock.install(time=start)
+    await page.context.add_init_script(SEEDED_RANDOM_JS % seed)
+
+
+async def advance_clock(page, ms, step_ms=1000):
+    remaining = ms
+    while remaining > 0:
+        step = min(step_ms, remaining)
+        await page.clock.run_for(step)
+        await page.evaluate(SETTLE_JS)
+        remaining -= step
+
+
+async def skip_loading_screen(page):
+    await advance_clock(page, LOADING_SCREEN_MS, step_ms=500)
+    await wait_for_app_ready(page)
+
+
+# --- Frame pacing (see frames.py) ---
+
+async def sample_frames(page, dwell_ms, refresh_hz=DEFAULT_REFRESH_HZ) -> dict:
+    return frame_stats(await page.evaluate(FRAMES_JS, dwell_ms), refresh_hz)
+
+
+# --- Profiling (see profiling.py) ---
+
+@asynccontextmanager
+async def profile(step: str, page=None, trace: bool = True, top: int = DEFAULT_TOP):
+    entry, page, profiles = scenario_target(page)
+    cpu_path, trace_path = step_paths(entry.name, step, profiles)
+
+    browser = page.context.browser
+    if trace and browser is not None:
+        try:
+            await browser.start_tracing(page=page, path=str(trace_path), screenshots=True)
+        except Exception:
+            trace_path = None  # a concurrent scenario holds the browser's trace
+    else:
+        trace_path = None
+
+    cdp = await page.context.new_cdp_session(page)
+    await cdp.send("Profiler.enable")
+    await cdp.send("Profiler.setSamplingInterval", {"interval": SAMPLING_INTERVAL_US})
+    await cdp.send("Profiler.start")
+    try:
+        yield
+    finally:
+        cpu_profile = (await cdp.send("Profiler.stop"))["profile"]
+        await cdp.detach()
+        if trace_path:
+            await browser.stop_tracing()
+        summary = store(profiles, step, cpu_profile, cpu_path, trace_path, top)
+        print(f"[profile] {step}: {summary['busyMs']}ms on the CPU -> {summary['cpuprofile']}")
+
+
+# --- Execution ---
+
+async def execute(entry: Scenario, playwright, browser, options: RunOptions) -> ScenarioResult:
+    """Async counterpart of ``execution.execute``; runs as its own task."""
+    started = time.perf_counter()
+    # Storage states are built (or read from cache) off the loop.
+    kwargs = await asyncio.to_thread(context_kwargs, entry, playwright, options.base_url, options.device)
+    context = await browser.new_context(**kwargs)
+    collector = None
+    if options.vitals:
+        collector = VitalsCollector(context)
+        await collector.install()
+    page = await context.new_page()
+    throttle = await apply_device(page, get_device(options.device))  # noqa: F841  (keeps the CDP session open)
+    coverage = None
+    if options.coverage:
+        coverage = CoverageCollector(page)
+        await coverage.install()
+    if options.offline:
+        await use_offline(page)
+    status, error = "passed", None
+    metrics, vitals, profiles, steps, chunks = {}, [], {}, {}, []
+    token = _metrics.set(metrics)
+    steps_token = _steps.set(steps)
+    active = _active.set((entry, page, profiles))
+    try:
+        await entry.func(page)
+    except Exception as e:
+        status, error = "failed", f"{type(e).__name__}: {e}"
+        try:
+            await page.screenshot(path=failure_screenshot_path(entry))
+        except Exception:
+            pass
+    finally:
+        _metrics.reset(token)
+        _steps.reset(steps_token)
+        _active.reset(active)
+        if collector is not None:
+            vitals = await collector.finish()
+        if coverage is not None:
+            chunks = await coverage.finish()
+        await context.close()
+
+    return make_result(entry, status, error, started, metrics, vitals, profiles, steps, chunks, options.device)
+
+
+async def run_scenarios(scenarios, concurrency=DEFAULT_CONCURRENCY, options: RunOptions = RunOptions(),
+                        on_result=None) -> list:
+    """Run coroutine ``scenarios`` on one browser with at most ``concurrency`` contexts open."""
+    from playwright.async_api import async_playwright
+
+    limit = asyncio.Semaphore(max(1, concurrency))
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(**options.launch_kwargs())
+
+        async def one(entry):
+            async with limit:
+                try:
+                    result = await execute(entry, p, browser, options)
+                except Exception as e:
+                    result = make_result(entry, "failed", f"{type(e).__name__}: {e}", time.perf_counter(), {}, [])
+            if on_result:
+                on_result(result)
+            return result
+
+        try:
+            return await asyncio.gather(*(one(entry) for entry in scenarios))
+        finally:
+            await browser.close()
+
+
+def run(scenarios, concurrency=DEFAULT_CONCURRENCY, options: RunOptions = RunOptions(), on_result=None) -> list:
+    return asyncio.run(run_scenarios(scenarios, concurrency, options, on_result))
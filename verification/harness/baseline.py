@@ -0,0 +1,111 @@
+"""Per-commit baselines of step timings, and the regression gate.
+
+``run.py --repeat 10 --save-baseline`` stores each step's distribution
+(stats.describe) in ``BASELINE_DIR/<commit>.json``, one section per target.
+A later ``run.py --repeat 10`` compares against the newest stored ancestor
+of HEAD (or ``--baseline <rev>``). A step regresses when both of these hold:
+
+* its p50 is more than ``threshold`` percent above the baseline p50;
+* its median confidence interval lies entirely above the baseline's.
+
+So a step has to be slower by a margin that matters and by more than the
+noise of either run.
+"""
+
+import json
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from . import config
+
+BASELINE_DIR = config.VERIFICATION_DIR / ".baselines"
+DEFAULT_THRESHOLD_PCT = 10.0
+# How far back in history to look for a stored ancestor.
+SEARCH_DEPTH = 200
+
+
+def _git(*args) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=config.REPO_ROOT, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+def head() -> tuple[str, bool]:
+    """``(commit, dirty)`` for the working tree."""
+    return _git("rev-parse", "HEAD"), bool(_git("status", "--porcelain", "--untracked-files=no"))
+
+
+def path_for(commit: str):
+    return BASELINE_DIR / f"{commit}.json"
+
+
+def save(target: str, steps: dict) -> Path:
+    commit, dirty = head()
+    path = path_for(commit)
+    data = json.loads(path.read_text()) if path.exists() else {"commit": commit, "targets": {}}
+    data["targets"][target] = {
+        "savedAt": datetime.now().isoformat(timespec="seconds"),
+        "dirty": dirty,
+        "steps": steps,
+    }
+    BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2))
+    return path
+
+
+def load(target: str, rev: Optional[str] = None) -> Optional[dict]:
+    """The stored section for ``target`` at ``rev``, or at the newest stored ancestor of HEAD.
+
+    Returns ``{"commit", "savedAt", "dirty", "steps"}`` or None.
+    """
+    if rev:
+        commits = [_git("rev-parse", rev)]
+    else:
+        commits = _git("rev-list", f"--max-count={SEARCH_DEPTH}", "HEAD").split()
+    for commit in commits:
+        path = path_for(commit)
+        if not path.exists():
+            continue
+        section = json.loads(path.read_text())["targets"].get(target)
+        if section:
+            return {"commit": commit, **section}
+    return None
+
+
+def compare(current: dict, baseline: dict, threshold_pct: float = DEFAULT_THRESHOLD_PCT) -> list:
+    """One row per step in ``current``; ``verdict`` is "regressed", "improved", "ok" or "new"."""
+    rows = []
+    for key, now in current.items():
+        row = {"step": key, "p50": now["p50"], "p95": now["p95"], "p99": now["p99"],
+               "ci": f"{now['ciLow']:.1f}-{now['ciHigh']:.1f}", "n": now["n"]}
+        base = baseline.get(key)
+        if base is None:
+            rows.append({**row, "verdict": "new"})
+            continue
+        delta = 100 * (now["p50"] - base["p50"]) / base["p50"] if base["p50"] else 0.0
+        if delta > threshold_pct and now["ciLow"] > base["ciHigh"]:
+            verdict = "regressed"
+        elif delta < -threshold_pct and now["ciHigh"] < base["ciLow"]:
+            verdict = "improved"
+        else:
+            verdict = "ok"
+        rows.append({**row, "baseP50": base["p50"], "deltaPct": round(delta, 1), "verdict": verdict})
+    return rows
+
+
+def print_steps(rows):
+    from .bench import print_table
+
+    print_table(rows, [
+        ("step", "step", "s"),
+        ("n", "n", "d"),
+        ("p50", "p50 ms", ".1f"),
+        ("ci", "95% CI", "s"),
+        ("p95", "p95 ms", ".1f"),
+        ("p99", "p99 ms", ".1f"),
+        ("baseP50", "base p50", ".1f"),
+        ("deltaPct", "Δ %", "+.1f"),
+        ("verdict", "", "s"),
+    ])
@@ -0,0 +1,68 @@
+"""Helpers shared by the benchmark scenarios."""
+
+import csv
+import os
+import statistics
+from datetime import datetime
+
+from . import config
+
+
+def env_ints(name, default):
+    """Parse a comma-separated list of ints from the environment, e.g. ``LIS_POSE_FRAMES=240,960``."""
+    value = os.environ.get(name)
+    if not value:
+        return tuple(default)
+    return tuple(int(v) for v in value.split(",") if v.strip())
+
+
+def import_app_module(page, path, name):
+    """Import an app source module through the dev server as ``window.__bench[name]``.
+
+    ``path`` is served by Vite (e.g. ``/src/lib/golf/swing-analyzer.ts``), so
+    aliases and dependencies resolve exactly as they do in the app.
+    Only the dev server serves sources; scenarios using this are tagged
+    ``dev-only`` and skipped against the production build (see server.py).
+    """
+    page.evaluate(
+        "async ([path, name]) => { (window.__bench ??= {})[name] = await import(path) }",
+        [path, name],
+    )
+
+
+def summarize(samples):
+    """Median / p95 / min / max of a list of timings."""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {
+        "median": statistics.median(ordered),
+        "p95": p95,
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+
+
+def print_table(rows, columns):
+    """Print ``rows`` (dicts) as an aligned table; ``columns`` is ``[(key, header, fmt)]``."""
+    cells = [[header for _, header, _ in columns]]
+    for row in rows:
+        cells.append([
+            format(row[key], fmt) if row.get(key) is not None else "-"
+            for key, _, fmt in columns
+        ])
+    widths = [max(len(r[i]) for r in cells) for i in range(len(columns))]
+    for r in cells:
+        print("  ".join(c.rjust(w) for c, w in zip(r, widths)))
+
+
+def write_csv(name, rows, columns=None):
+    """Write ``rows`` (dicts) to ``reports/<name>-<time>.csv`` for plotting; returns the path."""
+    columns = columns or list(dict.fromkeys(k for row in rows for k in row))
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = config.REPORTS_DIR / f"{name}-{stamp}.csv"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="") as f:
+        writer = csv.DictWriter(f, columns, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
@@ -0,0 +1,165 @@
+"""Synthetic swing videos rendered in the browser.
+
+``swing_clip(page, seconds)`` draws the seeded skeleton from ``pose.py`` as a
+filled figure on a canvas, records it with MediaRecorder (VP8 WebM) and caches
+the file under ``config.FIXTURE_CACHE_DIR / "clips"``. Recording runs in real
+time, so only the first request for a given clip pays its length.
+
+MediaRecorder leaves the WebM duration unset, so the browser reports
+``duration = Infinity`` and seeking breaks. ``_with_duration`` writes the
+Duration element into the Segment Info before the clip is cached.
+"""
+
+import base64
+import hashlib
+import json
+import struct
+
+from . import config
+from .pose import UNPACK_FRAMES_JS, generate_swing, pack_frames
+
+CLIP_DIR = config.FIXTURE_CACHE_DIR / "clips"
+
+# Bump when the rendering changes so cached clips are re-recorded.
+CLIP_VERSION = 1
+
+RENDER_JS = """
+async ({ packed, unpack, fps, totalFrames, width, height, bitrate }) => {
+  const frames = (0, eval)(unpack)(packed)
+  const canvas = document.createElement('canvas')
+  canvas.width = width
+  canvas.height = height
+  const ctx = canvas.getContext('2d')
+
+  const BONES = [[11, 13], [13, 15], [12, 14], [14, 16], [11, 23], [12, 24],
+                 [23, 25], [25, 27], [24, 26], [26, 28], [27, 31], [28, 32]]
+  const draw = frame => {
+    const p = i => [frame.landmarks[i].x * width, frame.landmarks[i].y * height]
+    ctx.fillStyle = '#3d6b35'
+    ctx.fillRect(0, 0, width, height)
+    ctx.lineCap = 'round'
+    ctx.strokeStyle = '#d9a066'
+    ctx.fillStyle = '#2c3e73'
+    // Torso
+    ctx.beginPath()
+    ;[11, 12, 24, 23].forEach((i, k) => (k ? ctx.lineTo : ctx.moveTo).call(ctx, ...p(i)))
+    ctx.fill()
+    ctx.lineWidth = width * 0.045
+    for (const [a, b] of BONES) {
+      ctx.beginPath()
+      ctx.moveTo(...p(a))
+      ctx.lineTo(...p(b))
+      ctx.stroke()
+    }
+    ctx.fillStyle = '#d9a066'
+    ctx.beginPath()
+    ctx.arc(...p(0), width * 0.055, 0, Math.PI * 2)
+    ctx.fill()
+  }
+
+  const stream = canvas.captureStream(0)
+  const track = stream.getVideoTracks()[0]
+  const recorder = new MediaRecorder(stream, { mimeType: 'video/webm;codecs=vp8', videoBitsPerSecond: bitrate })
+  const chunks = []
+  recorder.ondataavailable = e => e.data.size && chunks.push(e.data)
+  recorder.start()
+
+  const started = performance.now()
+  for (let i = 0; i < totalFrames; i++) {
+    draw(frames[i % frames.length])
+    track.requestFrame()
+    const due = started + ((i + 1) * 1000) / fps
+    await new Promise(r => setTimeout(r, Math.max(0, due - performance.now())))
+  }
+  const stopped = new Promise(r => (recorder.onstop = r))
+  recorder.stop()
+  await stopped
+
+  const bytes = new Uint8Array(await new Blob(chunks).arrayBuffer())
+  let binary = ''
+  for (let i = 0; i < bytes.length; i += 0x8000) {
+    binary += String.fromCharCode(...bytes.subarray(i, i + 0x8000))
+  }
+  return { data: btoa(binary), durationMs: (totalFrames * 1000) / fps }
+}
+"""
+
+
+def swing_clip(page, seconds, fps=30, size=(540, 960), swing_seconds=2.0, seed=0, bitrate=2_000_000):
+    """Path to a cached WebM of ``seconds`` of back-to-back synthetic swings."""
+    params = {"v": CLIP_VERSION, "s": seconds, "fps": fps, "size": size,
+              "swing": swing_seconds, "seed": seed, "bitrate": bitrate}
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+    path = CLIP_DIR / f"swing-{seconds:g}s-{digest}.webm"
+    if path.exists():
+        return path
+
+    swing = generate_swing(int(swing_seconds * fps), fps=fps, seed=seed, world=False)
+    clip = page.evaluate(RENDER_JS, {
+        "packed": pack_frames(swing),
+        "unpack": UNPACK_FRAMES_JS,
+        "fps": fps,
+        "totalFrames": int(seconds * fps),
+        "width": size[0],
+        "height": size[1],
+        "bitrate": bitrate,
+    })
+    CLIP_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(_with_duration(base64.b64decode(clip["data"]), clip["durationMs"]))
+    tmp.replace(path)
+    return path
+
+
+# --- WebM (EBML) duration patch ---
+
+_SEGMENT = 0x18538067
+_INFO = 0x1549A966
+_DURATION = 0x4489
+
+
+def _read_id(data, pos):
+    first = data[pos]
+    length = 1
+    while length <= 4 and not first & (0x80 >> (length - 1)):
+        length += 1
+    return int.from_bytes(data[pos:pos + length], "big"), pos + length
+
+
+def _read_size(data, pos):
+    first = data[pos]
+    length = 1
+    while length <= 8 and not first & (0x80 >> (length - 1)):
+        length += 1
+    value = first & (0xFF >> length)
+    for b in data[pos + 1:pos + length]:
+        value = (value << 8) | b
+    unknown = value == (1 << (7 * length)) - 1
+    return (None if unknown else value), pos + length
+
+
+def _with_duration(data: bytes, duration_ms: float) -> bytes:
+    """Insert (or leave) a Duration in the Segment Info; assumes the default 1ms timecode scale."""
+    pos = 0
+    while pos < len(data):
+        element, body = _read_id(data, pos)
+        size, body = _read_size(data, body)
+        if element == _SEGMENT:
+            pos = body  # descend into the segment
+            continue
+        if element == _INFO:
+            info = data[body:body + size]
+            child = 0
+            while child < len(info):
+                cid, cbody = _read_id(info, child)
+                csize, cbody = _read_size(info, cbody)
+                if cid == _DURATION:
+                    return data
+                child = cbody + csize
+            info += bytes([0x44, 0x89, 0x88]) + struct.pack(">d", float(duration_ms))
+            size_field = bytes([0x01]) + len(info).to_bytes(7, "big")
+            return data[:pos] + data[pos:pos + 4] + size_field + info + data[body + size:]
+        if size is None:
+            break
+        pos = body + size
+    return data
@@ -0,0 +1,78 @@
+"""Virtual time for scenarios.
+
+    use_virtual_clock(page)          # before page.goto
+    page.goto(BASE_URL)
+    skip_loading_screen(page)        # the 3.5s minimum display, instantly
+    ...
+    advance_clock(page, 60_000)      # a whole rest interval
+
+``use_virtual_clock`` installs Playwright's fake clock on the context before
+the app boots. Date, setTimeout, setInterval, requestAnimationFrame and
+performance.now all read virtual time, starting at ``START`` (the same epoch
+the generated datasets use). It also seeds Math.random, so the loading
+quote and anything else picked at random are the same in every run.
+Time keeps flowing at normal speed. ``advance_clock`` jumps ahead, firing
+every due timer in order.
+
+``advance_clock`` moves in ``step_ms`` increments and lets React commit
+between steps. Components such as ActiveWorkout re-arm their interval in an effect
+after every tick; firing a minute of ticks in one jump would queue 60 state
+updates against a single render and skip steps.
+"""
+
+from .datasets import EPOCH
+from .readiness import wait_for_app_ready
+
+START = EPOCH
+
+# LoadingScreen: 3.5s minimum display plus its 500ms exit animation.
+LOADING_SCREEN_MS = 4000
+# BudgetWatchdog's CHECK_INTERVAL_MS, copied by hand: verify_watchdog_interval
+# fails if the two drift apart by a minute or more.
+WATCHDOG_CHECK_MS = 15 * 60 * 1000
+
+# mulberry32; replaces Math.random before any app code runs.
+SEEDED_RANDOM_JS = """
+(() => {
+  let a = %d >>> 0
+  Math.random = () => {
+    a = (a + 0x6D2B79F5) >>> 0
+    let t = a
+    t = Math.imul(t ^ (t >>> 15), t | 1)
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61)
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296
+  }
+})()
+"""
+
+# Resolves after tasks already queued (React's scheduler posts through
+# MessageChannel, which the fake clock leaves alone).
+SETTLE_JS = """
+() => new Promise(resolve => {
+  const channel = new MessageChannel()
+  channel.port1.onmessage = () => resolve()
+  channel.port2.postMessage(null)
+})
+"""
+
+
+def use_virtual_clock(page, start=START, seed: int = 0):
+    """Install the virtual clock and seeded Math.random on ``page``'s context; call before navigating."""
+    page.context.clock.install(time=start)
+    page.context.add_init_script(SEEDED_RANDOM_JS % seed)
+
+
+def advance_clock(page, ms, step_ms=1000):
+    """Jump virtual time ``ms`` ahead in ``step_ms`` steps, letting the app render in between."""
+    remaining = ms
+    while remaining > 0:
+        step = min(step_ms, remaining)
+        page.clock.run_for(step)
+        page.evaluate(SETTLE_JS)
+        remaining -= step
+
+
+def skip_loading_screen(page):
+    """Fast-forward past LoadingScreen and wait for the app shell."""
+    advance_clock(page, LOADING_SCREEN_MS, step_ms=500)
+    wait_for_app_ready(page)
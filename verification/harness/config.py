@@ -0,0 +1,40 @@
+"""Shared configuration for the verification harness."""
+
+import os
+from pathlib import Path
+
+HARNESS_DIR = Path(__file__).resolve().parent
+VERIFICATION_DIR = HARNESS_DIR.parent
+REPO_ROOT = VERIFICATION_DIR.parent
+
+# Run artefacts (JSON reports, error screenshots) live here and are git-ignored.
+REPORTS_DIR = VERIFICATION_DIR / "reports"
+
+# Built storage-state fixtures, keyed by content hash (git-ignored).
+FIXTURE_CACHE_DIR = VERIFICATION_DIR / ".fixture-cache"
+
+# An externally managed app server. Unset, the runner starts its own (see server.py).
+SERVER_URL = os.environ.get("LIS_BASE_URL")
+
+# Scenarios navigate here; it resolves against the context's base_url, the server under test.
+BASE_URL = "/"
+
+# Where the runner looks for verify_* entry points, relative to REPO_ROOT.
+DISCOVERY_GLOBS = (
+    "verify_*.py",
+    "verification/verify_*.py",
+    "src/**/verify_*.py",
+)
+
+# iPhone 16 viewport used by most of the scripts.
+IPHONE_16 = {
+    "viewport": {"width": 393, "height": 852},
+    "device_scale_factor": 3,
+    "is_mobile": True,
+    "has_touch": True,
+}
+
+IPHONE_USER_AGENT = (
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 "
+    "(KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1"
+)
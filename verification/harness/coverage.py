@@ -0,0 +1,335 @@
+"""Precise JS and CSS coverage for each scenario's page (``run.py --coverage``).
+
+The scenario's page gets a CDP session that runs V8's precise block coverage and
+Chromium's CSS rule-usage tracking from before the first navigation to the
+end of the scenario. Coverage is also taken just before each main-frame
+navigation, so reloads do not lose the previous document's numbers. Dock
+clicks are forwarded from the page, so each script and stylesheet is
+attributed to the screen whose navigation requested it (``loadedBy``:
+``load`` or a module id).
+
+Per scenario the result holds one row per chunk: its URL with the origin,
+query string and the content hash of built assets removed, an ``entry`` grouping (the
+npm package for dependencies, the source directory for app files, the
+chunk name for built assets), and total / used / unused bytes. V8 reports
+offsets in UTF-16 code units; for the minified, ASCII bundles these are
+bytes.
+
+``write_report`` writes one TSV per scenario plus ``chunks.tsv`` and
+``entries.tsv`` for the whole run, sorted by unused bytes and free of
+timestamps and hashes, so two runs diff line by line (``run.py
+--coverage-compare <dir>`` prints the changes).
+"""
+
+import csv
+import re
+from pathlib import Path
+
+from .bench import print_table
+
+BINDING = "__lisCoverageScreen"
+INLINE = "(inline)"
+
+# Tells Python which dock button was tapped before the tap's imports start.
+SCREEN_JS = """
+addEventListener('click', e => {
+  const button = e.target instanceof Element && e.target.closest('nav[aria-label="Main Navigation"] button[aria-label]')
+  if (button) window.%s?.(button.getAttribute('aria-label'))
+}, true)
+""" % BINDING
+
+COLUMNS = ("kind", "chunk", "entry", "loadedBy", "totalBytes", "usedBytes", "unusedBytes", "unusedPct")
+_HASHED = re.compile(r"-[A-Za-z0-9_-]{8}(\.(?:js|css|mjs))$")
+
+
+def _merge(ranges):
+    """Sorted, non-overlapping union of ``(start, end)`` pairs."""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def used_ranges(functions) -> list:
+    """Executed ``(start, end)`` ranges of one script from V8 block coverage.
+
+    Ranges nest; the innermost range covering an offset decides whether it
+    ran. Same sweep as DevTools: at equal offsets ends come before starts,
+    longer starts first and shorter ends first.
+    """
+    points = []
+    for fn in functions:
+        for r in fn["ranges"]:
+            length = r["endOffset"] - r["startOffset"]
+            points.append((r["startOffset"], 1, -length, r["count"]))
+            points.append((r["endOffset"], 0, length, None))
+    points.sort()
+
+    used, stack, last = [], [], 0
+    for offset, is_start, _, count in points:
+        if stack and stack[-1] > 0 and last < offset:
+            used.append((last, offset))
+        if is_start:
+            stack.append(count)
+        else:
+            stack.pop()
+        last = offset
+    return _merge(used)
+
+
+def chunk_name(url: str) -> str:
+    """``/assets/Finance-Ab12_x9Z.js?v=1`` -> ``/assets/Finance.js``; origin dropped."""
+    path = re.sub(r"^https?://[^/]+", "", url).split("?")[0].split("#")[0]
+    # Built assets carry a content hash. Vite's shared dependency chunks keep
+    # theirs: every one would be called "chunk" without it.
+    if path.startswith("/assets/"):
+        return _HASHED.sub(r"\1", path)
+    return path
+
+
+def entry_name(chunk: str) -> str:
+    """What a chunk belongs to: an npm package, an app source directory, or the chunk itself."""
+    deps = re.match(r"/node_modules/\.vite/deps/(.+)\.js$", chunk)
+    if deps:
+        name = deps.group(1)
+        if name.startswith("chunk-"):
+            return "(shared deps)"
+        # Vite flattens "@scope/pkg" to "@scope_pkg".
+        return re.sub(r"^(@[^_]+)_", r"\1/", name)
+    package = re.match(r"/node_modules/((?:@[^/]+/)?[^/]+)/", chunk)
+    if package:
+        return package.group(1)
+    if chunk.startswith("/src/"):
+        return chunk.rsplit("/", 1)[0].lstrip("/")
+    return chunk.rsplit("/", 1)[-1]
+
+
+# CDP calls that start and stop coverage, in order.
+START_COVERAGE = (
+    ("Network.enable", {}),
+    ("Page.enable", {}),
+    ("Profiler.enable", {}),
+    ("Profiler.startPreciseCoverage", {"callCount": False, "detailed": True}),
+    ("DOM.enable", {}),
+    ("CSS.enable", {}),
+    ("CSS.startRuleUsageTracking", {}),
+)
+STOP_COVERAGE = (("CSS.stopRuleUsageTracking", {}), ("Profiler.stopPreciseCoverage", {}))
+
+
+class Coverage:
+    """Bookkeeping shared by the sync collector here and the async one in aio.py."""
+
+    def __init__(self):
+        self.main_frame = None
+        self._screen = "load"
+        self._loaded_by = {}
+        self._sheets = {}  # styleSheetId -> (chunk, length)
+        self._js = {}  # chunk -> {"total", "used": [(start, end)]}
+        self._css = {}
+        self._paths = {}  # chunk name -> the path it was first seen with
+
+    def _name(self, url):
+        """``chunk_name(url)``, unless another file already has that name: then the hashed path."""
+        path = re.sub(r"^https?://[^/]+", "", url).split("?")[0]
+        name = chunk_name(url)
+        return name if self._paths.setdefault(name, path) == path else path
+
+    def set_screen(self, source, screen):
+        self._screen = screen
+
+    def on_request(self, event):
+        if event.get("type") in ("Script", "Stylesheet"):
+            self._loaded_by.setdefault(self._name(event["request"]["url"]), self._screen)
+
+    def on_sheet(self, event):
+        header = event["header"]
+        url = header.get("sourceURL") or ""
+        if header.get("isInline") or not url.startswith("http"):
+            # <style> tags (all CSS on the dev server) share the page URL; keep them
+            # apart here so their ranges do not mix, and report them as one row.
+            url = f"{INLINE}#{header['styleSheetId']}"
+        else:
+            url = self._name(url)
+        self._sheets[header["styleSheetId"]] = (url, int(header.get("length", 0)))
+
+    def is_main_navigation(self, event) -> bool:
+        if event["frameId"] != self.main_frame:
+            return False
+        self._screen = "load"
+        return True
+
+    def ingest(self, scripts, rules):
+        """Fold in one ``Profiler.takePreciseCoverage`` and ``CSS.takeCoverageDelta`` result."""
+        for script in scripts:
+            if not script["url"].startswith("http") or not script["functions"]:
+                continue
+            chunk = self._name(script["url"])
+            total = max(r["endOffset"] for fn in script["functions"] for r in fn["ranges"])
+            entry = self._js.setdefault(chunk, {"total": 0, "used": []})
+            entry["total"] = max(entry["total"], total)
+            entry["used"] = _merge(entry["used"] + used_ranges(script["functions"]))
+
+        for rule in rules:
+            chunk, length = self._sheets.get(rule["styleSheetId"], ("(unknown)", 0))
+            entry = self._css.setdefault(chunk, {"total": 0, "used": []})
+            entry["total"] = max(entry["total"], length)
+            if rule["used"]:
+                entry["used"] = _merge(entry["used"] + [(rule["startOffset"], rule["endOffset"])])
+
+    def rows(self) -> list:
+        """One row per chunk (see ``COLUMNS``), most unused bytes first."""
+        sizes = {}
+        for kind, chunks in (("js", self._js), ("css", self._css)):
+            for chunk, data in chunks.items():
+                name = INLINE if chunk.startswith(INLINE) else chunk
+                used = min(sum(end - start for start, end in data["used"]), data["total"])
+                total_so_far, used_so_far = sizes.get((kind, name), (0, 0))
+                sizes[(kind, name)] = (total_so_far + data["total"], used_so_far + used)
+        return ranked(
+            row(kind, chunk, self._loaded_by.get(chunk, "load"), total, used)
+            for (kind, chunk), (total, used) in sizes.items()
+        )
+
+
+class CoverageCollector(Coverage):
+    """Start JS and CSS coverage on ``page``; call ``finish()`` before the context closes."""
+
+    def __init__(self, page):
+        super().__init__()
+        self._cdp = page.context.new_cdp_session(page)
+        page.expose_binding(BINDING, self.set_screen)
+        page.add_init_script(SCREEN_JS)
+        self._cdp.on("Network.requestWillBeSent", self.on_request)
+        self._cdp.on("CSS.styleSheetAdded", self.on_sheet)
+        self._cdp.on("Page.frameStartedLoading", self._on_navigation)
+        for method, params in START_COVERAGE:
+            self._cdp.send(method, params)
+        self.main_frame = self._cdp.send("Page.getFrameTree")["frameTree"]["frame"]["id"]
+
+    def _on_navigation(self, event):
+        if self.is_main_navigation(event):
+            try:
+                self._take()
+            except Exception:
+                # The old document may already be gone; the next take still has the rest.
+                pass
+
+    def _take(self):
+        self.ingest(self._cdp.send("Profiler.takePreciseCoverage")["result"],
+                    self._cdp.send("CSS.takeCoverageDelta")["coverage"])
+
+    def finish(self) -> list:
+        try:
+            self._take()
+            for method, params in STOP_COVERAGE:
+                self._cdp.send(method, params)
+        except Exception:
+            # Closed or crashed page: report what earlier navigations collected.
+            pass
+        return self.rows()
+
+
+def row(kind, chunk, loaded_by, total, used) -> dict:
+    return {
+        "kind": kind,
+        "chunk": chunk,
+        "entry": entry_name(chunk) if kind == "js" else chunk,
+        "loadedBy": loaded_by,
+        "totalBytes": total,
+        "usedBytes": used,
+        "unusedBytes": total - used,
+        "unusedPct": round(100 * (total - used) / total, 1) if total else 0.0,
+    }
+
+
+def ranked(rows) -> list:
+    return sorted(rows, key=lambda r: (-r["unusedBytes"], r["kind"], r["chunk"]))
+
+
+def by_chunk(results) -> list:
+    """Each chunk across the run: its size, and the least of it left unused by any scenario."""
+    best = {}
+    for result in results:
+        for r in result.coverage:
+            key = (r["kind"], r["chunk"])
+            if key not in best or r["unusedBytes"] < best[key]["unusedBytes"]:
+                best[key] = r
+    return ranked(best.values())
+
+
+def by_entry(chunks) -> list:
+    totals = {}
+    for r in chunks:
+        key = (r["kind"], r["entry"])
+        entry = totals.setdefault(key, {"kind": r["kind"], "entry": r["entry"], "chunks": 0,
+                                        "totalBytes": 0, "usedBytes": 0, "unusedBytes": 0})
+        entry["chunks"] += 1
+        for field in ("totalBytes", "usedBytes", "unusedBytes"):
+            entry[field] += r[field]
+    for entry in totals.values():
+        entry["unusedPct"] = round(100 * entry["unusedBytes"] / entry["totalBytes"], 1) if entry["totalBytes"] else 0.0
+    return sorted(totals.values(), key=lambda r: (-r["unusedBytes"], r["kind"], r["entry"]))
+
+
+def _write_tsv(path: Path, rows, columns):
+    with path.open("w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, delimiter="\t", extrasaction="ignore", lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_report(results, directory: Path) -> Path:
+    """``<scenario>.tsv`` per scenario, plus ``chunks.tsv`` and ``entries.tsv`` for the run."""
+    directory.mkdir(parents=True, exist_ok=True)
+    # Repeated runs of a scenario write the same file; the last one wins.
+    for result in results:
+        if result.coverage:
+            _write_tsv(directory / f"{result.name}.tsv", result.coverage, COLUMNS)
+    chunks = by_chunk(results)
+    _write_tsv(directory / "chunks.tsv", chunks, COLUMNS)
+    _write_tsv(directory / "entries.tsv", by_entry(chunks),
+               ("kind", "entry", "chunks", "totalBytes", "usedBytes", "unusedBytes", "unusedPct"))
+    return directory
+
+
+def print_top(results, top: int = 20):
+    rows = by_entry(by_chunk(results))[:top]
+    print_table(rows, [
+        ("kind", "kind", "s"),
+        ("entry", "entry", "s"),
+        ("chunks", "chunks", "d"),
+        ("totalBytes", "total B", ",d"),
+        ("unusedBytes", "unused B", ",d"),
+        ("unusedPct", "unused %", ".1f"),
+    ])
+
+
+def _read_tsv(path: Path) -> dict:
+    with path.open() as f:
+        return {(r["kind"], r["entry"]): r for r in csv.DictReader(f, delimiter="\t")}
+
+
+def compare(old_dir: Path, new_dir: Path) -> list:
+    """Per-entry change in unused bytes between two ``write_report`` directories, largest first."""
+    old, new = _read_tsv(old_dir / "entries.tsv"), _read_tsv(new_dir / "entries.tsv")
+    rows = []
+    for key in old.keys() | new.keys():
+        before = int(old[key]["unusedBytes"]) if key in old else 0
+        after = int(new[key]["unusedBytes"]) if key in new else 0
+        if before != after:
+            rows.append({"kind": key[0], "entry": key[1], "before": before, "after": after, "delta": after - before})
+    return sorted(rows, key=lambda r: (-abs(r["delta"]), r["kind"], r["entry"]))
+
+
+def print_compare(rows):
+    print_table(rows, [
+        ("kind", "kind", "s"),
+        ("entry", "entry", "s"),
+        ("before", "unused B before", ",d"),
+        ("after", "after", ",d"),
+        ("delta", "Δ", "+,d"),
+    ])
@@ -0,0 +1,455 @@
+"""Seeded record generators for the useKV-backed storage keys.
+
+``records(key, count, seed)`` returns ``count`` records shaped like the
+TypeScript type stored under ``key`` (src/lib/types.ts), so scenarios and
+benchmarks can fill a module with realistic data at any volume. The same
+seed always gives the same records.
+
+For large volumes, ``Records(key, count, seed)`` generates them lazily a
+chunk at a time: fixtures can return one as a storage value (storage.py
+streams it into the state file), ``Records.write`` streams it to a JSON file,
+and ``dataset_file`` keeps one such file per ``(key, count, seed)`` in the
+fixture cache so every benchmark reads the same data::
+
+    python verification/make_dataset.py tasks 1000000 --seed 3
+
+Generated records are checked against the app's types (harness/schema.py):
+the first chunk of every ``Records`` stream, and each storage value a fixture
+returns.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+
+from . import config, schema
+from .storage import fixture
+
+# Fixed "now" so generated dates do not drift between runs.
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+_WORDS = (
+    "morning run read stretch water journal meditate call groceries review "
+    "invoice plan study walk code clean laundry email budget practice swing "
+    "deadlift squat bench oats coffee eggs rice spinach chicken apples bread"
+).split()
+
+
+def _iso(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+@functools.lru_cache(maxsize=4096)
+def _day(dt):
+    # Cached: history builders format the same few thousand days over and over.
+    return dt.strftime("%Y-%m-%d")
+
+
+def _phrase(rng, words=3):
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize()
+
+
+def habit(rng, i, entries=14):
+    tracking = rng.choice(("boolean", "numerical", "time"))
+    target = None if tracking == "boolean" else rng.randint(1, 60)
+    record = {
+        "id": f"habit-{i}",
+        "name": _phrase(rng, 2),
+        "icon": rng.choice(("Drop", "Barbell", "Book", "Moon", "Sun")),
+        "trackingType": tracking,
+        "streak": rng.randint(0, entries),
+        "entries": [],
+        "createdAt": _iso(EPOCH - timedelta(days=entries + i % 365)),
+    }
+    if target is not None:
+        record["target"] = target
+        record["unit"] = "minutes" if tracking == "time" else "reps"
+    for d in range(entries):
+        entry = {"date": _day(EPOCH - timedelta(days=d))}
+        if tracking == "boolean":
+            entry["completed"] = rng.random() < 0.7
+        elif tracking == "numerical":
+            entry["value"] = rng.randint(0, target)
+        else:
+            entry["minutes"] = rng.randint(0, target)
+        record["entries"].append(entry)
+    return record
+
+
+def habit_history(habits, days, seed=0, end=EPOCH):
+    """``habits`` habits with ``days`` days of history each, oldest entry first.
+
+    Days are kept in runs: a completed day is followed by another 85% of the
+    time, a missed one 50%. Boolean habits store completed days only (as the
+    app does); numerical and time habits store every day, short of the target
+    when missed. ``end``'s day is left open to be completed, and ``streak``
+    is the run ending the day before.
+    """
+    rng = random.Random(f"habit-history:{seed}")
+    result = []
+    for h in range(habits):
+        tracking = ("boolean", "numerical", "time")[h % 3]
+        record = {
+            "id": f"habit-{h}",
+            "name": f"{_phrase(rng, 2)} {h}",
+            "icon": rng.choice(("Drop", "Barbell", "Book", "Moon", "Sun")),
+            "trackingType": tracking,
+            "streak": 0,
+            "entries": [],
+            "createdAt": _iso(end - timedelta(days=days)),
+        }
+        if tracking != "boolean":
+            record["target"] = rng.randint(5, 60)
+            record["unit"] = "minutes" if tracking == "time" else "reps"
+        done, run = rng.random() < 0.7, 0
+        for d in range(days, 0, -1):
+            done = rng.random() < (0.85 if done else 0.5)
+            run = run + 1 if done else 0
+            date = _day(end - timedelta(days=d))
+            if tracking == "boolean":
+                if done:
+                    record["entries"].append({"date": date, "completed": True})
+            else:
+                target = record["target"]
+                amount = target + rng.randint(0, 5) if done else rng.randint(0, target - 1)
+                record["entries"].append({"date": date, "value" if tracking == "numerical" else "minutes": amount})
+        record["streak"] = run
+        result.append(record)
+    return result
+
+
+def task(rng, i):
+    completed = rng.random() < 0.4
+    created = EPOCH - timedelta(hours=i)
+    record = {
+        "id": f"task-{i}",
+        "title": _phrase(rng, 4),
+        "completed": completed,
+        "priority": rng.choice(("low", "medium", "high")),
+        "createdAt": _iso(created),
+    }
+    if completed:
+        record["completedAt"] = _iso(created + timedelta(hours=rng.randint(1, 48)))
+    if rng.random() < 0.5:
+        record["dueDate"] = _day(created + timedelta(days=rng.randint(1, 14)))
+    return record
+
+
+def shopping_item(rng, i):
+    return {
+        "id": f"item-{i}",
+        "name": _phrase(rng, 2),
+        "completed": rng.random() < 0.3,
+        "createdAt": _iso(EPOCH - timedelta(minutes=i)),
+        "category": rng.choice(("Produce", "Dairy", "Pantry", "Household")),
+        "quantity": rng.randint(1, 6),
+    }
+
+
+def expense(rng, i):
+    return {
+        "id": f"expense-{i}",
+        "amount": round(rng.uniform(2, 250), 2),
+        "category": rng.choice(("Food", "Transport", "Housing", "Fun", "Health")),
+        "description": _phrase(rng, 3),
+        "date": _day(EPOCH - timedelta(days=i // 5)),
+    }
+
+
+def calendar_event(rng, i):
+    start = rng.randint(7, 20)
+    return {
+        "id": f"event-{i}",
+        "title": _phrase(rng, 3),
+        "date": _day(EPOCH + timedelta(days=i % 730 - 365)),
+        "startTime": f"{start:02d}:00",
+        "endTime": f"{start + 1:02d}:00",
+        "category": rng.choice(("event", "plan", "reminder", "meeting")),
+        "createdAt": _iso(EPOCH - timedelta(days=i % 365)),
+    }
+
+
+def chat_message(rng, i):
+    return {
+        "id": f"msg-{i}",
+        "role": "user" if i % 2 == 0 else "assistant",
+        "content": " ".join(rng.choice(_WORDS) for _ in range(rng.randint(8, 60))),
+        "timestamp": _iso(EPOCH - timedelta(minutes=i)),
+    }
+
+
+def completed_workout(rng, i):
+    done = EPOCH - timedelta(days=i)
+    total = rng.randint(3, 8)
+    return {
+        "id": f"completed-{i}",
+        "workoutPlanId": f"plan-{i % 12}",
+        "workoutName": _phrase(rng, 2),
+        "workoutFocus": rng.choice(("Strength", "Cardio", "Mobility", "Full Body")),
+        "completedExercises": rng.randint(1, total),
+        "totalExercises": total,
+        "exercises": [
+            {
+                "exerciseId": f"ex-{e}",
+                "name": rng.choice(("Bench Press", "Squat", "Deadlift", "Row", "Plank")),
+                "sets": [
+                    {"id": f"set-{i}-{e}-{s}", "reps": rng.randint(5, 12),
+                     "weight": rng.randint(20, 140), "completed": True}
+                    for s in range(3)
+                ],
+            }
+            for e in range(total)
+        ],
+        "totalDuration": rng.randint(900, 4200),
+        "calories": rng.randint(150, 700),
+        "date": _iso(done),
+        "completedAt": _iso(done),
+    }
+
+
+def swing_analysis(rng, i):
+    # Without poseData: stored analyses keep metrics and feedback, and the
+    # per-frame landmarks alone would blow the localStorage quota.
+    return {
+        "id": f"swing-{i}",
+        "videoId": f"video-{i}",
+        "club": rng.choice(("Driver", "7-Iron", "PW", None)),
+        "status": "completed",
+        "uploadedAt": _iso(EPOCH - timedelta(hours=i)),
+        "processedAt": _iso(EPOCH - timedelta(hours=i) + timedelta(minutes=1)),
+        "feedback": {
+            "overallScore": rng.randint(40, 95),
+            "strengths": [_phrase(rng, 4)],
+            "improvements": [_phrase(rng, 4), _phrase(rng, 4)],
+            "drills": [],
+            "aiInsights": _phrase(rng, 12),
+        },
+    }
+
+
+# Largest single spend in ``finance_audit``.
+MAX_SPEND = 400
+
+
+def finance_audit(categories, subcategories, seed=0, liquid_assets=None, days=60):
+    """A completed ``finance-audit-v2`` and matching ``finance-report-v2``.
+
+    Every subcategory is a dated spend of at most ``MAX_SPEND`` in the
+    ``days`` before ``EPOCH``, so BudgetWatchdog has ``categories *
+    subcategories`` entries to scan and nothing spent in EPOCH's month. The
+    proposed budget allocates each category twice its spend. By default
+    ``liquidAssets`` covers 60 days even if every entry fell in the last 30,
+    so the runway alert stays quiet at any size.
+    """
+    if liquid_assets is None:
+        liquid_assets = 2 * MAX_SPEND * categories * subcategories
+    rng = random.Random(f"finance-audit:{seed}")
+    audit_categories, budget = [], []
+    for c in range(categories):
+        subs = [
+            {
+                "id": f"sub-{c}-{s}",
+                "name": _phrase(rng, 2),
+                "amount": rng.randint(5, MAX_SPEND),
+                "dateAdded": _iso(EPOCH - timedelta(minutes=rng.randint(1, days * 24 * 60))),
+            }
+            for s in range(subcategories)
+        ]
+        name = f"{_phrase(rng, 1)} {c}"
+        audit_categories.append({"id": f"cat-{c}", "name": name, "subcategories": subs})
+        budget.append({
+            "categoryId": f"cat-{c}",
+            "categoryName": name,
+            "allocatedAmount": 2 * sum(sub["amount"] for sub in subs),
+            "subcategories": [
+                {"subcategoryId": sub["id"], "subcategoryName": sub["name"], "allocatedAmount": sub["amount"]}
+                for sub in subs
+            ],
+        })
+    audit = {
+        "version": "2.0",
+        "lastUpdated": _iso(EPOCH),
+        "status": "completed",
+        "monthlyIncome": 5000,
+        "liquidAssets": liquid_assets,
+        "categories": audit_categories,
+        "flags": [],
+        "resolutions": [],
+    }
+    report = {
+        "executiveSummary": _phrase(rng, 12),
+        "spendingAnalysis": [],
+        "proposedBudget": budget,
+        "moneyManagementAdvice": [],
+        "reportGeneratedAt": _iso(EPOCH),
+        "version": "2.0",
+    }
+    return audit, report
+
+
+def workout_plan(exercises, sets=4, block_size=4, seed=0):
+    """A ``WorkoutPlan`` with ``exercises`` moves spread over ``blocks``.
+
+    Blocks of ``block_size`` cycle strength -> superset -> circuit. Strength
+    moves get ``sets`` sets each; supersets and circuits run ``sets`` rounds,
+    with no rest between the paired moves. About one move in four is timed.
+    """
+    rng = random.Random(f"workout-plan:{seed}")
+    kinds = ("strength", "superset", "circuit")
+    blocks = []
+    for b, start in enumerate(range(0, exercises, block_size)):
+        kind = kinds[b % len(kinds)]
+        moves = []
+        for e in range(start, min(start + block_size, exercises)):
+            move = {
+                "id": f"ex-{e}",
+                "name": f"{_phrase(rng, 2)} {e}",
+                "type": "strength",
+                "sets": sets,
+                "restSeconds": 0 if kind == "superset" and e < start + block_size - 1 else rng.choice((30, 60, 90)),
+                "weight": rng.randint(0, 120),
+            }
+            if rng.random() < 0.25:
+                move["durationSeconds"] = rng.choice((20, 30, 45, 60))
+            else:
+                move["reps"] = rng.randint(5, 15)
+            moves.append(move)
+        blocks.append({
+            "id": f"block-{b}",
+            "type": kind,
+            "rounds": 1 if kind == "strength" else sets,
+            "exercises": moves,
+        })
+    return {
+        "id": f"plan-{exercises}-{seed}",
+        "name": f"{exercises}-move program",
+        "focus": "Full Body",
+        "exercises": [],
+        "blocks": blocks,
+        "estimatedDuration": exercises * sets * 2,
+        "difficulty": "advanced",
+        "createdAt": _iso(EPOCH),
+    }
+
+
+def workout_plan_record(rng, i):
+    plan = workout_plan(rng.randint(3, 12), sets=rng.randint(2, 5), seed=rng.getrandbits(32))
+    plan["id"] = f"plan-{i}"
+    return plan
+
+
+FACTORIES = {
+    "habits": habit,
+    "tasks": task,
+    "shopping-items": shopping_item,
+    "expenses": expense,
+    "calendar-events": calendar_event,
+    "knox-messages": chat_message,
+    "completed-workouts": completed_workout,
+    "golf-swing-analyses": swing_analysis,
+    "workout-plans": workout_plan_record,
+}
+
+# Records per chunk when streaming; about 5 MB of JSON for the larger types.
+CHUNK_SIZE = 10_000
+
+
+def iter_records(key, count, seed=0):
+    """Yield ``records(key, count, seed)`` one at a time."""
+    factory = FACTORIES[key]
+    rng = random.Random(f"{key}:{seed}")
+    for i in range(count):
+        yield factory(rng, i)
+
+
+def records(key, count, seed=0):
+    """``count`` records for storage ``key``; see ``FACTORIES`` for the supported keys."""
+    return list(iter_records(key, count, seed))
+
+
+@dataclass(frozen=True)
+class Records:
+    """``records(key, count, seed)``, generated lazily a chunk at a time."""
+
+    key: str
+    count: int
+    seed: int = 0
+
+    def __iter__(self):
+        return iter_records(self.key, self.count, self.seed)
+
+    def chunks(self, size=CHUNK_SIZE):
+        """Lists of up to ``size`` records; the first is checked against the key's type.
+
+        Every record comes from the same builder, so one chunk covers its
+        optional branches without paying for a check of millions.
+        """
+        stream = iter(self)
+        first = True
+        while chunk := list(islice(stream, size)):
+            if first and self.key in schema.STORAGE_TYPES:
+                schema.check(chunk, schema.STORAGE_TYPES[self.key])
+            first = False
+            yield chunk
+
+    def json_chunks(self, size=CHUNK_SIZE):
+        """The records as one compact JSON array, in pieces of ``size`` records."""
+        yield "["
+        for n, chunk in enumerate(self.chunks(size)):
+            text = json.dumps(chunk, separators=(",", ":"))[1:-1]
+            yield "," + text if n else text
+        yield "]"
+
+    def dumps(self):
+        """The whole array as one JSON string, e.g. for ``page.evaluate``."""
+        return "".join(self.json_chunks())
+
+    def write(self, path, size=CHUNK_SIZE):
+        """Stream the records to ``path`` as a JSON array and return the path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as out:
+            for text in self.json_chunks(size):
+                out.write(text)
+        return path
+
+
+def dataset_file(key, count, seed=0):
+    """Path of a JSON file holding ``records(key, count, seed)``, written on first use.
+
+    Files live in the fixture cache under a hash of this module's source, so
+    a change to a builder writes fresh ones; ``LIS_REFRESH_FIXTURES=1`` forces it.
+    """
+    digest = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:12]
+    path = config.FIXTURE_CACHE_DIR / "datasets" / f"{key}-{count}-{seed}-{digest}.json"
+    if path.exists() and not os.environ.get("LIS_REFRESH_FIXTURES"):
+        return path
+    # Write-then-rename, as for storage states: concurrent workers may build the same file.
+    tmp = Records(key, count, seed).write(path.with_suffix(f".{os.getpid()}.tmp"))
+    os.replace(tmp, path)
+    return path
+
+
+@fixture
+def kv_records(key, count, seed=0):
+    """``("kv_records", {"key": "tasks", "count": 10000})`` seeds one key at volume."""
+    return {key: Records(key, count, seed)}
+
+
+@fixture
+def finance_at_scale(categories, subcategories, seed=0, liquid_assets=None):
+    """``("finance_at_scale", {"categories": 200, "subcategories": 10})`` seeds a large completed audit."""
+    audit, report = finance_audit(categories, subcategories, seed, liquid_assets)
+    return {"finance-audit-v2": audit, "finance-report-v2": report}
+
+
+@fixture
+def habit_histories(habits, days, seed=0):
+    """``("habit_histories", {"habits": 50, "days": 3 * 365})`` seeds long habit histories."""
+    return {"habits": habit_history(habits, days, seed)}
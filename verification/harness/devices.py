@@ -0,0 +1,87 @@
+"""Named device profiles: viewport plus CPU and network throttling.
+
+    python verification/run.py --devices mid-phone,low-phone
+    LIS_DEVICE=low-phone python verification/verify_session.py
+
+A profile's context options (viewport, scale factor, touch) are merged over
+the scenario's own. Its CPU slowdown (``Emulation.setCPUThrottlingRate``) and
+network conditions (``Network.emulateNetworkConditions``) are applied over
+CDP to the scenario's page before the first navigation; tabs the scenario
+opens itself run unthrottled. The ``offline`` network lets the first page
+load through and then takes the context offline, which is how a user loses
+signal with the app already open.
+
+Every result carries the profile name (``ScenarioResult.device``), and the
+runner writes one report per profile, so every metric, step and vitals
+segment is tagged with the device it was measured on.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .config import IPHONE_16
+
+# Chrome DevTools' throttling presets (bytes per second, latency in ms).
+NETWORKS = {
+    "fast-4g": {"latency": 165, "downloadThroughput": 9 * 1024 * 1024 / 8 * 0.9,
+                "uploadThroughput": 1.5 * 1024 * 1024 / 8 * 0.9},
+    "slow-4g": {"latency": 562.5, "downloadThroughput": 1.6 * 1024 * 1024 / 8 * 0.9,
+                "uploadThroughput": 750 * 1024 / 8 * 0.9},
+    "offline": None,
+}
+
+
+@dataclass(frozen=True)
+class DeviceProfile:
+    name: str
+    # Keyword arguments for browser.new_context(); merged over the scenario's.
+    context: dict = field(default_factory=dict)
+    # CPU slowdown factor; 1 is the host's speed.
+    cpu_throttle: float = 1
+    # Key into NETWORKS, or None for the host's network.
+    network: Optional[str] = None
+
+
+PROFILES = {
+    profile.name: profile
+    for profile in (
+        DeviceProfile("desktop"),
+        DeviceProfile("iphone-16", context=IPHONE_16),
+        DeviceProfile("mid-phone", context=IPHONE_16, cpu_throttle=4, network="fast-4g"),
+        DeviceProfile("low-phone", context=IPHONE_16, cpu_throttle=6, network="slow-4g"),
+        DeviceProfile("offline-phone", context=IPHONE_16, cpu_throttle=4, network="offline"),
+    )
+}
+
+
+def get(name: Optional[str]) -> Optional[DeviceProfile]:
+    if not name:
+        return None
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown device profile {name!r}; choose from {', '.join(PROFILES)}") from None
+
+
+def throttle_commands(profile: DeviceProfile) -> list:
+    """CDP ``(method, params)`` calls that apply ``profile``'s CPU and network throttling."""
+    commands = []
+    if profile.cpu_throttle != 1:
+        commands.append(("Emulation.setCPUThrottlingRate", {"rate": profile.cpu_throttle}))
+    conditions = NETWORKS.get(profile.network)
+    if conditions:
+        commands.append(("Network.enable", {}))
+        commands.append(("Network.emulateNetworkConditions", {"offline": False, **conditions}))
+    return commands
+
+
+def apply(page, profile: Optional[DeviceProfile]):
+    """Throttle ``page`` as ``profile`` describes; returns the CDP session, which must stay open."""
+    if profile is None:
+        return None
+    cdp = page.context.new_cdp_session(page)
+    for method, params in throttle_commands(profile):
+        cdp.send(method, params)
+    if profile.network == "offline":
+        page.once("load", lambda _: page.context.set_offline(True))
+    return cdp
@@ -0,0 +1,176 @@
+"""Running a single scenario inside an already-launched browser."""
+
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+from . import config, devices, storage
+from .coverage import CoverageCollector
+from .offline import use_offline
+from .registry import Scenario
+from .vitals import VitalsCollector
+
+
+@dataclass(frozen=True)
+class RunOptions:
+    headless: bool = True
+    # Extra keyword arguments for chromium.launch().
+    launch: dict = field(default_factory=dict)
+    # Collect per-navigation Web Vitals on every page (see vitals.py).
+    vitals: bool = True
+    # Serve MediaPipe from disk and mock Gemini / window.spark (see offline.py).
+    offline: bool = False
+    # "dev" (vite) or "prod" (built bundle); see server.py.
+    target: str = field(default_factory=lambda: os.environ.get("LIS_TARGET", "dev"))
+    # prod only: serve dist/ from Python instead of `vite preview`.
+    static: bool = False
+    # Origin of the server under test; filled in by server.serving() when empty.
+    base_url: Optional[str] = None
+    # Precise JS/CSS coverage per page (see coverage.py).
+    coverage: bool = False
+    # Device profile name (see devices.py): viewport, CPU and network throttling.
+    device: Optional[str] = field(default_factory=lambda: os.environ.get("LIS_DEVICE") or None)
+
+    def launch_kwargs(self) -> dict:
+        kwargs = {"headless": self.headless, **self.launch}
+        if self.vitals:
+            # Unbucketed performance.memory for the heap samples.
+            kwargs["args"] = [*kwargs.get("args", []), "--enable-precise-memory-info"]
+        return kwargs
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    path: str
+    status: str  # "passed" | "failed"
+    duration_s: float
+    error: Optional[str] = None
+    worker: Optional[int] = None
+    # Device profile the scenario ran under, if any.
+    device: Optional[str] = None
+    # Measurements recorded by the scenario through record().
+    metrics: dict = field(default_factory=dict)
+    # Per-navigation segments from VitalsCollector.
+    vitals: list = field(default_factory=list)
+    # Step name -> CPU profile summary, from profiling.profile().
+    profiles: dict = field(default_factory=dict)
+    # Step name -> wall times in ms, from step(); a step may run more than once.
+    steps: dict = field(default_factory=dict)
+    # Per-chunk used and unused bytes, from CoverageCollector (run.py --coverage).
+    coverage: list = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+_metrics: ContextVar[Optional[dict]] = ContextVar("scenario_metrics", default=None)
+_steps: ContextVar[Optional[dict]] = ContextVar("scenario_steps", default=None)
+# (scenario, page, profiles) for helpers that act on the running scenario.
+_active: ContextVar[Optional[tuple]] = ContextVar("scenario_active", default=None)
+
+
+def record(name: str, value):
+    """Attach a measurement to the running scenario's result.
+
+    Values must be JSON-serialisable. Outside the runner this only prints.
+    """
+    metrics = _metrics.get()
+    if metrics is None:
+        print(f"{name}: {value}")
+    else:
+        metrics[name] = value
+
+
+@contextmanager
+def step(name: str):
+    """Time the block as the named step ``name``.
+
+    Repeat runs (``run.py --repeat``) report percentiles and confidence
+    intervals per step and gate them against a baseline (see baseline.py).
+    The block may contain ``await``s.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - started) * 1000
+        steps = _steps.get()
+        if steps is None:
+            print(f"[step] {name}: {ms:.1f}ms")
+        else:
+            steps.setdefault(name, []).append(round(ms, 3))
+
+
+def context_kwargs(entry: Scenario, playwright, base_url: str, device: Optional[str] = None) -> dict:
+    kwargs = {"base_url": base_url}
+    if entry.device:
+        kwargs.update(playwright.devices[entry.device])
+    kwargs.update(entry.context)
+    if device:
+        kwargs.update(devices.get(device).context)
+    if entry.fixtures:
+        kwargs["storage_state"] = str(storage.storage_state(entry.fixtures, base_url))
+    return kwargs
+
+
+def failure_screenshot_path(entry: Scenario) -> str:
+    config.REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+    return str(config.REPORTS_DIR / f"{entry.name}-error.png")
+
+
+def make_result(entry: Scenario, status, error, started, metrics, vitals,
+                profiles=None, steps=None, coverage=None, device=None) -> ScenarioResult:
+    return ScenarioResult(
+        name=entry.name,
+        path=str(entry.path.relative_to(config.REPO_ROOT)),
+        status=status,
+        duration_s=time.perf_counter() - started,
+        error=error,
+        worker=os.getpid(),
+        device=device,
+        metrics=metrics,
+        vitals=vitals,
+        profiles=profiles or {},
+        steps=steps or {},
+        coverage=coverage or [],
+    )
+
+
+def execute(entry: Scenario, playwright, browser, options: RunOptions) -> ScenarioResult:
+    """Run ``entry`` in a fresh, isolated browser context and time it."""
+    started = time.perf_counter()
+    context = browser.new_context(**context_kwargs(entry, playwright, options.base_url, options.device))
+    collector = VitalsCollector(context) if options.vitals else None
+    page = context.new_page()
+    throttle = devices.apply(page, devices.get(options.device))  # noqa: F841  (keeps the CDP session open)
+    coverage = CoverageCollector(page) if options.coverage else None
+    if options.offline:
+        use_offline(page)
+    status, error = "passed", None
+    metrics, vitals, profiles, steps, chunks = {}, [], {}, {}, []
+    token = _metrics.set(metrics)
+    steps_token = _steps.set(steps)
+    active = _active.set((entry, page, profiles))
+    try:
+        entry.func(page)
+    except Exception as e:
+        status, error = "failed", f"{type(e).__name__}: {e}"
+        try:
+            page.screenshot(path=failure_screenshot_path(entry))
+        except Exception:
+            pass
+    finally:
+        _metrics.reset(token)
+        _steps.reset(steps_token)
+        _active.reset(active)
+        if collector is not None:
+            vitals = collector.finish()
+        if coverage is not None:
+            chunks = coverage.finish()
+        context.close()
+
+    return make_result(entry, status, error, started, metrics, vitals, profiles, steps, chunks, options.device)
@@ -0,0 +1,194 @@
+"""Named storage fixtures shared by the verify_* scenarios.
+
+Each fixture returns ``{localStorage key: value}``; see ``storage`` for how
+they are composed and cached. Scripts can register their own with
+``@fixture`` next to the scenario that uses them.
+"""
+
+from .storage import fixture
+
+
+@fixture
+def onboarded():
+    # Bypass onboarding
+    return {"has-completed-accountant-audit": "true"}
+
+
+@fixture
+def gemini_key():
+    return {"gemini-api-key": "dummy-key"}
+
+
+# --- Workouts ---
+
+@fixture
+def workout_circuit():
+    """Reps exercise followed by a timed one; walks setup -> reps -> rest -> timer."""
+    return {"workout-plans": [{
+        "id": "test-plan-1",
+        "name": "Test Circuit",
+        "focus": "Full Body",
+        "difficulty": "intermediate",
+        "estimatedDuration": 30,
+        "createdAt": "2023-01-01T00:00:00.000Z",
+        "exercises": [
+            {
+                "id": "ex-1",
+                "name": "Push-ups",
+                "type": "reps",
+                "category": "Strength",
+                "sets": 1,
+                "reps": 10,
+                "weight": 0,
+                "muscleGroups": ["Chest", "Triceps"],
+                "difficulty": "beginner",
+                "instructions": {"summary": "Keep body straight.", "keyPoints": []}
+            },
+            {
+                "id": "ex-2",
+                "name": "Plank",
+                "type": "time",
+                "duration": 30,
+                "category": "Core",
+                "sets": 1,
+                "muscleGroups": ["Abs"],
+                "difficulty": "beginner",
+                "instructions": {"summary": "Hold tight.", "keyPoints": []}
+            }
+        ]
+    }]}
+
+
+@fixture
+def workout_press():
+    return {"workout-plans": [{
+        "id": "test-plan-1",
+        "name": "Test Workout",
+        "focus": "Strength",
+        "exercises": [
+            {
+                "id": "ex-1",
+                "name": "Test Press",
+                "type": "reps",
+                "category": "Chest",
+                "sets": 3,
+                "reps": 10,
+                "weight": 135,
+                "muscleGroups": ["chest"],
+                "difficulty": "intermediate",
+                "instructions": {
+                    "summary": "Push the bar.",
+                    "keyPoints": []
+                }
+            }
+        ],
+        "estimatedDuration": 30,
+        "difficulty": "intermediate",
+        "createdAt": "2023-01-01"
+    }]}
+
+
+# --- Finance ---
+
+@fixture
+def finance_completed():
+    """A completed audit with its report; Finance opens on The Blueprint."""
+    return {
+        "finance-audit-v2": {
+            "version": "2.0",
+            "status": "completed",
+            "monthlyIncome": 5000,
+            "categories": [
+                {"id": "c1", "name": "Housing", "subcategories": [{"id": "s1", "name": "Rent", "amount": 2000}]}
+            ],
+            "flags": [],
+            "resolutions": [],
+            "lastUpdated": "2024-01-01T00:00:00.000Z"
+        },
+        "finance-report-v2": {
+            "version": "2.0",
+            "executiveSummary": "You are doing okay.",
+            "spendingAnalysis": [
+                {"categoryId": "c1", "categoryName": "Housing", "totalSpent": 2000, "aiSummary": "High.", "healthScore": 5}
+            ],
+            "proposedBudget": [
+                {"categoryId": "c1", "categoryName": "Housing", "allocatedAmount": 1800, "subcategories": []}
+            ],
+            "moneyManagementAdvice": [
+                {"title": "Save More", "description": "Do it.", "priority": "high"}
+            ],
+            "reportGeneratedAt": "2024-01-01T00:00:00.000Z"
+        },
+    }
+
+
+@fixture
+def finance_watchdog():
+    """Completed audit with liquid assets but an empty report, for watchdog triggers."""
+    return {
+        "finance-audit-v2": {
+            "version": "2.0",
+            "lastUpdated": "2024-05-20T12:00:00Z",
+            "status": "completed",
+            "monthlyIncome": 5000,
+            "liquidAssets": 1000,
+            "categories": [
+                {"id": "1", "name": "Food", "subcategories": []}
+            ],
+            "flags": [],
+            "resolutions": []
+        },
+        "finance-report-v2": {
+            "executiveSummary": "test",
+            "spendingAnalysis": [],
+            "proposedBudget": [],
+            "moneyManagementAdvice": [],
+            "reportGeneratedAt": "2024-05-20T12:00:00Z",
+            "version": "2.0"
+        },
+    }
+
+
+@fixture
+def finance_data_entry():
+    """Audit in data entry; Finance opens on the Expense Ledger."""
+    return {"finance-audit-v2": {
+        "version": "2.0",
+        "lastUpdated": "2024-01-01T00:00:00.000Z",
+        "status": "data_entry",
+        "monthlyIncome": 5000,
+        "categories": [
+            {
+                "id": "cat-1",
+                "name": "Housing",
+                "subcategories": [
+                    {"id": "sub-1", "name": "Rent", "amount": 2500},
+                    {"id": "sub-2", "name": "Utilities", "amount": 150}
+                ]
+            },
+            {
+                "id": "cat-2",
+                "name": "Food",
+                "subcategories": [
+                    {"id": "sub-3", "name": "Groceries", "amount": 600},
+                    {"id": "sub-4", "name": "Dining", "amount": None}
+                ]
+            }
+        ],
+        "flags": [],
+        "resolutions": []
+    }}
+
+
+@fixture
+def finance_intake():
+    """Audit not started yet; Finance opens on System Offline / Intake Form."""
+    return {"finance-audit-v2": {
+        "version": "2.0",
+        "lastUpdated": "2024-01-01T00:00:00.000Z",
+        "status": "intake",
+        "monthlyIncome": None,
+        "categories": [],
+        "flags": [],
+        "resolutions": []
+    }}
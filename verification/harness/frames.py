@@ -0,0 +1,46 @@
+"""Frame pacing probe built on requestAnimationFrame.
+
+``sample_frames(page, dwell_ms)`` leaves the page alone for ``dwell_ms`` and
+records the interval between consecutive animation frames. A frame that
+takes longer than one refresh interval means the compositor had nothing new
+to show: ``round(interval / budget) - 1`` frames were dropped. The summary
+reports FPS, the share of dropped frames, and the worst and p95 frame times.
+"""
+
+DEFAULT_REFRESH_HZ = 60
+
+FRAMES_JS = """
+async (ms) => {
+  const frame = () => new Promise(requestAnimationFrame)
+  const intervals = []
+  let last = await frame()
+  const end = last + ms
+  while (last < end) {
+    const now = await frame()
+    intervals.push(now - last)
+    last = now
+  }
+  return intervals
+}
+"""
+
+
+def frame_stats(intervals, refresh_hz=DEFAULT_REFRESH_HZ) -> dict:
+    """Summarise rAF ``intervals`` (ms) against a ``refresh_hz`` display."""
+    if not intervals:
+        return {"frames": 0, "fps": None, "droppedPct": None, "worstMs": None, "p95Ms": None}
+    budget = 1000 / refresh_hz
+    dropped = sum(max(0, round(i / budget) - 1) for i in intervals)
+    ordered = sorted(intervals)
+    return {
+        "frames": len(intervals),
+        "fps": round(1000 * len(intervals) / sum(intervals), 1),
+        "droppedPct": round(100 * dropped / (len(intervals) + dropped), 2),
+        "worstMs": round(ordered[-1], 1),
+        "p95Ms": round(ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))], 1),
+    }
+
+
+def sample_frames(page, dwell_ms, refresh_hz=DEFAULT_REFRESH_HZ) -> dict:
+    """Watch ``page`` for ``dwell_ms`` and return ``frame_stats`` for that window."""
+    return frame_stats(page.evaluate(FRAMES_JS, dwell_ms), refresh_hz)
@@ -0,0 +1,52 @@
+"""JS heap and DOM counters over CDP, for leak hunting.
+
+``MemorySampler(page).sample()`` forces a full garbage collection and then
+reads the page's live JS heap and its DOM node and event listener counts.
+Memory that survives a forced GC is actually retained, so differences
+between samples show real growth and not collector timing.
+"""
+
+# CDP counter -> sample field.
+_COUNTERS = {"nodes": "nodes", "jsEventListeners": "listeners", "documents": "documents"}
+
+
+class MemorySampler:
+    def __init__(self, page):
+        self._cdp = page.context.new_cdp_session(page)
+        self._cdp.send("Performance.enable")
+
+    def collect_garbage(self):
+        # Two passes: the first can leave objects that only become
+        # unreachable once finalizers and weak callbacks have run.
+        self._cdp.send("HeapProfiler.collectGarbage")
+        self._cdp.send("HeapProfiler.collectGarbage")
+
+    def sample(self) -> dict:
+        """``{"heapKB", "nodes", "listeners", "documents"}`` after a forced GC."""
+        self.collect_garbage()
+        metrics = {m["name"]: m["value"] for m in self._cdp.send("Performance.getMetrics")["metrics"]}
+        counters = self._cdp.send("Memory.getDOMCounters")
+        return {
+            "heapKB": round(metrics["JSHeapUsedSize"] / 1024, 1),
+            **{field: counters[name] for name, field in _COUNTERS.items()},
+        }
+
+    def close(self):
+        self._cdp.detach()
+
+
+def growth_per_cycle(samples, key) -> float:
+    """Least-squares slope of ``key`` across consecutive samples.
+
+    A slope ignores a one-off jump (a cache filling up once) far better than
+    ``(last - first) / n`` does, while steady per-cycle growth shows through.
+    """
+    ys = [s[key] for s in samples]
+    n = len(ys)
+    if n < 2:
+        return 0.0
+    mean_x = (n - 1) / 2
+    mean_y = sum(ys) / n
+    num = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(ys))
+    den = sum((x - mean_x) ** 2 for x in range(n))
+    return num / den
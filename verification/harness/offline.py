@@ -0,0 +1,243 @@
+"""Offline stand-ins for the app's network dependencies.
+
+``use_offline(page)`` makes a context independent of the internet:
+
+* MediaPipe Pose assets that SwingVideoProcessor loads from cdn.jsdelivr.net
+  are served from disk (``LIS_MEDIAPIPE_DIR``, default
+  ``node_modules/@mediapipe/pose``) with immutable caching headers and ETags.
+* Gemini REST calls (``generateContent`` / ``streamGenerateContent``) and the
+  ``window.spark`` global are answered by ``MockLLM``. Responses come from a
+  Python responder and are delayed and chunked in the page, so the time to
+  first byte and the streaming cadence are deterministic and configurable.
+
+``RunOptions(offline=True)`` (``run.py --offline``) installs the defaults on
+every scenario. A scenario may call ``use_offline`` again to swap in its own
+``MockLLM``.
+"""
+
+import hashlib
+import mimetypes
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+from weakref import WeakKeyDictionary
+
+from . import config
+
+MEDIAPIPE_URL = "https://cdn.jsdelivr.net/npm/@mediapipe/pose/"
+GEMINI_HOST = "generativelanguage.googleapis.com"
+GEMINI_ROUTE = f"**://{GEMINI_HOST}/**"
+
+_CONTENT_TYPES = {
+    ".wasm": "application/wasm",
+    ".js": "text/javascript",
+    ".data": "application/octet-stream",
+    ".tflite": "application/octet-stream",
+    ".binarypb": "application/octet-stream",
+}
+
+
+def mediapipe_dir() -> Path:
+    return Path(os.environ.get("LIS_MEDIAPIPE_DIR", config.REPO_ROOT / "node_modules" / "@mediapipe" / "pose"))
+
+
+class AssetServer:
+    """Route handler serving ``url_prefix`` from ``root`` with HTTP caching headers.
+
+    Files are read once per process. Playwright routing bypasses the browser's
+    HTTP cache, so ``If-None-Match`` revalidation is answered here with 304.
+    """
+
+    _files: dict = {}
+
+    def __init__(self, url_prefix: str, root: Path):
+        self.url_prefix = url_prefix
+        self.root = root.resolve()
+        self.served = {"hits": 0, "notModified": 0, "missing": 0, "bytes": 0}
+
+    def _load(self, path: Path):
+        if path not in self._files:
+            body = path.read_bytes()
+            etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+            self._files[path] = (body, etag)
+        return self._files[path]
+
+    def response(self, request) -> dict:
+        """Keyword arguments for ``route.fulfill`` answering ``request``."""
+        relative = request.url[len(self.url_prefix):].split("?")[0]
+        path = (self.root / relative).resolve()
+        if not path.is_file() or self.root not in path.parents:
+            self.served["missing"] += 1
+            return {"status": 404, "body": f"{relative} is not vendored in {self.root}"}
+
+        body, etag = self._load(path)
+        headers = {
+            "cache-control": "public, max-age=31536000, immutable",
+            "etag": etag,
+            "access-control-allow-origin": "*",
+            "content-type": _CONTENT_TYPES.get(path.suffix)
+            or mimetypes.guess_type(path.name)[0]
+            or "application/octet-stream",
+        }
+        if request.headers.get("if-none-match") == etag:
+            self.served["notModified"] += 1
+            return {"status": 304, "headers": headers}
+        self.served["hits"] += 1
+        self.served["bytes"] += len(body)
+        return {"status": 200, "headers": headers, "body": body}
+
+    def handle(self, route):
+        route.fulfill(**self.response(route.request))
+
+    async def handle_async(self, route):
+        await route.fulfill(**self.response(route.request))
+
+
+@dataclass
+class MockLLM:
+    """Deterministic LLM answers with configurable timing.
+
+    ``responder(prompt) -> text`` picks the answer (default: ``text``).
+    ``latency_ms`` is the time to the first byte. Streams are split into
+    ``chunk_chars``-sized pieces sent ``chunk_ms`` apart.
+    """
+
+    text: str = "Mock response"
+    responder: Optional[Callable[[str], str]] = None
+    latency_ms: float = 300
+    chunk_ms: float = 40
+    chunk_chars: int = 24
+
+    def respond(self, prompt: str) -> dict:
+        return {
+            "text": self.responder(prompt) if self.responder else self.text,
+            "latencyMs": self.latency_ms,
+            "chunkMs": self.chunk_ms,
+            "chunkChars": self.chunk_chars,
+        }
+
+
+MOCK_LLM_JS = r"""
+(() => {
+  const GEMINI_HOST = '%s'
+  const sleep = ms => new Promise(r => setTimeout(r, ms))
+  const ask = prompt => window.__lisLLM(prompt)
+  const stats = (window.__lisLLMStats = { calls: 0, streams: 0, chunks: 0 })
+
+  const promptOf = body => {
+    try {
+      const parsed = JSON.parse(body)
+      return (parsed.contents ?? []).flatMap(c => c.parts ?? []).map(p => p.text ?? '').join('\n')
+    } catch { return String(body ?? '') }
+  }
+  const candidate = text => ({
+    candidates: [{ content: { role: 'model', parts: [{ text }] }, finishReason: 'STOP', index: 0 }],
+    usageMetadata: { promptTokenCount: 0, candidatesTokenCount: Math.ceil(text.length / 4) },
+  })
+  const pieces = (text, size) => {
+    const out = []
+    for (let i = 0; i < text.length; i += size) out.push(text.slice(i, i + size))
+    return out.length ? out : ['']
+  }
+
+  const realFetch = window.fetch.bind(window)
+  window.fetch = async (input, init = {}) => {
+    const url = typeof input === 'string' ? input : input.url
+    if (!url.includes(GEMINI_HOST)) return realFetch(input, init)
+
+    stats.calls++
+    const body = init.body ?? (input instanceof Request ? await input.clone().text() : '')
+    const answer = await ask(promptOf(body))
+    await sleep(answer.latencyMs)
+
+    if (!url.includes(':streamGenerateContent')) {
+      return new Response(JSON.stringify(candidate(answer.text)), {
+        status: 200, headers: { 'content-type': 'application/json' },
+      })
+    }
+
+    stats.streams++
+    const encoder = new TextEncoder()
+    const stream = new ReadableStream({
+      async start(controller) {
+        const parts = pieces(answer.text, answer.chunkChars)
+        for (let i = 0; i < parts.length; i++) {
+          if (i) await sleep(answer.chunkMs)
+          stats.chunks++
+          controller.enqueue(encoder.encode(`data: ${JSON.stringify(candidate(parts[i]))}\r\n\r\n`))
+        }
+        controller.close()
+      },
+    })
+    return new Response(stream, { status: 200, headers: { 'content-type': 'text/event-stream' } })
+  }
+
+  const kv = new Map()
+  window.spark = {
+    llmPrompt: (strings, ...values) => strings.reduce((s, str, i) => s + str + (values[i] ?? ''), ''),
+    llm: async prompt => {
+      const answer = await ask(prompt)
+      await sleep(answer.latencyMs)
+      return answer.text
+    },
+    kv: {
+      get: async key => kv.get(key),
+      set: async (key, value) => { kv.set(key, value) },
+      delete: async key => { kv.delete(key) },
+      keys: async () => [...kv.keys()],
+    },
+  }
+  // Older call sites use spark.llm.generate / spark.llm.stream.
+  window.spark.llm.generate = async prompt => ({ text: await window.spark.llm(prompt) })
+  window.spark.llm.stream = async prompt => window.spark.llm(prompt)
+})()
+""" % GEMINI_HOST
+
+
+class StandIns:
+    """The stand-ins installed on one context; ``llm`` can be swapped at any time."""
+
+    def __init__(self, llm: MockLLM, mediapipe: bool):
+        self.llm = llm
+        self.mediapipe = AssetServer(MEDIAPIPE_URL, mediapipe_dir()) if mediapipe else None
+
+    def _answer(self, source, prompt):
+        return self.llm.respond(prompt)
+
+    def install(self, context):
+        context.expose_binding("__lisLLM", self._answer)
+        context.add_init_script(MOCK_LLM_JS)
+        # Anything else aimed at the Gemini host (e.g. from a worker) fails fast.
+        context.route(GEMINI_ROUTE, lambda route: route.abort("internetdisconnected"))
+        if self.mediapipe:
+            context.route(f"{MEDIAPIPE_URL}**", self.mediapipe.handle)
+
+    async def install_async(self, context):
+        await context.expose_binding("__lisLLM", self._answer)
+        await context.add_init_script(MOCK_LLM_JS)
+        await context.route(GEMINI_ROUTE, lambda route: route.abort("internetdisconnected"))
+        if self.mediapipe:
+            await context.route(f"{MEDIAPIPE_URL}**", self.mediapipe.handle_async)
+
+
+_installed: "WeakKeyDictionary" = WeakKeyDictionary()
+
+
+def stand_ins_for(context, llm: Optional[MockLLM], mediapipe: bool):
+    """Return ``(stand_ins, created)``; a context gets at most one set."""
+    stand_ins = _installed.get(context)
+    if stand_ins is None:
+        stand_ins = _installed[context] = StandIns(llm or MockLLM(), mediapipe)
+        return stand_ins, True
+    if llm is not None:
+        stand_ins.llm = llm
+    return stand_ins, False
+
+
+def use_offline(page, llm: Optional[MockLLM] = None, mediapipe: bool = True) -> StandIns:
+    """Install the stand-ins on ``page``'s context (before navigating); idempotent."""
+    stand_ins, created = stand_ins_for(page.context, llm, mediapipe)
+    if created:
+        stand_ins.install(page.context)
+    return stand_ins
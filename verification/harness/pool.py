@@ -0,0 +1,70 @@
+"""A pool of worker processes, each holding one warm Chromium instance.
+
+Playwright's sync API is bound to the thread that started it, so parallelism
+comes from processes: every worker launches its browser once in the pool
+initializer and then runs scenarios one after another, each in a new context.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.util import Finalize
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+from . import registry
+from .execution import RunOptions, ScenarioResult, execute
+
+# Per-process state, populated by _init_worker.
+_worker = {}
+
+
+def _close_worker():
+    browser = _worker.pop("browser", None)
+    playwright = _worker.pop("playwright", None)
+    if browser is not None:
+        browser.close()
+    if playwright is not None:
+        playwright.stop()
+
+
+def _launch(options: RunOptions):
+    _worker["browser"] = _worker["playwright"].chromium.launch(**options.launch_kwargs())
+
+
+def _init_worker(options: RunOptions):
+    _worker["playwright"] = sync_playwright().start()
+    _launch(options)
+    # atexit does not run in pool workers; multiprocessing finalizers do.
+    Finalize(None, _close_worker, exitpriority=10)
+
+
+def _run_task(path: str, name: str, options: RunOptions) -> ScenarioResult:
+    registry.load_script(Path(path))
+    if not _worker["browser"].is_connected():
+        _launch(options)
+    return execute(registry.get(name), _worker["playwright"], _worker["browser"], options)
+
+
+class BrowserPool:
+    def __init__(self, workers: int = 0, options: RunOptions = RunOptions()):
+        self.workers = workers or os.cpu_count() or 1
+        self.options = options
+        self._executor = None
+
+    def __enter__(self):
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.options,),
+        )
+        return self
+
+    def __exit__(self, *exc):
+        self._executor.shutdown(wait=True)
+        self._executor = None
+
+    def submit(self, entry: registry.Scenario):
+        return self._executor.submit(_run_task, str(entry.path), entry.name, self.options)
@@ -0,0 +1,197 @@
+"""Seeded synthetic golf-swing pose data.
+
+Produces ``SwingPoseData[]`` (src/lib/types.ts) shaped like SwingVideoProcessor
+output: 33 MediaPipe landmarks per frame in normalised screen space, plus
+hip-centred world landmarks in metres. A face-on stick figure turns its hips
+and shoulders and swings its arms through address -> top -> impact -> finish,
+with Gaussian jitter and per-landmark visibility dropout on top.
+"""
+
+import math
+import random
+
+# MediaPipe Pose indices
+NOSE = 0
+LEFT_SHOULDER, RIGHT_SHOULDER = 11, 12
+LEFT_HIP, RIGHT_HIP = 23, 24
+
+# Address posture in metres, hip centre at the origin, y pointing down (screen
+# convention), z towards the camera.
+_ADDRESS = [
+    (0.00, -0.62, -0.10),   # 0 nose
+    (0.02, -0.65, -0.09),   # 1 left eye inner
+    (0.03, -0.65, -0.09),   # 2 left eye
+    (0.04, -0.65, -0.08),   # 3 left eye outer
+    (-0.02, -0.65, -0.09),  # 4 right eye inner
+    (-0.03, -0.65, -0.09),  # 5 right eye
+    (-0.04, -0.65, -0.08),  # 6 right eye outer
+    (0.07, -0.63, -0.02),   # 7 left ear
+    (-0.07, -0.63, -0.02),  # 8 right ear
+    (0.02, -0.58, -0.09),   # 9 mouth left
+    (-0.02, -0.58, -0.09),  # 10 mouth right
+    (0.19, -0.48, 0.00),    # 11 left shoulder
+    (-0.19, -0.48, 0.00),   # 12 right shoulder
+    (0.12, -0.25, -0.12),   # 13 left elbow
+    (-0.12, -0.25, -0.12),  # 14 right elbow
+    (0.03, -0.05, -0.25),   # 15 left wrist
+    (-0.03, -0.05, -0.25),  # 16 right wrist
+    (0.02, 0.00, -0.28),    # 17 left pinky
+    (-0.02, 0.00, -0.28),   # 18 right pinky
+    (0.01, 0.01, -0.29),    # 19 left index
+    (-0.01, 0.01, -0.29),   # 20 right index
+    (0.03, -0.02, -0.27),   # 21 left thumb
+    (-0.03, -0.02, -0.27),  # 22 right thumb
+    (0.10, 0.00, 0.00),     # 23 left hip
+    (-0.10, 0.00, 0.00),    # 24 right hip
+    (0.14, 0.42, -0.05),    # 25 left knee
+    (-0.14, 0.42, -0.05),   # 26 right knee
+    (0.17, 0.85, 0.02),     # 27 left ankle
+    (-0.17, 0.85, 0.02),    # 28 right ankle
+    (0.18, 0.89, 0.06),     # 29 left heel
+    (-0.18, 0.89, 0.06),    # 30 right heel
+    (0.20, 0.90, -0.10),    # 31 left foot index
+    (-0.20, 0.90, -0.10),   # 32 right foot index
+]
+
+_HEAD = range(0, 11)
+_ARMS = range(13, 23)
+_KNEES = (25, 26)
+_HIPS = (LEFT_HIP, RIGHT_HIP)
+
+# (progress, shoulder turn deg, hip turn deg, arm swing deg). The timing lines up
+# with the phase windows detectSwingPhase() uses in swing-analyzer.ts.
+_KEYFRAMES = [
+    (0.00, 0, 0, 0),
+    (0.10, 0, 0, 0),
+    (0.42, 90, 45, 130),
+    (0.45, 92, 46, 135),
+    (0.55, -20, -40, 0),
+    (0.75, -100, -60, -140),
+    (1.00, -105, -62, -145),
+]
+
+# Screen projection: metres -> normalised coordinates.
+_SCALE = 0.35
+_ORIGIN = (0.5, 0.45)
+
+
+def _smoothstep(t):
+    return t * t * (3 - 2 * t)
+
+
+def _pose_angles(progress):
+    for (p0, *a0), (p1, *a1) in zip(_KEYFRAMES, _KEYFRAMES[1:]):
+        if progress <= p1:
+            t = _smoothstep((progress - p0) / (p1 - p0)) if p1 > p0 else 1.0
+            return [math.radians(x0 + (x1 - x0) * t) for x0, x1 in zip(a0, a1)]
+    return [math.radians(a) for a in _KEYFRAMES[-1][1:]]
+
+
+def _turn(point, angle):
+    """Rotate about the vertical (spine) axis."""
+    x, y, z = point
+    c, s = math.cos(angle), math.sin(angle)
+    return (x * c + z * s, y, -x * s + z * c)
+
+
+def _swing(point, angle, centre):
+    """Rotate in the frontal plane around ``centre`` (arms going up and over)."""
+    x, y, z = point
+    cx, cy = centre
+    c, s = math.cos(angle), math.sin(angle)
+    return (cx + (x - cx) * c - (y - cy) * s, cy + (x - cx) * s + (y - cy) * c, z)
+
+
+def _skeleton(progress):
+    shoulder_turn, hip_turn, arm_swing = _pose_angles(progress)
+    shoulder_centre = (0.0, -0.48)
+    points = []
+    for i, p in enumerate(_ADDRESS):
+        if i in _ARMS:
+            p = _turn(_swing(p, arm_swing, shoulder_centre), shoulder_turn)
+        elif i in _HEAD:
+            # Head stays quiet; it only follows a fraction of the turn.
+            p = _turn(p, shoulder_turn * 0.1)
+        elif i in (LEFT_SHOULDER, RIGHT_SHOULDER):
+            p = _turn(p, shoulder_turn)
+        elif i in _HIPS:
+            p = _turn(p, hip_turn)
+        elif i in _KNEES:
+            p = _turn(p, hip_turn * 0.3)
+        points.append(p)
+    return points
+
+
+def generate_swing(frames=240, fps=240.0, seed=0, noise=0.004, dropout=0.02, world=True, precision=5):
+    """Return ``frames`` SwingPoseData dicts for one swing recorded at ``fps``.
+
+    ``noise`` is the jitter sigma in normalised screen units (world landmarks
+    get the same jitter in metres, scaled). ``dropout`` is the per-landmark
+    probability of an occluded point: low visibility and extra jitter, as
+    MediaPipe reports for hands behind the body.
+    """
+    rng = random.Random(seed)
+    out = []
+    for f in range(frames):
+        progress = f / max(frames - 1, 1)
+        landmarks, world_landmarks = [], []
+        for x, y, z in _skeleton(progress):
+            if rng.random() < dropout:
+                visibility, jitter = rng.uniform(0.0, 0.3), noise * 5
+            else:
+                visibility, jitter = rng.uniform(0.85, 0.99), noise
+            dx, dy, dz = (rng.gauss(0, jitter) for _ in range(3))
+            landmarks.append({
+                "x": round(_ORIGIN[0] + x * _SCALE + dx, precision),
+                "y": round(_ORIGIN[1] + y * _SCALE + dy, precision),
+                "z": round(z * _SCALE + dz, precision),
+                "visibility": round(visibility, 3),
+            })
+            if world:
+                world_landmarks.append({
+                    "x": round(x + dx / _SCALE, precision),
+                    "y": round(y + dy / _SCALE, precision),
+                    "z": round(z + dz / _SCALE, precision),
+                    "visibility": round(visibility, 3),
+                })
+        frame = {"timestamp": round(f / fps, 6), "landmarks": landmarks}
+        if world:
+            frame["worldLandmarks"] = world_landmarks
+        out.append(frame)
+    return out
+
+
+def pack_frames(frames):
+    """Flatten frames into float arrays for cheap transfer into the page.
+
+    Unpack with ``UNPACK_FRAMES_JS``; 33 landmarks x (x, y, z, visibility) per frame.
+    """
+    packed = {"t": [f["timestamp"] for f in frames], "lm": [], "wl": None}
+    for f in frames:
+        for lm in f["landmarks"]:
+            packed["lm"].extend((lm["x"], lm["y"], lm["z"], lm["visibility"]))
+    if frames and "worldLandmarks" in frames[0]:
+        packed["wl"] = []
+        for f in frames:
+            for lm in f["worldLandmarks"]:
+                packed["wl"].extend((lm["x"], lm["y"], lm["z"], lm["visibility"]))
+    return packed
+
+
+UNPACK_FRAMES_JS = """
+(packed) => {
+  const landmarksAt = (flat, offset) => {
+    const out = new Array(33)
+    for (let i = 0; i < 33; i++) {
+      const o = offset + i * 4
+      out[i] = { x: flat[o], y: flat[o + 1], z: flat[o + 2], visibility: flat[o + 3] }
+    }
+    return out
+  }
+  return packed.t.map((timestamp, f) => {
+    const frame = { timestamp, landmarks: landmarksAt(packed.lm, f * 132) }
+    if (packed.wl) frame.worldLandmarks = landmarksAt(packed.wl, f * 132)
+    return frame
+  })
+}
+"""
@@ -0,0 +1,152 @@
+"""CPU profiles and Performance traces around named scenario steps.
+
+    with profile("start_session"):
+        page.get_by_text("START SESSION").click()
+        page.wait_for_selector("text=Target Reps")
+
+Inside the block the page's V8 sampling profiler runs over CDP, and a
+Chromium Performance trace is recorded for the browser. On exit the harness
+writes these files under ``reports/profiles/<scenario>/``:
+
+* ``<step>.cpuprofile``, which opens in the DevTools Performance panel or
+  speedscope;
+* ``<step>.trace.json``, which loads in DevTools or https://ui.perfetto.dev.
+
+It also adds a top-N self-time summary to the scenario's report entry
+(``profiles``). Async scenarios use ``harness.aio.profile`` instead. Only one
+trace can run per browser at a time, so concurrent steps are profiled
+without one.
+"""
+
+import json
+import re
+from contextlib import contextmanager
+from pathlib import Path
+
+from . import config
+from .execution import _active
+
+PROFILES_DIR = config.REPORTS_DIR / "profiles"
+DEFAULT_TOP = 15
+SAMPLING_INTERVAL_US = 100
+
+# Synthetic nodes that are not JavaScript the app can act on.
+_IGNORED = {"(idle)", "(root)"}
+
+
+def self_time_summary(cpu_profile: dict, top: int = DEFAULT_TOP) -> dict:
+    """Aggregate self time per function and return the ``top`` most expensive."""
+    nodes = {n["id"]: n for n in cpu_profile["nodes"]}
+    samples = cpu_profile.get("samples", [])
+    deltas = cpu_profile.get("timeDeltas", [])
+
+    # Sample i lasts until sample i + 1; the last one has no known end.
+    self_us = {}
+    for i, node_id in enumerate(samples[:-1]):
+        self_us[node_id] = self_us.get(node_id, 0) + deltas[i + 1]
+
+    functions = {}
+    for node_id, us in self_us.items():
+        frame = nodes[node_id]["callFrame"]
+        name = frame.get("functionName") or "(anonymous)"
+        if name in _IGNORED:
+            continue
+        key = (name, frame.get("url", ""), frame.get("lineNumber", -1))
+        functions[key] = functions.get(key, 0) + us
+
+    total_us = (cpu_profile["endTime"] - cpu_profile["startTime"]) or 1
+    busy_us = sum(functions.values())
+    ranked = sorted(functions.items(), key=lambda kv: kv[1], reverse=True)[:top]
+    return {
+        "wallMs": round(total_us / 1000, 1),
+        "busyMs": round(busy_us / 1000, 1),
+        "top": [
+            {
+                "function": name,
+                "url": _short_url(url),
+                "line": line + 1 if line >= 0 else None,
+                "selfMs": round(us / 1000, 2),
+                "pct": round(100 * us / total_us, 1),
+            }
+            for (name, url, line), us in ranked
+        ],
+    }
+
+
+def _short_url(url: str) -> str:
+    """Strip origin and Vite's ?v= / ?t= cache busters."""
+    return re.sub(r"^https?://[^/]+", "", url).split("?")[0]
+
+
+def step_paths(scenario_name: str, step: str, taken) -> tuple[Path, Path]:
+    """Unique file stem per step; repeated step names get -2, -3..."""
+    slug = re.sub(r"[^A-Za-z0-9_.-]+", "-", step).strip("-") or "step"
+    stem, n = slug, 1
+    while stem in taken:
+        n += 1
+        stem = f"{slug}-{n}"
+    directory = PROFILES_DIR / scenario_name
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / f"{stem}.cpuprofile", directory / f"{stem}.trace.json"
+
+
+def store(profiles: dict, step: str, cpu_profile: dict, cpu_path: Path, trace_path, top: int) -> dict:
+    cpu_path.write_text(json.dumps(cpu_profile))
+    summary = {
+        "cpuprofile": str(cpu_path.relative_to(config.REPO_ROOT)),
+        "trace": str(trace_path.relative_to(config.REPO_ROOT)) if trace_path else None,
+        **self_time_summary(cpu_profile, top),
+    }
+    profiles[cpu_path.name[: -len(".cpuprofile")]] = summary
+    return summary
+
+
+def print_summary(step: str, summary: dict):
+    from .bench import print_table
+
+    print(f"[profile] {step}: {summary['wallMs']}ms wall, {summary['busyMs']}ms on the CPU")
+    print_table(summary["top"], [
+        ("selfMs", "self ms", ".2f"),
+        ("pct", "%", ".1f"),
+        ("function", "function", "s"),
+        ("url", "source", "s"),
+        ("line", "line", "d"),
+    ])
+
+
+def scenario_target(page=None):
+    active = _active.get()
+    if active is None:
+        raise RuntimeError("profile() must run inside a harness scenario")
+    entry, default_page, profiles = active
+    return entry, page or default_page, profiles
+
+
+@contextmanager
+def profile(step: str, page=None, trace: bool = True, top: int = DEFAULT_TOP):
+    """Profile the block as ``step`` (see module docstring)."""
+    entry, page, profiles = scenario_target(page)
+    cpu_path, trace_path = step_paths(entry.name, step, profiles)
+
+    browser = page.context.browser
+    if trace and browser is not None:
+        try:
+            browser.start_tracing(page=page, path=str(trace_path), screenshots=True)
+        except Exception:
+            trace_path = None  # another trace is running in this browser
+    else:
+        trace_path = None
+
+    cdp = page.context.new_cdp_session(page)
+    cdp.send("Profiler.enable")
+    cdp.send("Profiler.setSamplingInterval", {"interval": SAMPLING_INTERVAL_US})
+    cdp.send("Profiler.start")
+    try:
+        yield
+    finally:
+        cpu_profile = cdp.send("Profiler.stop")["profile"]
+        cdp.detach()
+        if trace_path:
+            browser.stop_tracing()
+        summary = store(profiles, step, cpu_profile, cpu_path, trace_path, top)
+        print(f"[profile] {step}: {summary['busyMs']}ms on the CPU -> {summary['cpuprofile']}")
@@ -0,0 +1,77 @@
+"""Wait on the app's readiness signals instead of sleeping.
+
+The app publishes signals through ``src/lib/readiness.ts``: each one is a
+counter plus the latest detail on ``window.__readiness``. A wait records the
+counter before an action and returns as soon as it advances, so a step costs
+only as long as the app actually needs.
+"""
+
+from contextlib import contextmanager
+
+DEFAULT_TIMEOUT = 30000
+
+DOCK = 'nav[aria-label="Main Navigation"]'
+
+# Shared with the async helpers in aio.py.
+SIGNAL_STATE_JS = "s => window.__readiness?.[s] ?? null"
+SIGNAL_AFTER_JS = """([signal, detail, after]) => {
+    const entry = window.__readiness?.[signal];
+    return !!entry && entry.count > after && (detail === null || entry.detail === detail);
+}"""
+ANIMATION_IDLE_JS = "s => { window.__whenAnimationIdle(s) }"
+
+
+def signal_state(page, signal):
+    """Return ``{"count", "detail", "at"}`` for ``signal``, or None if never emitted."""
+    return page.evaluate(SIGNAL_STATE_JS, signal)
+
+
+def signal_count(page, signal) -> int:
+    state = signal_state(page, signal)
+    return state["count"] if state else 0
+
+
+def wait_for_signal(page, signal, detail=None, after=0, timeout=DEFAULT_TIMEOUT):
+    """Wait until ``signal`` has been emitted more than ``after`` times.
+
+    If ``detail`` is given, the most recent emission must also carry it.
+    """
+    page.wait_for_function(SIGNAL_AFTER_JS, arg=[signal, detail, after], timeout=timeout)
+
+
+@contextmanager
+def expect_signal(page, signal, detail=None, timeout=DEFAULT_TIMEOUT):
+    """Wait for a fresh ``signal`` emission caused by the actions in the block."""
+    before = signal_count(page, signal)
+    yield
+    wait_for_signal(page, signal, detail, after=before, timeout=timeout)
+
+
+def wait_for_app_ready(page, timeout=DEFAULT_TIMEOUT):
+    """Wait until the loading screen is gone and the app shell has mounted."""
+    wait_for_signal(page, "app-ready", timeout=timeout)
+
+
+def open_module(page, module, timeout=DEFAULT_TIMEOUT):
+    """Click ``module`` in the FloatingDock and wait until it has mounted."""
+    wait_for_app_ready(page, timeout)
+    button = page.locator(DOCK).get_by_label(module, exact=True)
+    state = signal_state(page, "module-mounted")
+    if state and state["detail"] == module:
+        # Already active: clicking does not remount, so there is nothing to wait for.
+        button.click()
+        return
+    with expect_signal(page, "module-mounted", module, timeout):
+        button.click()
+
+
+def fill_search(page, locator, text, timeout=DEFAULT_TIMEOUT):
+    """Type into a search box that reports ``search-settled`` and wait for the list to update."""
+    with expect_signal(page, "search-settled", text, timeout):
+        locator.fill(text)
+
+
+def wait_for_animation_idle(page, selector="#main-content", timeout=DEFAULT_TIMEOUT):
+    """Wait until nothing under ``selector`` is animating (see ``whenAnimationIdle``)."""
+    with expect_signal(page, "animation-idle", selector, timeout):
+        page.evaluate(ANIMATION_IDLE_JS, selector)
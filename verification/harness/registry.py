@@ -0,0 +1,105 @@
+"""Scenario registration and discovery.
+
+A verify_* script marks its entry point with ``@scenario``. Importing the
+script registers it; the runner imports every script matched by
+``config.DISCOVERY_GLOBS`` and collects what was registered.
+"""
+
+import importlib.util
+import inspect
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from . import config
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    func: Callable
+    path: Path
+    # Keyword arguments for browser.new_context(); merged over `device` if set.
+    context: dict = field(default_factory=dict)
+    # Name of a playwright device descriptor, e.g. "iPhone 14 Pro Max".
+    device: Optional[str] = None
+    # Storage fixtures seeded before the first navigation (see storage.py).
+    fixtures: tuple = ()
+    tags: tuple = ()
+
+    @property
+    def is_async(self) -> bool:
+        """Coroutine scenarios get an async-API page and run on the event loop (see aio.py)."""
+        return inspect.iscoroutinefunction(self.func)
+
+
+_REGISTRY: dict[str, Scenario] = {}
+
+
+def scenario(func=None, *, name=None, context=None, device=None, fixtures=(), tags=()):
+    """Register ``func(page)`` (or ``async def func(page)``) as a harness scenario.
+
+    The function is returned unchanged so scripts can still call it directly.
+    """
+
+    def decorate(fn):
+        entry = Scenario(
+            name=name or fn.__name__,
+            func=fn,
+            path=Path(sys.modules[fn.__module__].__file__).resolve(),
+            context=dict(context or {}),
+            device=device,
+            fixtures=tuple(fixtures),
+            tags=tuple(tags),
+        )
+        _REGISTRY[entry.name] = entry
+        fn.__scenario__ = entry
+        return fn
+
+    if func is not None:
+        return decorate(func)
+    return decorate
+
+
+def _module_name(path: Path) -> str:
+    rel = path.relative_to(config.REPO_ROOT).with_suffix("")
+    return "verify_scripts." + ".".join(rel.parts)
+
+
+def load_script(path: Path) -> list[Scenario]:
+    """Import a verify_* script and return the scenarios it registered."""
+    path = Path(path).resolve()
+    module_name = _module_name(path)
+    if module_name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+    return [s for s in _REGISTRY.values() if s.path == path]
+
+
+def discover(root: Path = config.REPO_ROOT):
+    """Find every verify_* script under ``root``.
+
+    Returns ``(scenarios, errors)`` where ``errors`` maps a script path to the
+    exception raised while importing it.
+    """
+    paths = sorted({p.resolve() for pattern in config.DISCOVERY_GLOBS for p in root.glob(pattern)})
+    scenarios, errors = [], {}
+    for path in paths:
+        if "node_modules" in path.parts:
+            continue
+        try:
+            scenarios.extend(load_script(path))
+        except Exception as e:
+            errors[path] = e
+    return scenarios, errors
+
+
+def get(name: str) -> Scenario:
+    return _REGISTRY[name]
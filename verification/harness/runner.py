@@ -0,0 +1,444 @@
+"""Discover verify_* scenarios and run them across the browser pool."""
+
+import argparse
+import fnmatch
+import json
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import as_completed
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+
+from . import aio, baseline, config, coverage, devices, profiling, registry, server, stats, vitals
+from .execution import RunOptions, ScenarioResult, execute
+
+# Benchmarks time themselves; they only run when asked for (--tags bench).
+BENCH_TAG = "bench"
+
+
+@dataclass
+class RunReport:
+    results: list
+    wall_time_s: float
+    workers: int
+    load_errors: dict = field(default_factory=dict)
+    target: str = "dev"
+    base_url: str = ""
+    # Device profile every scenario ran under (see devices.py), or None.
+    device: str = None
+    # Scenario names not run because they cannot work against this target.
+    skipped: list = field(default_factory=list)
+    # Measured iterations per scenario (warm-up runs are not in ``results``).
+    repeat: int = 1
+
+    @property
+    def scenario_time_s(self) -> float:
+        return sum(r.duration_s for r in self.results)
+
+    @property
+    def ok(self) -> bool:
+        return not self.load_errors and all(r.status == "passed" for r in self.results)
+
+    def to_dict(self) -> dict:
+        return {
+            "generatedAt": datetime.now().isoformat(timespec="seconds"),
+            "target": self.target,
+            "device": self.device,
+            "baseUrl": self.base_url,
+            "workers": self.workers,
+            "repeat": self.repeat,
+            "wallTimeS": round(self.wall_time_s, 3),
+            "scenarioTimeS": round(self.scenario_time_s, 3),
+            "results": [r.to_dict() for r in self.results],
+            "loadErrors": {str(k): str(v) for k, v in self.load_errors.items()},
+            "skipped": self.skipped,
+            "steps": stats.describe_steps(self.results) if self.repeat > 1 else {},
+        }
+
+    def write(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2))
+        return path
+
+    def print_summary(self):
+        width = max([len(r.name) for r in self.results] + [8])
+        for r in sorted(self.results, key=lambda r: r.duration_s, reverse=True):
+            line = f"  {r.name:<{width}}  {r.status:<6}  {r.duration_s:7.2f}s"
+            print(line + (f"  {r.error}" if r.error else ""))
+        for path, error in self.load_errors.items():
+            print(f"  [load error] {path}: {error}")
+        for name in self.skipped:
+            print(f"  [skipped] {name}: {server.DEV_ONLY_TAG}, not run against {self.target}")
+        passed = sum(r.status == "passed" for r in self.results)
+        speedup = self.scenario_time_s / self.wall_time_s if self.wall_time_s else 0
+        print(
+            f"{passed}/{len(self.results)} passed | wall {self.wall_time_s:.2f}s | "
+            f"sum of scenarios {self.scenario_time_s:.2f}s | {self.workers} workers | "
+            f"x{speedup:.1f} parallel speedup"
+        )
+
+
+def select(scenarios, patterns, tags=(), exclude_tags=()):
+    """Scenarios whose name matches a glob in ``patterns``, that have one of ``tags`` and none of ``exclude_tags``.
+
+    Empty ``patterns`` or ``tags`` match everything.
+    """
+    return [
+        s for s in scenarios
+        if (not patterns or any(fnmatch.fnmatch(s.name, p) for p in patterns))
+        and (not tags or set(tags) & set(s.tags))
+        and not set(exclude_tags) & set(s.tags)
+    ]
+
+
+def _failed(entry, error) -> ScenarioResult:
+    return ScenarioResult(
+        name=entry.name,
+        path=str(entry.path.relative_to(config.REPO_ROOT)),
+        status="failed",
+        duration_s=0.0,
+        error=f"{type(error).__name__}: {error}",
+    )
+
+
+def _announce(result):
+    print(f"[{result.status}] {result.name} ({result.duration_s:.2f}s)", flush=True)
+
+
+def _run_async(entries, concurrency, options, results, announce=True):
+    """Thread target: coroutine scenarios share one event loop and one browser."""
+    finished = []
+
+    def done(result):
+        if announce:
+            _announce(result)
+        finished.append(result.name)
+        results.append(result)
+
+    try:
+        aio.run(entries, concurrency, options, on_result=done)
+    except Exception as e:
+        # An entry may be queued more than once (--repeat); fail the runs that never reported.
+        pending = [entry.name for entry in entries]
+        for name in finished:
+            pending.remove(name)
+        for entry in entries:
+            if entry.name in pending:
+                pending.remove(entry.name)
+                done(_failed(entry, e))
+
+
+def run(scenarios, workers: int = 0, options: RunOptions = RunOptions(),
+        concurrency: int = aio.DEFAULT_CONCURRENCY, repeat: int = 1, warmup: int = 0,
+        sequential: bool = False) -> RunReport:
+    """Run ``scenarios`` against one shared server for ``options.target`` (see server.py).
+
+    With ``warmup``, every scenario first runs that many times with the results
+    thrown away (cold caches, first chunk loads); then it runs ``repeat`` times.
+    ``sequential`` runs one scenario at a time, its warm-ups and repeats one
+    after another, so timings that are being measured never share the machine
+    with another run.
+    """
+    scenarios, skipped = server.runnable(scenarios, options.target)
+    if sequential:
+        batches, workers, concurrency = [[s] for s in scenarios], 1, 1
+    else:
+        batches = [scenarios] if scenarios else []
+    with server.serving(options) as options:
+        if warmup:
+            print(f"[warm-up] {warmup} round(s), results discarded", flush=True)
+        reports = []
+        for batch in batches:
+            if warmup:
+                _run([s for s in batch for _ in range(warmup)], workers, options, concurrency, announce=False)
+            reports.append(_run([s for s in batch for _ in range(repeat)], workers, options, concurrency))
+    report = RunReport(
+        [r for part in reports for r in part.results],
+        sum(part.wall_time_s for part in reports),
+        max((part.workers for part in reports), default=1),
+    )
+    report.target, report.base_url, report.device = options.target, options.base_url, options.device
+    report.skipped = [s.name for s in skipped]
+    report.repeat = repeat
+    return report
+
+
+def _run(scenarios, workers, options, concurrency, announce=True) -> RunReport:
+    """Sync scenarios go to the process pool; coroutine scenarios run alongside on an event loop."""
+    from .pool import BrowserPool
+
+    sync_entries = [s for s in scenarios if not s.is_async]
+    async_entries = [s for s in scenarios if s.is_async]
+    workers = min(workers or BrowserPool().workers, len(sync_entries)) or 1
+    results = []
+    started = time.perf_counter()
+
+    loop_thread = None
+    if async_entries:
+        loop_thread = threading.Thread(target=_run_async,
+                                       args=(async_entries, concurrency, options, results, announce))
+        loop_thread.start()
+
+    if sync_entries:
+        with BrowserPool(workers, options) as pool:
+            futures = {pool.submit(entry): entry for entry in sync_entries}
+            for future in as_completed(futures):
+                entry = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = _failed(entry, e)
+                if announce:
+                    _announce(result)
+                results.append(result)
+
+    if loop_thread is not None:
+        loop_thread.join()
+    return RunReport(results, time.perf_counter() - started, workers)
+
+
+def run_standalone(func, options: RunOptions = RunOptions()) -> ScenarioResult:
+    """Run one scenario in its own browser; used by the scripts' ``__main__`` blocks."""
+    entry = func.__scenario__
+    with server.serving(options) as options:
+        if entry.is_async:
+            result = aio.run([entry], 1, options)[0]
+        else:
+            from playwright.sync_api import sync_playwright
+
+            with sync_playwright() as p:
+                browser = p.chromium.launch(**options.launch_kwargs())
+                try:
+                    result = execute(entry, p, browser, options)
+                finally:
+                    browser.close()
+    print(f"[{result.status}] {result.name} ({result.duration_s:.2f}s)")
+    if result.error:
+        print(result.error)
+    if result.metrics:
+        print(json.dumps(result.metrics, indent=2))
+    for step, summary in result.profiles.items():
+        profiling.print_summary(step, summary)
+    if result.vitals:
+        vitals.print_by_module(vitals.by_module([result]))
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run verify_* scenarios on a warm browser pool.")
+    parser.add_argument("-k", dest="patterns", action="append", help="glob on scenario name (repeatable)")
+    parser.add_argument("--tags", metavar="TAGS", default="",
+                        help="comma-separated tags; run only scenarios that have one of them")
+    parser.add_argument("--exclude-tags", metavar="TAGS", default=None,
+                        help=f"comma-separated tags to skip (default: {BENCH_TAG}, unless named in --tags)")
+    parser.add_argument("-j", "--workers", type=int, default=0, help="worker processes (default: CPU count)")
+    parser.add_argument("-c", "--concurrency", type=int, default=aio.DEFAULT_CONCURRENCY,
+                        help="pages in flight for async scenarios (default: %(default)s)")
+    parser.add_argument("--headed", action="store_true", help="show the browser windows")
+    parser.add_argument("--list", action="store_true", help="list discovered scenarios and exit")
+    parser.add_argument("--report", type=Path, help="JSON report path (default: verification/reports/run-<time>.json)")
+    parser.add_argument("--no-vitals", action="store_true", help="skip per-navigation Web Vitals collection")
+    parser.add_argument("--offline", action="store_true", help="serve MediaPipe from disk and mock Gemini for every scenario")
+    parser.add_argument("--target", choices=(*server.TARGETS, "both"), default=None,
+                        help="dev server, production build, or both side by side (default: $LIS_TARGET or dev)")
+    parser.add_argument("--static", action="store_true", help="prod: serve dist/ from Python instead of vite preview")
+    parser.add_argument("--rebuild", action="store_true", help="prod: rebuild dist/ even if it looks up to date")
+    parser.add_argument("--repeat", type=int, default=1, help="measured runs per scenario; >1 reports step percentiles")
+    parser.add_argument("--warmup", type=int, default=None,
+                        help="discarded runs per scenario before measuring (default: 1 with --repeat, else 0)")
+    parser.add_argument("--baseline", metavar="REV",
+                        help="compare steps with the baseline stored for REV (default: newest stored ancestor)")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run's steps as HEAD's baseline")
+    parser.add_argument("--threshold", type=float, default=baseline.DEFAULT_THRESHOLD_PCT,
+                        help="p50 regression, in percent, that fails the run (default: %(default)s)")
+    parser.add_argument("--devices", metavar="NAMES",
+                        help="comma-separated device profiles to run every scenario under, or 'all' "
+                             f"({', '.join(devices.PROFILES)}; default: $LIS_DEVICE or none)")
+    parser.add_argument("--coverage", action="store_true",
+                        help="collect precise JS/CSS coverage and write ranked unused-bytes reports")
+    parser.add_argument("--coverage-compare", type=Path, metavar="DIR",
+                        help="with --coverage: print unused-byte changes against an earlier coverage report directory")
+    args = parser.parse_args(argv)
+    if args.warmup is None:
+        args.warmup = 1 if args.repeat > 1 else 0
+    tags = tuple(t for t in args.tags.split(",") if t)
+    if args.exclude_tags is None:
+        exclude_tags = tuple(t for t in (BENCH_TAG,) if t not in tags)
+    else:
+        exclude_tags = tuple(t for t in args.exclude_tags.split(",") if t)
+
+    discovered, load_errors = registry.discover()
+    scenarios = select(discovered, args.patterns, tags, exclude_tags)
+
+    if args.list:
+        for s in scenarios:
+            kind = "async" if s.is_async else "sync"
+            print(f"{s.name:<32} {kind:<5} {s.path.relative_to(config.REPO_ROOT)}  {','.join(s.tags)}")
+        for path, error in load_errors.items():
+            print(f"[load error] {path}: {error}")
+        return 0
+
+    if not scenarios:
+        excluded = len(select(discovered, args.patterns, tags)) if exclude_tags else 0
+        hint = f" ({excluded} skipped by --exclude-tags {','.join(exclude_tags)})" if excluded else ""
+        print(f"No scenarios matched.{hint}")
+        return 1
+
+    options = RunOptions(headless=not args.headed, vitals=not args.no_vitals, offline=args.offline, static=args.static,
+                         coverage=args.coverage)
+    target = args.target or options.target
+    targets = server.TARGETS if target == "both" else (target,)
+    if len(targets) > 1 and config.SERVER_URL:
+        parser.error("--target both starts its own servers; unset LIS_BASE_URL")
+    if args.rebuild and "prod" in targets:
+        server.build(force=True)
+    if args.devices == "all":
+        device_names = tuple(devices.PROFILES)
+    elif args.devices:
+        device_names = tuple(d for d in args.devices.split(",") if d)
+    else:
+        device_names = (options.device,)
+    for name in device_names:
+        try:
+            devices.get(name)
+        except ValueError as e:
+            parser.error(str(e))
+
+    # Timings that feed percentiles or a baseline are taken one run at a time.
+    measuring = args.repeat > 1 or bool(args.baseline) or args.save_baseline
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    reports, regressed = {}, False
+    matrix = [(target, device) for target in targets for device in device_names]
+    for target, device in matrix:
+        label = "/".join(part for part in (target if len(targets) > 1 else None, device) if part)
+        if len(matrix) > 1:
+            print(f"=== {label} ===", flush=True)
+        report = run(scenarios, args.workers, replace(options, target=target, device=device), args.concurrency,
+                     args.repeat, args.warmup, sequential=measuring)
+        report.load_errors = load_errors
+        report.print_summary()
+        suffix = f"-{label.replace('/', '-')}" if len(matrix) > 1 else ""
+        default_path = config.REPORTS_DIR / f"run-{stamp}{suffix}.json"
+        path = report.write(args.report.with_stem(args.report.stem + suffix) if args.report else default_path)
+        print(f"Report written to {path}")
+        if options.vitals:
+            vitals.print_by_module(vitals.by_module(report.results))
+            print(f"Vitals written to {vitals.write_report(report.results, path.with_name(f'vitals-{stamp}{suffix}.json'))}")
+        if options.coverage:
+            coverage.print_top(report.results)
+            directory = coverage.write_report(report.results, config.REPORTS_DIR / f"coverage-{stamp}{suffix}")
+            print(f"Coverage written to {directory}")
+            if args.coverage_compare:
+                print(f"Unused bytes vs {args.coverage_compare}:")
+                coverage.print_compare(coverage.compare(args.coverage_compare, directory))
+        if measuring:
+            # Timings only compare within one device profile.
+            regressed |= gate(report, f"{target}/{device}" if device else target, args)
+        reports[label or target] = report
+
+    if len(reports) > 1:
+        comparison = compare(reports)
+        print_comparison(comparison)
+        path = config.REPORTS_DIR / f"compare-{stamp}.json"
+        path.write_text(json.dumps(comparison, indent=2))
+        print(f"Comparison written to {path}")
+    return 0 if all(r.ok for r in reports.values()) and not regressed else 1
+
+
+def gate(report: RunReport, target: str, args) -> bool:
+    """Print step statistics against the baseline; True if any step regressed."""
+    steps = stats.describe_steps(report.results)
+    stored = baseline.load(target, args.baseline)
+    if stored:
+        dirty = " (dirty tree)" if stored["dirty"] else ""
+        print(f"Steps vs baseline {stored['commit'][:10]}{dirty} from {stored['savedAt']}:")
+    else:
+        print("Steps (no stored baseline to compare with):")
+    rows = baseline.compare(steps, stored["steps"] if stored else {}, args.threshold)
+    baseline.print_steps(rows)
+    if args.save_baseline:
+        print(f"Baseline written to {baseline.save(target, steps)}")
+    regressions = [r["step"] for r in rows if r["verdict"] == "regressed"]
+    if regressions:
+        print(f"Regressed past {args.threshold}%: {', '.join(regressions)}")
+    return bool(regressions)
+
+
+def compare(reports: dict) -> dict:
+    """Side-by-side scenario durations (median over repeats) and per-module vitals, keyed by run label
+    (target, device profile, or both: see ``main``)."""
+    names = sorted({r.name for report in reports.values() for r in report.results})
+    durations = {}
+    for target, report in reports.items():
+        by_name = durations[target] = {}
+        for r in report.results:
+            by_name.setdefault(r.name, []).append(r)
+    modules = {target: vitals.by_module(report.results) for target, report in reports.items()}
+    labels = sorted({label for summary in modules.values() for label in summary})
+    return {
+        "runs": list(reports),
+        "wallTimeS": {target: round(report.wall_time_s, 3) for target, report in reports.items()},
+        "scenarios": {
+            name: {
+                target: {
+                    "durationS": round(statistics.median(r.duration_s for r in runs), 3),
+                    "status": "passed" if all(r.status == "passed" for r in runs) else "failed",
+                } if (runs := by_name.get(name)) else None
+                for target, by_name in durations.items()
+            }
+            for name in names
+        },
+        "modules": {
+            label: {
+                target: {k: summary[label][k] for k in ("lcpMs", "mountMs", "blockingMs")} if label in summary else None
+                for target, summary in modules.items()
+            }
+            for label in labels
+        },
+    }
+
+
+def print_comparison(comparison: dict):
+    """One column per run; ratios are against the first run."""
+    from .bench import print_table
+
+    first, *others = runs = comparison["runs"]
+
+    def ratio(a, b):
+        return round(b / a, 2) if a and b is not None else None
+
+    def with_ratios(row):
+        for run in others:
+            row[f"{run}/{first}"] = ratio(row[first], row[run])
+        return row
+
+    rows = []
+    for name, by_run in comparison["scenarios"].items():
+        rows.append(with_ratios({"name": name, **{run: by_run[run]["durationS"] if by_run[run] else None for run in runs}}))
+    rows.append(with_ratios({"name": "(wall)", **comparison["wallTimeS"]}))
+    print_table(rows, [
+        ("name", "scenario", "s"),
+        *((run, f"{run} s", ".2f") for run in runs),
+        *((f"{run}/{first}", f"{run} vs {first}", ".2f") for run in others),
+    ])
+
+    rows = []
+    for label, by_run in comparison["modules"].items():
+        row = {"label": label}
+        for key in ("lcpMs", "mountMs"):
+            for run in runs:
+                row[f"{key} {run}"] = by_run[run][key] if by_run[run] else None
+        rows.append(row)
+    if rows:
+        print_table(rows, [
+            ("label", "segment", "s"),
+            *((f"lcpMs {run}", f"LCP {run}", ".0f") for run in runs),
+            *((f"mountMs {run}", f"mount {run}", ".0f") for run in runs),
+        ])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
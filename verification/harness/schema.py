@@ -0,0 +1,452 @@
+"""Check generated data against the app's TypeScript types.
+
+    schema.validate(records, "Habit[]")     # -> ["[3].entries[0].date: expected string, got 7"]
+    schema.check(audit, "FinancialAudit")   # raises ValueError listing the problems
+
+The interfaces and type aliases in ``SOURCES`` (and the zod schemas in
+src/types/workout.ts) are parsed on first use into a small structural model,
+so a builder that falls behind a change to the app's types fails its check
+instead of quietly seeding stale shapes; no TypeScript toolchain is needed.
+
+Only the subset of TypeScript the storage types use is understood: primitives,
+string and number literals, unions, ``T[]``, ``Array<T>``, ``Record<K, V>``,
+inline object types, optional members and references between them, plus the
+``z.object/array/enum/...`` calls with ``.optional()``, ``.default()`` and
+``.nullable()``. Anything else parses as ``any``. Objects are checked strictly:
+a key the type does not declare is an error, as it would be in a literal.
+"""
+
+import functools
+import re
+
+from .config import REPO_ROOT
+
+# Parsed in order; a name defined in two files resolves to the earlier one
+# unless it is referenced from inside the later file.
+SOURCES = (
+    "src/lib/types.ts",
+    "src/types/accountant.ts",
+    "src/types/financial_report.ts",
+    "src/types/workout.ts",
+)
+
+# Type of the JSON the app keeps under each storage key (the useKV<...> calls).
+STORAGE_TYPES = {
+    "habits": "Habit[]",
+    "tasks": "Task[]",
+    "shopping-items": "ShoppingItem[]",
+    "expenses": "Expense[]",
+    "calendar-events": "CalendarEvent[]",
+    "knox-messages": "ChatMessage[]",
+    "completed-workouts": "CompletedWorkout[]",
+    "golf-swing-analyses": "SwingAnalysis[]",
+    "personal-records": "PersonalRecord[]",
+    "workout-plans": "WorkoutPlan[]",
+    "finance-audit-v2": "FinancialAudit",
+    "finance-report-v2": "FinancialReport",
+}
+
+_TOKEN = re.compile(
+    r"""
+      \s+ | //[^\n]* | /\*.*?\*/
+    | (?P<str>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`(?:[^`\\]|\\.)*`)
+    | (?P<num>\d+(?:\.\d+)?)
+    | (?P<name>[A-Za-z_$][\w$]*)
+    | (?P<punct>=>|\.\.\.|.)
+    """,
+    re.S | re.X,
+)
+
+_PRIMITIVES = {"string", "number", "boolean", "null", "undefined", "any", "unknown"}
+_ZOD_PRIMITIVES = {"string": "string", "number": "number", "boolean": "boolean", "null": "null",
+                   "any": "any", "unknown": "any", "date": "any"}
+_ANY = ("prim", "any")
+
+# Type nodes:
+#   ("prim", name)  ("lit", value)  ("array", item)  ("union", options)
+#   ("object", {field: (type, optional)}, index_type | None)  ("record", value)
+#   ("ref", name, source_index | None)
+
+
+def _tokenize(text):
+    tokens = []
+    for match in _TOKEN.finditer(text):
+        kind = match.lastgroup
+        if kind:
+            tokens.append((kind, match.group(kind)))
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text, source=None):
+        self.tokens = _tokenize(text)
+        self.pos = 0
+        self.source = source
+
+    def peek(self, offset=0):
+        index = self.pos + offset
+        return self.tokens[index][1] if index < len(self.tokens) else None
+
+    def kind(self, offset=0):
+        index = self.pos + offset
+        return self.tokens[index][0] if index < len(self.tokens) else None
+
+    def take(self, expected=None):
+        if self.pos >= len(self.tokens):
+            raise SyntaxError(f"expected {expected or 'a token'}, got end of input")
+        text = self.tokens[self.pos][1]
+        if expected is not None and text != expected:
+            raise SyntaxError(f"expected {expected!r}, got {text!r}")
+        self.pos += 1
+        return text
+
+    def skip_to_close(self):
+        """Skip past the ``)``, ``]`` or ``}`` closing the bracket just taken."""
+        depth = 1
+        while depth:
+            text = self.take()
+            if text in "([{":
+                depth += 1
+            elif text in ")]}":
+                depth -= 1
+
+    # --- TypeScript types ---
+
+    def type(self):
+        if self.peek() == "|":
+            self.take()
+        options = [self.postfix()]
+        while self.peek() in ("|", "&"):
+            joiner = self.take()
+            options.append(self.postfix())
+            if joiner == "&":
+                options[-2:] = [_ANY]
+        return options[0] if len(options) == 1 else ("union", tuple(options))
+
+    def postfix(self):
+        node = self.primary()
+        while self.peek() == "[" and self.peek(1) == "]":
+            self.pos += 2
+            node = ("array", node)
+        return node
+
+    def primary(self):
+        kind, text = self.kind(), self.take()
+        if text == "(":
+            node = self.type()
+            self.take(")")
+            return node
+        if text == "{":
+            return self.members()
+        if kind == "str":
+            return ("lit", _unquote(text))
+        if kind == "num":
+            return ("lit", float(text) if "." in text else int(text))
+        if text in ("true", "false"):
+            return ("lit", text == "true")
+        if text == "typeof":
+            return ("ref", self.take(), self.source)
+        if text in _PRIMITIVES:
+            return ("prim", text)
+        if kind != "name":
+            raise SyntaxError(f"unexpected {text!r} in a type")
+        while self.peek() == ".":
+            self.take()
+            text += "." + self.take()
+        args = []
+        if self.peek() == "<":
+            self.take()
+            args.append(self.type())
+            while self.peek() == ",":
+                self.take()
+                args.append(self.type())
+            self.take(">")
+        if text == "Array" and args:
+            return ("array", args[0])
+        if text == "Record" and len(args) == 2:
+            return ("record", args[1])
+        if text == "z.infer" and args:
+            return args[0]
+        return _ANY if args else ("ref", text, self.source)
+
+    def members(self):
+        fields, index = {}, None
+        while self.peek() != "}":
+            if self.peek() == "[":
+                self.take()
+                self.take()
+                self.take(":")
+                self.type()
+                self.take("]")
+                self.take(":")
+                index = self.type()
+            else:
+                if self.peek() == "readonly" and self.kind(1) == "name":
+                    self.take()
+                name = _unquote(self.take()) if self.kind() == "str" else self.take()
+                optional = self.peek() == "?"
+                if optional:
+                    self.take()
+                if self.peek() == "(":
+                    self.take()
+                    self.skip_to_close()
+                self.take(":")
+                fields[name] = (self.type(), optional)
+            if self.peek() in (";", ","):
+                self.take()
+        self.take("}")
+        return ("object", fields, index)
+
+    # --- zod schemas ---
+
+    def zod(self):
+        """A zod expression; returns ``(type, optional)``."""
+        if self.peek() == "z" and self.peek(1) == ".":
+            self.pos += 2
+            fn = self.take()
+            self.take("(")
+            if fn == "object":
+                node = self.zod_object()
+            elif fn == "array":
+                node = ("array", self.zod()[0])
+            elif fn == "enum":
+                self.take("[")
+                options = []
+                while self.peek() != "]":
+                    options.append(("lit", _unquote(self.take())))
+                    if self.peek() == ",":
+                        self.take()
+                self.take("]")
+                node = ("union", tuple(options))
+            elif fn == "literal":
+                node = self.primary()
+            elif fn == "union":
+                self.take("[")
+                options = []
+                while self.peek() != "]":
+                    options.append(self.zod()[0])
+                    if self.peek() == ",":
+                        self.take()
+                self.take("]")
+                node = ("union", tuple(options))
+            elif fn == "record":
+                args = [self.zod()[0]]
+                while self.peek() == ",":
+                    self.take()
+                    args.append(self.zod()[0])
+                node = ("record", args[-1])
+            else:
+                node = ("prim", _ZOD_PRIMITIVES.get(fn, "any"))
+                if self.peek() != ")":
+                    self.skip_to_close()
+                    self.pos -= 1
+            self.take(")")
+        else:
+            node = ("ref", self.take(), self.source)
+
+        optional = False
+        while self.peek() == "." and self.kind(1) == "name" and self.peek(2) == "(":
+            self.take()
+            method = self.take()
+            self.take("(")
+            self.skip_to_close()
+            if method in ("optional", "default", "nullish"):
+                optional = True
+            if method in ("nullable", "nullish"):
+                node = ("union", (node, ("prim", "null")))
+        return node, optional
+
+    def zod_object(self):
+        self.take("{")
+        fields = {}
+        while self.peek() != "}":
+            name = self.take()
+            self.take(":")
+            fields[name] = self.zod()
+            if self.peek() == ",":
+                self.take()
+        self.take("}")
+        return ("object", fields, None)
+
+    # --- declarations ---
+
+    def declarations(self):
+        found = {}
+        while self.pos < len(self.tokens):
+            text = self.peek()
+            if text == "interface" and self.kind(1) == "name":
+                self.take()
+                name = self.take()
+                while self.peek() != "{":
+                    self.take()
+                self.take("{")
+                found[name] = self.members()
+            elif text == "type" and self.kind(1) == "name" and self.peek(2) == "=":
+                self.take()
+                name = self.take()
+                self.take("=")
+                found[name] = self.type()
+            elif text == "const" and self.peek(2) == "=" and self.peek(3) == "z" and self.peek(4) == ".":
+                self.take()
+                name = self.take()
+                self.take("=")
+                found[name] = self.zod()[0]
+            else:
+                self.pos += 1
+        return found
+
+
+def _unquote(text):
+    return re.sub(r"\\(.)", r"\1", text[1:-1])
+
+
+@functools.lru_cache(maxsize=None)
+def _model():
+    """Per-source declarations, and the first definition of each name across sources."""
+    per_source = [
+        _Parser((REPO_ROOT / path).read_text(encoding="utf-8"), index).declarations()
+        for index, path in enumerate(SOURCES)
+    ]
+    first = {}
+    for declarations in per_source:
+        for name, node in declarations.items():
+            first.setdefault(name, node)
+    return per_source, first
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve(node):
+    while node[0] == "ref":
+        _, name, source = node
+        per_source, first = _model()
+        resolved = per_source[source].get(name) if source is not None else None
+        if resolved is None:
+            resolved = first.get(name)
+        if resolved is None:
+            return _ANY
+        node = resolved
+    return node
+
+
+@functools.lru_cache(maxsize=256)
+def parse(type_expr):
+    """The type node for a TypeScript type expression over the names in ``SOURCES``."""
+    parser = _Parser(type_expr)
+    node = parser.type()
+    if parser.pos != len(parser.tokens):
+        raise SyntaxError(f"unexpected {parser.peek()!r} in {type_expr!r}")
+    return node
+
+
+def describe(node):
+    kind = node[0]
+    if kind == "prim":
+        return node[1]
+    if kind == "lit":
+        return f"'{node[1]}'" if isinstance(node[1], str) else str(node[1]).lower()
+    if kind == "ref":
+        return node[1]
+    if kind == "array":
+        inner = describe(node[1])
+        return f"({inner})[]" if node[1][0] == "union" else f"{inner}[]"
+    if kind == "union":
+        return " | ".join(describe(option) for option in node[1])
+    if kind == "record":
+        return f"Record<string, {describe(node[1])}>"
+    return "object"
+
+
+def _show(value):
+    text = repr(value)
+    return text if len(text) <= 40 else text[:37] + "..."
+
+
+def _accept(value):
+    return True
+
+
+_PRIMITIVE_CHECKS = {
+    "string": lambda value: isinstance(value, str),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+    "undefined": lambda value: False,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _literals(node):
+    """``{(type, value)}`` for a union of literals only, else None."""
+    if not all(option[0] == "lit" for option in node[1]):
+        return None
+    return frozenset((type(option[1]), option[1]) for option in node[1])
+
+
+def _matches(value, node):
+    errors = []
+    _check(value, node, "", errors, 1)
+    return not errors
+
+
+def _check(value, node, path, errors, limit):
+    if len(errors) >= limit:
+        return
+    shown = node
+    if node[0] == "ref":
+        node = _resolve(node)
+    kind = node[0]
+
+    if kind == "prim":
+        ok = _PRIMITIVE_CHECKS.get(node[1], _accept)(value)
+    elif kind == "lit":
+        ok = value == node[1] and type(value) is type(node[1])
+    elif kind == "union":
+        literals = _literals(node)
+        if literals is not None and isinstance(value, (str, int, float)):
+            ok = (type(value), value) in literals
+        else:
+            ok = any(_matches(value, option) for option in node[1])
+    elif kind == "array":
+        ok = isinstance(value, list)
+        if ok:
+            for i, item in enumerate(value):
+                _check(item, node[1], f"{path}[{i}]", errors, limit)
+            return
+    elif kind == "record":
+        ok = isinstance(value, dict)
+        if ok:
+            for key, item in value.items():
+                _check(item, node[1], f"{path}.{key}", errors, limit)
+            return
+    else:
+        ok = isinstance(value, dict)
+        if ok:
+            fields, index = node[1], node[2]
+            for name, (field_type, optional) in fields.items():
+                if name in value:
+                    _check(value[name], field_type, f"{path}.{name}", errors, limit)
+                elif not optional:
+                    errors.append(f"{path}.{name}: missing (required {describe(field_type)})")
+            for name in value.keys() - fields.keys():
+                if index is None:
+                    errors.append(f"{path}.{name}: not declared by {describe(shown)}")
+                else:
+                    _check(value[name], index, f"{path}.{name}", errors, limit)
+            return
+
+    if not ok and len(errors) < limit:
+        errors.append(f"{path or 'value'}: expected {describe(shown)}, got {_show(value)}")
+
+
+def validate(value, type_expr, limit=20):
+    """Up to ``limit`` ways ``value`` breaks ``type_expr``, as ``"path: problem"`` strings."""
+    errors = []
+    _check(value, parse(type_expr), "", errors, limit)
+    return [error.lstrip(".") for error in errors]
+
+
+def check(value, type_expr, limit=20):
+    """Raise ``ValueError`` listing the problems if ``value`` is not a ``type_expr``."""
+    errors = validate(value, type_expr, limit)
+    if errors:
+        raise ValueError(f"value does not match {type_expr}:\n  " + "\n  ".join(errors))
@@ -0,0 +1,225 @@
+"""The app server the scenarios run against.
+
+The runner owns the server's lifecycle, so nobody has to start ``vite`` by
+hand and timings can be taken against what actually ships:
+
+* ``dev``: ``vite`` with unbundled modules and HMR. A dev server that is
+  already running on ``DEV_PORT`` is reused as-is.
+* ``prod``: ``npm run build`` once (skipped while ``dist/`` is newer than
+  the sources), then ``vite preview``, or with ``static=True`` a plain
+  static file server over ``dist/`` with an SPA fallback.
+
+Every server is health-checked before use, and one server is shared by all
+the scenarios of a run. Setting ``LIS_BASE_URL`` points the harness at an
+externally managed server instead.
+
+Scenarios navigate to ``BASE_URL`` (``"/"``), which resolves against the
+context's ``base_url``, so one scenario set runs unchanged against either
+target. Benchmarks that import ``/src/...`` modules need the dev server and
+are tagged ``dev-only``.
+"""
+
+import os
+import shutil
+import socket
+import subprocess
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from dataclasses import replace
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+from . import config
+
+TARGETS = ("dev", "prod")
+DEV_ONLY_TAG = "dev-only"
+
+DEV_PORT = 5173
+PREVIEW_PORT = 4173
+DIST_DIR = config.REPO_ROOT / "dist"
+# Inputs of `npm run build`; dist/ is rebuilt when any of them is newer.
+BUILD_INPUTS = ("src", "public", "index.html", "vite.config.ts", "package.json", "tsconfig.json")
+
+START_TIMEOUT_S = 60
+BUILD_TIMEOUT_S = 600
+
+
+def _latest_mtime(paths) -> float:
+    latest = 0.0
+    for path in paths:
+        if path.is_dir():
+            for child in path.rglob("*"):
+                if child.is_file():
+                    latest = max(latest, child.stat().st_mtime)
+        elif path.exists():
+            latest = max(latest, path.stat().st_mtime)
+    return latest
+
+
+def build(force: bool = False) -> Path:
+    """Run ``npm run build`` unless ``dist/`` is already up to date; returns ``dist/``."""
+    index = DIST_DIR / "index.html"
+    inputs = [config.REPO_ROOT / p for p in BUILD_INPUTS]
+    if not force and index.exists() and index.stat().st_mtime >= _latest_mtime(inputs):
+        print(f"[server] {DIST_DIR.relative_to(config.REPO_ROOT)}/ is up to date")
+        return DIST_DIR
+
+    print("[server] building the app (npm run build)...", flush=True)
+    started = time.perf_counter()
+    subprocess.run(_npm("run", "build"), cwd=config.REPO_ROOT, check=True, timeout=BUILD_TIMEOUT_S)
+    print(f"[server] built in {time.perf_counter() - started:.1f}s")
+    return DIST_DIR
+
+
+def _npm(*args) -> list:
+    npm = shutil.which("npm")
+    if npm is None:
+        raise RuntimeError("npm is not on PATH; install Node or set LIS_BASE_URL to a running server")
+    return [npm, *args]
+
+
+def _free_port(preferred: int) -> int:
+    for port in (preferred, 0):
+        with socket.socket() as s:
+            try:
+                s.bind(("127.0.0.1", port))
+            except OSError:
+                continue
+            return s.getsockname()[1]
+    raise RuntimeError("no free port")
+
+
+def _get(url: str, timeout: float = 2) -> Optional[bytes]:
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.read() if response.status == 200 else None
+    except OSError:
+        return None
+
+
+def serves(url: str, target: str) -> bool:
+    """True if ``url`` answers with the app, served the way ``target`` serves it."""
+    html = _get(url)
+    if html is None or b'id="root"' not in html:
+        return False
+    is_dev = b"/@vite/client" in html
+    return is_dev if target == "dev" else not is_dev
+
+
+class _SPAHandler(SimpleHTTPRequestHandler):
+    """Static files from dist/; unknown paths get index.html for client-side routing."""
+
+    def send_head(self):
+        path = Path(self.translate_path(self.path))
+        if not path.exists():
+            self.path = "/index.html"
+        return super().send_head()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class AppServer:
+    """Context manager yielding a healthy server for ``target``; ``.url`` is its origin."""
+
+    def __init__(self, target: str = "dev", static: bool = False):
+        if target not in TARGETS:
+            raise ValueError(f"Unknown target {target!r}; expected one of {', '.join(TARGETS)}")
+        self.target = target
+        self.static = static
+        self.url = None
+        self._process = None
+        self._httpd = None
+        self._log = None
+
+    def __enter__(self):
+        if self.target == "dev" and serves(f"http://localhost:{DEV_PORT}/", "dev"):
+            self.url = f"http://localhost:{DEV_PORT}"
+            print(f"[server] reusing the dev server at {self.url}")
+            return self
+
+        if self.target == "prod":
+            build()
+        if self.target == "prod" and self.static:
+            self._serve_static()
+        else:
+            self._spawn()
+        try:
+            self._wait_healthy()
+        except Exception:
+            self.__exit__(None, None, None)
+            raise
+        print(f"[server] {self.target} server ready at {self.url}")
+        return self
+
+    def __exit__(self, *exc):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        if self._log is not None:
+            self._log.close()
+
+    def _spawn(self):
+        port = _free_port(DEV_PORT if self.target == "dev" else PREVIEW_PORT)
+        command = ["vite"] if self.target == "dev" else ["vite", "preview"]
+        config.REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+        log_path = config.REPORTS_DIR / f"server-{self.target}.log"
+        self._log = log_path.open("w")
+        self._process = subprocess.Popen(
+            _npm("exec", "--", *command, "--host", "127.0.0.1", "--port", str(port), "--strictPort"),
+            cwd=config.REPO_ROOT,
+            stdout=self._log,
+            stderr=subprocess.STDOUT,
+            env={**os.environ, "BROWSER": "none"},
+        )
+        self.url = f"http://127.0.0.1:{port}"
+
+    def _serve_static(self):
+        port = _free_port(PREVIEW_PORT)
+        handler = partial(_SPAHandler, directory=str(DIST_DIR))
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{port}"
+
+    def _wait_healthy(self):
+        deadline = time.monotonic() + START_TIMEOUT_S
+        while time.monotonic() < deadline:
+            if self._process is not None and self._process.poll() is not None:
+                raise RuntimeError(
+                    f"{self.target} server exited with {self._process.returncode}; "
+                    f"see {self._log.name}"
+                )
+            if serves(self.url + "/", self.target):
+                return
+            time.sleep(0.25)
+        raise TimeoutError(f"{self.target} server at {self.url} not healthy after {START_TIMEOUT_S}s")
+
+
+@contextmanager
+def serving(options):
+    """Yield ``options`` with ``base_url`` pointing at a healthy server for ``options.target``."""
+    if options.base_url:
+        yield options
+    elif config.SERVER_URL:
+        yield replace(options, base_url=config.SERVER_URL)
+    else:
+        with AppServer(options.target, options.static) as server:
+            yield replace(options, base_url=server.url)
+
+
+def runnable(scenarios, target: str) -> tuple[list, list]:
+    """Split ``scenarios`` into those that can run against ``target`` and those that cannot."""
+    if target == "dev":
+        return list(scenarios), []
+    keep = [s for s in scenarios if DEV_ONLY_TAG not in s.tags]
+    return keep, [s for s in scenarios if DEV_ONLY_TAG in s.tags]
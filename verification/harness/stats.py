@@ -0,0 +1,73 @@
+"""Distribution statistics for repeated scenario runs.
+
+Timings are skewed and have outliers, so everything here is rank-based: p50,
+p95 and p99 use linear interpolation between order statistics, and the
+confidence interval is the distribution-free interval for the median (the
+binomial order-statistic interval), which needs no normality assumption.
+"""
+
+from math import comb
+
+CONFIDENCE = 0.95
+
+
+def percentile(ordered, q: float) -> float:
+    """``q``-th percentile (0-100) of an already sorted list."""
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def median_ci(ordered, confidence: float = CONFIDENCE) -> tuple:
+    """``(low, high)`` bounds containing the true median with ``confidence``.
+
+    The interval is ``[x_(j), x_(n-j+1)]`` for the largest ``j`` with
+    ``P(Binomial(n, 1/2) < j) <= (1 - confidence) / 2``. With fewer than six
+    samples no such ``j`` exists at 95%, so the sample range is returned.
+    """
+    n = len(ordered)
+    alpha = (1 - confidence) / 2
+    cumulative, j = 0.0, 0
+    for k in range(n):
+        cumulative += comb(n, k) / 2 ** n
+        if cumulative > alpha:
+            break
+        j = k + 1
+    if j == 0:
+        return ordered[0], ordered[-1]
+    return ordered[j - 1], ordered[n - j]
+
+
+def describe(samples) -> dict:
+    ordered = sorted(samples)
+    low, high = median_ci(ordered)
+    return {
+        "n": len(ordered),
+        "p50": percentile(ordered, 50),
+        "p95": percentile(ordered, 95),
+        "p99": percentile(ordered, 99),
+        "ciLow": low,
+        "ciHigh": high,
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+
+
+def step_samples(results) -> dict:
+    """``{"scenario/step": [ms, ...]}`` across ``results``, plus each scenario's total."""
+    samples = {}
+    for result in results:
+        if result.status != "passed":
+            continue
+        samples.setdefault(f"{result.name}/total", []).append(result.duration_s * 1000)
+        for step, timings in result.steps.items():
+            samples.setdefault(f"{result.name}/{step}", []).extend(timings)
+    return samples
+
+
+def describe_steps(results) -> dict:
+    return {key: {k: round(v, 2) for k, v in describe(values).items()}
+            for key, values in sorted(step_samples(results).items())}
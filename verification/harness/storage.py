@@ -0,0 +1,134 @@
+"""Pre-seeded localStorage fixtures.
+
+A fixture is a named builder returning ``{storage_key: value}``. Scenarios list
+the fixtures they need; the runner composes them (later fixtures win on key
+clashes) into a Playwright storage-state file and opens the context with it,
+so the app boots once with its data already in place instead of
+goto -> localStorage.setItem -> reload.
+
+String values are stored verbatim; anything else is JSON-encoded, which is
+what ``useKV`` expects to read back. A value with a ``json_chunks()`` method
+(``datasets.Records``) is streamed into the state file piece by piece, so a
+large generated dataset is never held in memory whole. Values under keys the
+app has a type for (``schema.STORAGE_TYPES``) are checked against it first.
+
+Built states are cached in ``config.FIXTURE_CACHE_DIR`` under a hash of their
+definition (fixture names, parameters, the source of the files defining them
+and the origin), so large generated datasets are only built once. Set
+``LIS_REFRESH_FIXTURES=1`` to force a rebuild.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlsplit
+
+from . import config, schema
+
+# Bump to invalidate every cached state when the file format changes.
+CACHE_VERSION = 1
+
+# First boot wipes module data unless this flag is set (see App.tsx / clear-data.ts).
+APP_INITIALIZED = {"data-cleared-v1": "true"}
+
+
+@dataclass(frozen=True)
+class Fixture:
+    name: str
+    build: Callable[..., dict]
+
+
+_FIXTURES: dict[str, Fixture] = {}
+
+
+def fixture(func=None, *, name=None):
+    """Register ``func(**params) -> {storage_key: value}`` as a named fixture."""
+
+    def decorate(fn):
+        _FIXTURES[name or fn.__name__] = Fixture(name or fn.__name__, fn)
+        return fn
+
+    if func is not None:
+        return decorate(func)
+    return decorate
+
+
+def _normalize(spec):
+    """A spec is ``"name"`` or ``("name", {param: value})``."""
+    if isinstance(spec, str):
+        return spec, {}
+    name, params = spec
+    return name, dict(params)
+
+
+def _origin(base_url: str) -> str:
+    parts = urlsplit(base_url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _encode(value):
+    """The stored string for ``value``, as an iterable of pieces."""
+    if isinstance(value, str):
+        return (value,)
+    if hasattr(value, "json_chunks"):
+        return value.json_chunks()
+    return (json.dumps(value, separators=(",", ":")),)
+
+
+def build_entries(specs) -> dict:
+    """Compose fixtures into ``{storage_key: value}``, checking typed keys."""
+    entries = dict(APP_INITIALIZED)
+    for spec in specs:
+        name, params = _normalize(spec)
+        for key, value in _FIXTURES[name].build(**params).items():
+            if key in schema.STORAGE_TYPES and not isinstance(value, str) and not hasattr(value, "json_chunks"):
+                try:
+                    schema.check(value, schema.STORAGE_TYPES[key])
+                except ValueError as e:
+                    raise ValueError(f"fixture {name!r}, key {key!r}: {e}") from None
+            entries[key] = value
+    return entries
+
+
+def _write_state(path: Path, entries: dict, origin: str):
+    """Write a Playwright storage state, streaming each value into its JSON string."""
+    with path.open("w", encoding="utf-8") as out:
+        out.write(f'{{"cookies":[],"origins":[{{"origin":{json.dumps(origin)},"localStorage":[')
+        for n, (key, value) in enumerate(entries.items()):
+            out.write(f'{"," if n else ""}{{"name":{json.dumps(key)},"value":"')
+            for piece in _encode(value):
+                # Escaping is per character, so the pieces can be escaped separately.
+                out.write(json.dumps(piece)[1:-1])
+            out.write('"}')
+        out.write("]}]}")
+
+
+def cache_key(specs, base_url: str) -> str:
+    digest = hashlib.sha256(f"v{CACHE_VERSION}|{_origin(base_url)}".encode())
+    for spec in specs:
+        name, params = _normalize(spec)
+        builder = _FIXTURES[name].build
+        source = Path(inspect.getsourcefile(builder) or sys.modules[builder.__module__].__file__)
+        digest.update(json.dumps([name, params], sort_keys=True, default=str).encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()[:24]
+
+
+def storage_state(specs, base_url: str) -> Path:
+    """Return the path of a storage-state file seeding ``specs``, building it if needed."""
+    path = config.FIXTURE_CACHE_DIR / f"{cache_key(specs, base_url)}.json"
+    if path.exists() and not os.environ.get("LIS_REFRESH_FIXTURES"):
+        return path
+
+    entries = build_entries(specs)
+    config.FIXTURE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Workers may build the same state concurrently; write-then-rename keeps readers safe.
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    _write_state(tmp, entries, _origin(base_url))
+    os.replace(tmp, path)
+    return path
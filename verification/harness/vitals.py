@@ -0,0 +1,269 @@
+"""Per-navigation Web Vitals, long tasks and heap for every scenario page.
+
+An init script observes the page from the first byte. Each page load opens a
+``load`` segment. Each click on a FloatingDock button opens a new segment
+named after the module (``workouts``, ``finance``...). When a segment closes,
+its metrics are computed from the entries whose start time falls inside it:
+
+``lcpMs``       The browser's LCP for the load segment. Chromium stops
+                reporting LCP after the first input, so dock segments use an
+                approximation: when the largest element added under
+                ``#main-content`` was painted, relative to the click.
+``cls``         Largest layout-shift session window (1s gap, 5s cap), shifts
+                right after input excluded.
+``inpMs``       Slowest interaction (event timing, grouped by interactionId).
+``inputDelayMs`` Longest wait before an interaction's handlers started.
+``longTasks``   Count, total and max duration, and total blocking time.
+``heapMB``      ``performance.memory`` used JS heap when the segment closed.
+``mountMs``     Click to ``module-mounted`` readiness signal (dock segments).
+
+Segments that close on an unload are pushed to Python through a binding. The
+rest are collected with ``finish()`` before the context closes.
+"""
+
+import json
+import statistics
+from datetime import datetime
+
+VITALS_JS = r"""
+(() => {
+  if (window.__vitals) return
+  const DOCK = 'nav[aria-label="Main Navigation"]'
+  const events = [], shifts = [], longTasks = []
+  let lcp = null
+
+  const observe = (type, fn, extra = {}) => {
+    try {
+      const po = new PerformanceObserver(list => list.getEntries().forEach(fn))
+      po.observe({ type, buffered: true, ...extra })
+      return po
+    } catch { return null }
+  }
+  const observers = [
+    observe('largest-contentful-paint', e => { lcp = e.renderTime || e.startTime }),
+    observe('layout-shift', e => { if (!e.hadRecentInput) shifts.push(e) }),
+    observe('event', e => { if (e.interactionId) events.push(e) }, { durationThreshold: 16 }),
+    observe('first-input', e => events.push(e)),
+    observe('longtask', e => longTasks.push(e)),
+  ]
+  const drain = () => observers.forEach(po => po?.takeRecords().forEach(e => {
+    if (e.entryType === 'layout-shift' && !e.hadRecentInput) shifts.push(e)
+    else if (e.entryType === 'longtask') longTasks.push(e)
+    else if (e.entryType === 'event' && e.interactionId) events.push(e)
+  }))
+
+  const heapMB = () => performance.memory ? performance.memory.usedJSHeapSize / 1048576 : null
+  const within = (list, seg) => list.filter(e => e.startTime >= seg.start && e.startTime < seg.end)
+
+  const clsOf = entries => {
+    let max = 0, session = 0, first = 0, last = 0
+    for (const e of entries) {
+      if (session && (e.startTime - last > 1000 || e.startTime - first > 5000)) session = 0
+      if (!session) first = e.startTime
+      session += e.value
+      last = e.startTime
+      max = Math.max(max, session)
+    }
+    return max
+  }
+
+  const interactionsOf = entries => {
+    const byId = new Map()
+    for (const e of entries) {
+      const id = e.interactionId || `first-${e.startTime}`
+      const prev = byId.get(id)
+      if (!prev || e.duration > prev.duration) byId.set(id, e)
+    }
+    return [...byId.values()]
+  }
+
+  const summarize = seg => {
+    const tasks = within(longTasks, seg)
+    const interactions = interactionsOf(within(events, seg))
+    return {
+      label: seg.label,
+      url: seg.url,
+      startMs: seg.start,
+      durationMs: seg.end - seg.start,
+      lcpMs: seg.label === 'load' ? lcp : seg.softLcp,
+      cls: clsOf(within(shifts, seg)),
+      inpMs: interactions.length ? Math.max(...interactions.map(e => e.duration)) : null,
+      inputDelayMs: interactions.length
+        ? Math.max(...interactions.map(e => e.processingStart - e.startTime))
+        : null,
+      interactions: interactions.length,
+      longTasks: {
+        count: tasks.length,
+        totalMs: tasks.reduce((s, t) => s + t.duration, 0),
+        maxMs: tasks.reduce((m, t) => Math.max(m, t.duration), 0),
+        blockingMs: tasks.reduce((s, t) => s + Math.max(0, t.duration - 50), 0),
+      },
+      heapMB: heapMB(),
+      mountMs: seg.mountMs ?? null,
+    }
+  }
+
+  // Largest element painted under #main-content since the dock click.
+  let largest = 0, pending = false
+  const added = []
+  const scan = () => {
+    pending = false
+    const seg = current
+    const vw = innerWidth, vh = innerHeight
+    let checked = 0
+    for (const root of added.splice(0)) {
+      if (!root.isConnected) continue
+      const nodes = [root, ...root.querySelectorAll('img, svg, video, canvas, h1, h2, h3, p, span, div')]
+      for (const el of nodes) {
+        if (++checked > 500) break
+        const r = el.getBoundingClientRect()
+        const area = Math.max(0, Math.min(r.right, vw) - Math.max(r.left, 0)) *
+                     Math.max(0, Math.min(r.bottom, vh) - Math.max(r.top, 0))
+        if (area > largest && area < vw * vh) {
+          largest = area
+          // The element is painted in the frame after this layout.
+          requestAnimationFrame(() => { if (seg === current) seg.softLcp = performance.now() - seg.start })
+        }
+      }
+    }
+  }
+  new MutationObserver(records => {
+    if (!current || current.label === 'load' || current.inputSeen) return
+    const main = document.getElementById('main-content') ?? document.body
+    for (const r of records) r.addedNodes.forEach(n => n.nodeType === 1 && main?.contains(n) && added.push(n))
+    if (!pending && added.length) { pending = true; requestAnimationFrame(scan) }
+  }).observe(document, { childList: true, subtree: true })
+
+  const segments = []
+  let current = { label: 'load', url: location.href, start: 0 }
+
+  const close = at => {
+    drain()
+    current.end = at
+    segments.push(summarize(current))
+  }
+  const open = (label, at) => {
+    close(at)
+    largest = 0
+    added.length = 0
+    current = { label, url: location.href, start: at }
+  }
+
+  addEventListener('click', e => {
+    const button = e.target instanceof Element && e.target.closest(`${DOCK} button[aria-label]`)
+    if (button) open(button.getAttribute('aria-label'), e.timeStamp)
+    else if (current.label !== 'load') current.inputSeen = true
+  }, true)
+  addEventListener('keydown', () => { if (current.label !== 'load') current.inputSeen = true }, true)
+  addEventListener('app-readiness', e => {
+    const { signal, detail, at } = e.detail
+    if (signal === 'module-mounted' && detail === current.label && current.mountMs == null) {
+      current.mountMs = at - current.start
+    }
+  })
+  addEventListener('pagehide', () => {
+    close(performance.now())
+    window.__lisVitalsReport?.(segments.splice(0))
+  })
+
+  window.__vitals = {
+    flush() {
+      close(performance.now())
+      current = { label: 'idle', url: location.href, start: performance.now() }
+      return segments.splice(0)
+    },
+  }
+})()
+"""
+
+
+FLUSH_JS = "() => window.__vitals?.flush() ?? []"
+BINDING = "__lisVitalsReport"
+
+
+class VitalsCollector:
+    """Attach the observer script to ``context`` and gather segments per page."""
+
+    def __init__(self, context):
+        self.segments = []
+        context.expose_binding(BINDING, self._report)
+        context.add_init_script(VITALS_JS)
+        self._context = context
+
+    def _report(self, source, segments):
+        self.segments.extend(segments)
+
+    def finish(self) -> list:
+        for page in self._context.pages:
+            try:
+                self.segments.extend(page.evaluate(FLUSH_JS))
+            except Exception:
+                # Closed or crashed pages keep whatever they reported on unload.
+                pass
+        return [rounded(s) for s in self.segments]
+
+
+def rounded(value):
+    if isinstance(value, float):
+        return round(value, 4 if abs(value) < 1 else 1)
+    if isinstance(value, dict):
+        return {k: rounded(v) for k, v in value.items()}
+    return value
+
+
+def by_module(results) -> dict:
+    """Median of each metric per segment label across ``results``."""
+    grouped = {}
+    for result in results:
+        for seg in result.vitals:
+            grouped.setdefault(seg["label"], []).append(seg)
+
+    def median(values):
+        values = [v for v in values if v is not None]
+        return round(statistics.median(values), 4) if values else None
+
+    return {
+        label: {
+            "samples": len(segs),
+            "lcpMs": median(s["lcpMs"] for s in segs),
+            "cls": median(s["cls"] for s in segs),
+            "inpMs": median(s["inpMs"] for s in segs),
+            "inputDelayMs": median(s["inputDelayMs"] for s in segs),
+            "longTaskMs": median(s["longTasks"]["totalMs"] for s in segs),
+            "blockingMs": median(s["longTasks"]["blockingMs"] for s in segs),
+            "heapMB": median(s["heapMB"] for s in segs),
+            "mountMs": median(s["mountMs"] for s in segs),
+        }
+        for label, segs in sorted(grouped.items())
+    }
+
+
+def print_by_module(summary: dict):
+    from .bench import print_table
+
+    rows = [{"label": label, **values} for label, values in summary.items()]
+    print_table(rows, [
+        ("label", "segment", "s"),
+        ("samples", "n", "d"),
+        ("lcpMs", "LCP ms", ".0f"),
+        ("cls", "CLS", ".3f"),
+        ("inpMs", "INP ms", ".0f"),
+        ("inputDelayMs", "delay ms", ".1f"),
+        ("longTaskMs", "long ms", ".0f"),
+        ("blockingMs", "TBT ms", ".0f"),
+        ("heapMB", "heap MB", ".1f"),
+        ("mountMs", "mount ms", ".0f"),
+    ])
+
+
+def write_report(results, path):
+    """One JSON file per run: every scenario's segments plus per-module medians."""
+    summary = by_module(results)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "generatedAt": datetime.now().isoformat(timespec="seconds"),
+        "device": next((r.device for r in results if r.device), None),
+        "byModule": summary,
+        "scenarios": {r.name: r.vitals for r in results if r.vitals},
+    }, indent=2))
+    return path
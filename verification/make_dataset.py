@@ -0,0 +1,36 @@
+"""Write generated records for a storage key to a JSON file.
+
+Usage (from the repo root):
+    python verification/make_dataset.py tasks 1000000 --seed 3      # into the shared dataset cache
+    python verification/make_dataset.py habits 50000 -o habits.json
+
+The records are streamed to disk a chunk at a time (harness/datasets.py
+``Records``), so a million of them never sit in memory at once.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from harness.datasets import CHUNK_SIZE, FACTORIES, Records, dataset_file
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("key", choices=sorted(FACTORIES))
+    parser.add_argument("count", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--out", type=Path, help="output file (default: the shared dataset cache)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    if args.out:
+        path = Records(args.key, args.count, args.seed).write(args.out, args.chunk_size)
+    else:
+        path = dataset_file(args.key, args.count, args.seed)
+    print(f"{args.count:,} {args.key} records written to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
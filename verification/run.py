@@ -0,0 +1,16 @@
+"""Run every verify_* scenario on a shared browser pool.
+
+Usage (from the repo root; the runner starts the app server itself):
+    python verification/run.py            # everything but benchmarks, one worker per core
+    python verification/run.py --tags bench --repeat 5
+    python verification/run.py -k '*watchdog*' -j 2
+    python verification/run.py --target both   # dev vs production build
+    python verification/run.py --list
+"""
+
+import sys
+
+from harness.runner import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""What do years of habit history cost Habits and Dashboard?
+
+Seeds ``LIS_STREAK_HABITS`` habits with 1 to 5 years of daily history
+(harness/datasets.py ``habit_history``: boolean, numerical and time habits,
+kept in runs) and measures, for each length:
+
+    engine     per pass over every habit, in the browser: completing and
+               un-completing today the way Habits does it, with useKV's
+               write and same-tab re-read (a JSON round trip, not timed)
+               between the two, using the streak code Habits had before
+               src/lib/streaks.ts (sort every entry, a Date per comparison)
+               against applyHabitDay on the re-parsed habits; plus building
+               each habit's StreakLedger from scratch, which the first
+               toggle of a session pays; and how many habits' current
+               streaks the two disagree on
+    app        Habits mount (dock tap to module-mounted), completing and
+               un-completing today on a boolean habit (tap to the second
+               frame: streak update, useKV write and re-render), and
+               Dashboard mount
+
+The app runs on the virtual clock, so "today" is the datasets' EPOCH and
+every history ends the day before it.
+
+The streaks differ by design: the old code skipped a day with no entry as
+long as the gap was no longer than the streak so far, and the ledger
+counts consecutive days only (see habitStreak). ``habit_history`` keeps
+habits in runs with gaps between them, so some of its streaks are shorter
+under the ledger. The benchmark fails if one is ever longer.
+
+    LIS_STREAK_HABITS=50   LIS_STREAK_YEARS=1,3,5   LIS_STREAK_TOGGLES=5
+"""
+
+import json
+import os
+import statistics
+
+from harness import BASE_URL, open_module, record, run_standalone, scenario, skip_loading_screen, use_virtual_clock
+from harness.bench import env_ints, import_app_module, print_table, write_csv
+from harness.datasets import habit_history
+
+HABITS = int(os.environ.get("LIS_STREAK_HABITS", 50))
+YEARS = env_ints("LIS_STREAK_YEARS", (1, 3, 5))
+TOGGLES = int(os.environ.get("LIS_STREAK_TOGGLES", 5))
+PASSES = 5
+NEUTRAL = "settings"
+
+# The streak code this benchmark was written against, kept as the baseline.
+LEGACY_JS = """
+(() => {
+  const isComplete = (entry, habit) => habit.trackingType === 'boolean'
+    ? entry.completed
+    : habit.trackingType === 'numerical'
+    ? (entry.value || 0) >= (habit.target || 0)
+    : (entry.minutes || 0) >= (habit.target || 0)
+
+  // Habits.tsx calculateStreak
+  const calculateStreak = (entries, habit) => {
+    if (entries.length === 0) return 0
+    const sortedEntries = [...entries].sort((a, b) => new Date(b.date).getTime() - new Date(a.date).getTime())
+    let streak = 0
+    let checkDate = new Date()
+    for (const entry of sortedEntries) {
+      const entryDate = new Date(entry.date)
+      const daysDiff = Math.floor((checkDate.getTime() - entryDate.getTime()) / (1000 * 60 * 60 * 24))
+      if (daysDiff > streak + 1) break
+      if (!isComplete(entry, habit)) break
+      streak++
+      checkDate = entryDate
+    }
+    return streak
+  }
+
+  window.__legacyStreaks = { isComplete, calculateStreak }
+})()
+"""
+
+ENGINE_JS = """
+([passes]) => {
+  const { StreakLedger, applyHabitDay, findEntryIndex, habitStreak } = window.__bench.streaks
+  const legacy = window.__legacyStreaks
+  const habits = JSON.parse(localStorage.getItem('habits'))
+  const today = new Date().toISOString().split('T')[0]
+  const completedDays = habits.map(h => h.entries.filter(e => legacy.isComplete(e, h)).map(e => e.date))
+
+  const middle = times => times.sort((a, b) => a - b)[Math.floor(times.length / 2)]
+  const median = fn => {
+    const times = []
+    for (let i = 0; i < passes; i++) {
+      const started = performance.now()
+      fn()
+      times.push(performance.now() - started)
+    }
+    return middle(times)
+  }
+
+  // Today's entries after a complete or an undo, copied as Habits copies them.
+  const toggled = (habit, complete) => {
+    const entries = [...habit.entries]
+    if (!complete) {
+      entries.splice(findEntryIndex(entries, today), 1)
+    } else if (habit.trackingType === 'boolean') {
+      entries.push({ date: today, completed: true })
+    } else {
+      entries.push({ date: today, [habit.trackingType === 'numerical' ? 'value' : 'minutes']: habit.target })
+    }
+    return entries
+  }
+  // One complete and one undo of every habit per pass, re-parsing the
+  // state after each like useKV does. The first pass warms up.
+  const toggleMs = toggle => {
+    let state = JSON.parse(JSON.stringify(habits))
+    const times = []
+    for (let i = 0; i <= passes; i++) {
+      let elapsed = 0
+      for (const complete of [true, false]) {
+        const started = performance.now()
+        state = state.map(h => toggle(h, toggled(h, complete)))
+        elapsed += performance.now() - started
+        state = JSON.parse(JSON.stringify(state))
+      }
+      if (i) times.push(elapsed)
+    }
+    return middle(times)
+  }
+
+  const streaks = habits.map(h => [legacy.calculateStreak(h.entries, h), habitStreak(h, today)])
+  return {
+    entries: habits.reduce((sum, h) => sum + h.entries.length, 0),
+    streaksDiffer: streaks.filter(([old, now]) => old !== now).length,
+    streaksLonger: streaks.filter(([old, now]) => now > old).length,
+    legacyToggleMs: toggleMs((h, entries) => ({ ...h, entries, streak: legacy.calculateStreak(entries, h) })),
+    toggleMs: toggleMs((h, entries) => applyHabitDay(h, entries, today, today)),
+    buildMs: median(() => completedDays.forEach(days => new StreakLedger(days))),
+  }
+}
+"""
+
+# Taps the habit's completion button `toggles` times each way; returns tap-to-second-frame times.
+TOGGLE_JS = """
+async ([name, toggles]) => {
+  const frame = () => new Promise(requestAnimationFrame)
+  const button = () => {
+    let el = [...document.querySelectorAll('#main-content h3')].find(h => h.textContent.trim() === name)
+    while (el && !el.querySelector('button')) el = el.parentElement
+    return el?.querySelector('button')
+  }
+  const complete = [], undo = []
+  for (let i = 0; i < toggles; i++) {
+    for (const times of [complete, undo]) {
+      const started = performance.now()
+      button().click()
+      await frame()
+      await frame()
+      times.push(performance.now() - started)
+    }
+  }
+  return { complete, undo }
+}
+"""
+
+# Dock tap to the module's module-mounted signal.
+MOUNT_JS = """
+([id, timeout]) => new Promise((resolve, reject) => {
+  const timer = setTimeout(() => reject(new Error(`${id} did not mount in ${timeout}ms`)), timeout)
+  const onSignal = e => {
+    if (e.detail.signal !== 'module-mounted' || e.detail.detail !== id) return
+    removeEventListener('app-readiness', onSignal)
+    clearTimeout(timer)
+    resolve(e.detail.at - tappedAt)
+  }
+  addEventListener('app-readiness', onSignal)
+  const tappedAt = performance.now()
+  document.querySelector(`nav[aria-label="Main Navigation"] [aria-label="${id}"]`).click()
+})
+"""
+
+
+def mount(page, module):
+    open_module(page, NEUTRAL)
+    return page.evaluate(MOUNT_JS, [module, 60_000])
+
+
+@scenario(fixtures=("onboarded",), tags=("bench", "dev-only"))
+def verify_habit_streaks(page):
+    use_virtual_clock(page)
+    page.goto(BASE_URL)
+    skip_loading_screen(page)
+    open_module(page, NEUTRAL)
+    import_app_module(page, "/src/lib/streaks.ts", "streaks")
+    page.evaluate(LEGACY_JS)
+
+    engine_rows, app_rows = [], []
+    for years in YEARS:
+        habits = habit_history(HABITS, years * 365, seed=years)
+        page.evaluate("value => localStorage.setItem('habits', value)", json.dumps(habits))
+        engine_rows.append({"years": years, "habits": HABITS, **page.evaluate(ENGINE_JS, [PASSES])})
+
+        habits_ms = mount(page, "habits")
+        toggles = page.evaluate(TOGGLE_JS, [habits[0]["name"], TOGGLES])
+        app_rows.append({
+            "years": years,
+            "habitsMountMs": habits_ms,
+            "completeMs": statistics.median(toggles["complete"]),
+            "undoMs": statistics.median(toggles["undo"]),
+            "dashboardMountMs": mount(page, "dashboard"),
+        })
+
+    engine_columns = [
+        ("years", "years", "d"),
+        ("entries", "entries", ",d"),
+        ("legacyToggleMs", "old toggle ms", ".2f"),
+        ("toggleMs", "ledger toggle ms", ".2f"),
+        ("buildMs", "ledger build ms", ".2f"),
+        ("streaksDiffer", "streaks differ", "d"),
+    ]
+    app_columns = [
+        ("years", "years", "d"),
+        ("habitsMountMs", "Habits mount ms", ".1f"),
+        ("completeMs", "complete ms", ".1f"),
+        ("undoMs", "undo ms", ".1f"),
+        ("dashboardMountMs", "Dashboard mount ms", ".1f"),
+    ]
+    print(f"Streak engine, {HABITS} habits per pass:")
+    print_table(engine_rows, engine_columns)
+    print("In the app:")
+    print_table(app_rows, app_columns)
+
+    record("habitStreaks", {"engine": engine_rows, "app": app_rows})
+    rows = [{**e, **a} for e, a in zip(engine_rows, app_rows)]
+    columns = [c[0] for c in engine_columns] + [c[0] for c in app_columns[1:]]
+    print(f"Results written to {write_csv('habit-streaks', rows, columns)}")
+
+    longer = [row["years"] for row in engine_rows if row["streaksLonger"]]
+    assert not longer, f"Ledger streaks longer than the old count at {longer} year(s) of history"
+
+
+if __name__ == "__main__":
+    run_standalone(verify_habit_streaks)
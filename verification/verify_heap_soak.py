@@ -0,0 +1,79 @@
+"""Does cycling through the dock leak memory?
+
+People keep the PWA open all day and hop between modules. This soak clicks
+dashboard -> workouts -> finance -> golf -> habits -> shopping again and
+again. After every cycle it forces GC and samples the JS heap and the DOM
+node and event listener counts over CDP (harness/memory.py).
+
+The first LIS_SOAK_WARMUP cycles load lazy chunks and fill caches, so they
+are excluded. Growth is the least-squares slope over the remaining cycles,
+and the scenario fails if any slope exceeds its per-cycle budget:
+
+    LIS_SOAK_CYCLES=12   LIS_SOAK_WARMUP=2
+    LIS_SOAK_MAX_HEAP_KB=64   LIS_SOAK_MAX_NODES=10   LIS_SOAK_MAX_LISTENERS=1
+    LIS_SOAK_MODULES=dashboard,workouts,finance,golf,habits,shopping
+"""
+
+import os
+
+from harness import BASE_URL, open_module, record, run_standalone, scenario, wait_for_app_ready
+from harness.bench import print_table
+from harness.memory import MemorySampler, growth_per_cycle
+
+MODULES = os.environ.get("LIS_SOAK_MODULES", "dashboard,workouts,finance,golf,habits,shopping").split(",")
+CYCLES = int(os.environ.get("LIS_SOAK_CYCLES", 12))
+WARMUP = int(os.environ.get("LIS_SOAK_WARMUP", 2))
+
+# Sample field -> allowed growth per cycle.
+BUDGETS = {
+    "heapKB": float(os.environ.get("LIS_SOAK_MAX_HEAP_KB", 64)),
+    "nodes": float(os.environ.get("LIS_SOAK_MAX_NODES", 10)),
+    "listeners": float(os.environ.get("LIS_SOAK_MAX_LISTENERS", 1)),
+}
+
+
+@scenario(fixtures=("onboarded", "finance_completed"), tags=("bench", "soak"))
+def verify_heap_soak(page):
+    page.goto(BASE_URL)
+    wait_for_app_ready(page)
+    sampler = MemorySampler(page)
+
+    samples = [{"cycle": 0, **sampler.sample()}]
+    for cycle in range(1, CYCLES + 1):
+        for module in MODULES:
+            open_module(page, module)
+        samples.append({"cycle": cycle, **sampler.sample()})
+    sampler.close()
+
+    steady = samples[WARMUP:]
+    growth = {key: round(growth_per_cycle(steady, key), 2) for key in BUDGETS}
+    over = {key: value for key, value in growth.items() if value > BUDGETS[key]}
+
+    print_table(samples, [
+        ("cycle", "cycle", "d"),
+        ("heapKB", "heap KB", ",.1f"),
+        ("nodes", "nodes", "d"),
+        ("listeners", "listeners", "d"),
+        ("documents", "documents", "d"),
+    ])
+    print_table(
+        [{"metric": key, "growth": growth[key], "budget": BUDGETS[key], "verdict": "FAIL" if key in over else "ok"}
+         for key in BUDGETS],
+        [("metric", "per cycle", "s"), ("growth", "growth", ".2f"), ("budget", "budget", ".2f"), ("verdict", "", "s")],
+    )
+    record("heapSoak", {
+        "modules": MODULES,
+        "warmupCycles": WARMUP,
+        "samples": samples,
+        "growthPerCycle": growth,
+        "budgets": BUDGETS,
+        "passed": not over,
+    })
+
+    assert not over, "Growth per cycle over budget: " + ", ".join(
+        f"{key} +{value} (budget {BUDGETS[key]})" for key, value in over.items()
+    )
+
+
+if __name__ == "__main__":
+    run_standalone(verify_heap_soak)
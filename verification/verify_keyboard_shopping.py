@@ -1,20 +1,19 @@
-from playwright.sync_api import sync_playwright
+from harness import BASE_URL, open_module, run_standalone, scenario, wait_for_animation_idle
 
+# iPhone 16 viewport
+@scenario(context={
+    "viewport": {"width": 393, "height": 852},
+    "user_agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.0 Mobile/15E148 Safari/604.1"
+})
 def verify_shopping_input(page):
     # Navigate to the app (Shopping module)
     # Assuming user is starting fresh or has local storage data.
     # To reliably test the module, we might need to click the nav.
-    page.goto("http://localhost:5173")
+    page.goto(BASE_URL)
 
-    # Wait for the app to load
-    page.wait_for_timeout(2000)
-
-    # Click the Shopping navigation item
-    # Assuming aria-label is used as per code review
-    page.get_by_role("button", name="shopping").click()
-
-    # Wait for module to load
-    page.wait_for_timeout(1000)
+    # Wait for the app to load, click the Shopping navigation item
+    # and wait for the module to mount
+    open_module(page, "shopping")
 
     # Find the input field
     input_field = page.get_by_placeholder("What do you need to buy?")
@@ -34,22 +33,11 @@ def verify_shopping_input(page):
     # Trigger resize event manually if needed, but set_viewport_size does it
     page.evaluate("window.dispatchEvent(new Event('resize'))")
 
-    # Wait for effects (dock hiding, scroll)
-    page.wait_for_timeout(1000)
+    # Wait for effects (dock hiding, scroll); the dock lives outside #main-content
+    wait_for_animation_idle(page, "body")
 
     # Take screenshot
     page.screenshot(path="verification/shopping_keyboard_open.png")
 
 if __name__ == "__main__":
-    with sync_playwright() as p:
-        # iPhone 16 viewport
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            viewport={"width": 393, "height": 852},
-            user_agent="Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.0 Mobile/15E148 Safari/604.1"
-        )
-        page = context.new_page()
-        try:
-            verify_shopping_input(page)
-        finally:
-            browser.close()
+    run_standalone(verify_shopping_input)
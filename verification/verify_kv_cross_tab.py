@@ -0,0 +1,52 @@
+"""Two tabs on Tasks: completing a task in one must show up in the other.
+
+useKV listens for the browser's cross-tab 'storage' event, so the second tab
+should re-read localStorage without a reload. Both tabs live in one context
+(shared origin storage) and are driven concurrently from one event loop.
+"""
+
+import asyncio
+import time
+
+from playwright.async_api import expect
+
+from harness import BASE_URL, fixture, record, run_standalone, scenario
+from harness.aio import open_module, wait_for_app_ready
+
+TITLE = "Sync across tabs"
+
+
+@fixture
+def cross_tab_task():
+    return {"tasks": [{
+        "id": "cross-tab-1",
+        "title": TITLE,
+        "completed": False,
+        "priority": "medium",
+        "createdAt": "2025-01-01T00:00:00.000Z",
+    }]}
+
+
+async def _open_tasks(page):
+    await page.goto(BASE_URL)
+    await wait_for_app_ready(page)
+    await open_module(page, "tasks")
+
+
+@scenario(fixtures=("onboarded", "cross_tab_task"))
+async def verify_kv_cross_tab(page):
+    other = await page.context.new_page()
+    await asyncio.gather(_open_tasks(page), _open_tasks(other))
+
+    await page.get_by_label(f'Mark "{TITLE}" as complete').click()
+    started = time.perf_counter()
+    await expect(other.get_by_label(f'Mark "{TITLE}" as incomplete')).to_be_visible()
+    record("crossTabSyncMs", round((time.perf_counter() - started) * 1000, 1))
+
+    # And back again from the second tab.
+    await other.get_by_label(f'Mark "{TITLE}" as incomplete').click()
+    await expect(page.get_by_label(f'Mark "{TITLE}" as complete')).to_be_visible()
+
+
+if __name__ == "__main__":
+    run_standalone(verify_kv_cross_tab)
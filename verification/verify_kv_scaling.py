@@ -0,0 +1,170 @@
+"""Which useKV-backed modules break first as stored data grows?
+
+For every storage key, seeds 10 / 100 / 1k / 10k generated records
+(harness/datasets.py) and measures:
+
+    mountMs       dock click -> module-mounted, i.e. JSON.parse in useKV plus render
+    hookMountMs   mounting one extra useKV(key) subscriber (read + parse only)
+    setSyncMs     one setValue: JSON.stringify + setItem + the same-tab sync
+                  events that make every mounted useKV(key) re-parse
+    setFrameMs    setValue until the next frame, including the module re-render
+    *BlockingMs   long-task time over 50ms while mounting / setting
+
+Sizes that no longer fit in localStorage are reported as quota failures. The
+curves go to the run report and to reports/kv-scaling-<time>.csv.
+
+    LIS_KV_SIZES=10,100,1000,10000   LIS_KV_KEYS=tasks,habits   LIS_KV_REPEATS=3
+"""
+
+import os
+import statistics
+
+from harness import BASE_URL, open_module, record, run_standalone, scenario, wait_for_app_ready
+from harness.bench import env_ints, import_app_module, print_table, write_csv
+from harness.datasets import dataset_file
+
+# Storage key -> dock module that renders it.
+KEY_MODULES = {
+    "habits": "habits",
+    "tasks": "tasks",
+    "shopping-items": "shopping",
+    "completed-workouts": "workouts",
+    "calendar-events": "calendar",
+    "golf-swing-analyses": "golf",
+    "knox-messages": "knox",
+    "expenses": "dashboard",
+}
+# Opened between measurements so the target module remounts; it reads none of the keys.
+NEUTRAL = "settings"
+
+SIZES = env_ints("LIS_KV_SIZES", (10, 100, 1000, 10000))
+KEYS = [k for k in os.environ.get("LIS_KV_KEYS", ",".join(KEY_MODULES)).split(",") if k]
+REPEATS = int(os.environ.get("LIS_KV_REPEATS", 3))
+
+LONG_TASKS_JS = """
+() => {
+  window.__benchLongTasks = []
+  new PerformanceObserver(list => window.__benchLongTasks.push(...list.getEntries()))
+    .observe({ type: 'longtask' })
+  window.__benchBlocking = since => window.__benchLongTasks
+    .filter(t => t.startTime >= since)
+    .reduce((sum, t) => sum + Math.max(0, t.duration - 50), 0)
+  window.__benchSettle = () => new Promise(r => requestAnimationFrame(() => setTimeout(r, 50)))
+}
+"""
+
+SEED_JS = """
+([key, value]) => {
+  try {
+    localStorage.setItem(key, value)
+    return null
+  } catch (e) {
+    localStorage.removeItem(key)
+    return e.name
+  }
+}
+"""
+
+# Armed before the dock click; resolves once the module has mounted.
+ARM_MOUNT_JS = """
+(module) => {
+  let t0 = null
+  addEventListener('click', e => { t0 = e.timeStamp }, { capture: true, once: true })
+  window.__benchMount = new Promise(resolve => {
+    const onReady = e => {
+      if (e.detail.signal !== 'module-mounted' || e.detail.detail !== module) return
+      removeEventListener('app-readiness', onReady)
+      const mountMs = e.detail.at - t0
+      window.__benchSettle().then(() => resolve({ mountMs, blockingMs: window.__benchBlocking(t0) }))
+    }
+    addEventListener('app-readiness', onReady)
+  })
+}
+"""
+
+PROBE_JS = """
+async ([key, repeats]) => {
+  const probe = window.__bench.kvProbe.mountKVProbe(key)
+  const sets = []
+  const t0 = performance.now()
+  for (let i = 0; i < repeats; i++) {
+    sets.push(await probe.set(prev => [{ ...prev[0], id: `bench-${i}` }, ...prev]))
+  }
+  await window.__benchSettle()
+  const blockingMs = window.__benchBlocking(t0)
+  probe.unmount()
+  return { hookMountMs: probe.mountMs, sets, blockingMs }
+}
+"""
+
+
+def _median(values):
+    return statistics.median(values) if values else None
+
+
+def measure(page, key, module, size):
+    value = dataset_file(key, size, seed=size).read_text()
+    row = {"key": key, "size": size, "bytes": len(value)}
+
+    open_module(page, NEUTRAL)
+    error = page.evaluate(SEED_JS, [key, value])
+    if error:
+        return {**row, "error": error}
+
+    mounts = []
+    for _ in range(REPEATS):
+        open_module(page, NEUTRAL)
+        page.evaluate(ARM_MOUNT_JS, module)
+        open_module(page, module)
+        mounts.append(page.evaluate("() => window.__benchMount"))
+
+    probe = page.evaluate(PROBE_JS, [key, REPEATS])
+    return {
+        **row,
+        "mountMs": _median([m["mountMs"] for m in mounts]),
+        "mountBlockingMs": _median([m["blockingMs"] for m in mounts]),
+        "hookMountMs": probe["hookMountMs"],
+        "setSyncMs": _median([s["syncMs"] for s in probe["sets"]]),
+        "setFrameMs": _median([s["frameMs"] for s in probe["sets"]]),
+        "setBlockingMs": probe["blockingMs"] / REPEATS,
+    }
+
+
+@scenario(fixtures=("onboarded",), tags=("bench", "dev-only"))
+def verify_kv_scaling(page):
+    page.goto(BASE_URL)
+    wait_for_app_ready(page)
+    import_app_module(page, "/src/lib/bench/use-kv-probe.tsx", "kvProbe")
+    page.evaluate(LONG_TASKS_JS)
+
+    rows = []
+    for key in KEYS:
+        module = KEY_MODULES[key]
+        # Load the module's lazy chunk so the first size is not a cold start.
+        open_module(page, NEUTRAL)
+        open_module(page, module)
+        for size in SIZES:
+            row = measure(page, key, module, size)
+            rows.append(row)
+            if "error" in row:
+                break  # larger sizes will not fit either
+
+    columns = [
+        ("key", "key", "s"),
+        ("size", "records", "d"),
+        ("bytes", "bytes", ",d"),
+        ("mountMs", "mount ms", ".1f"),
+        ("mountBlockingMs", "blocking", ".0f"),
+        ("hookMountMs", "hook ms", ".2f"),
+        ("setSyncMs", "set ms", ".2f"),
+        ("setFrameMs", "set+frame", ".1f"),
+        ("setBlockingMs", "blocking", ".0f"),
+        ("error", "error", "s"),
+    ]
+    print_table(rows, columns)
+    record("kvScaling", {key: [r for r in rows if r["key"] == key] for key in KEYS})
+    print(f"Curves written to {write_csv('kv-scaling', rows, [c[0] for c in columns])}")
+
+
+if __name__ == "__main__":
+    run_standalone(verify_kv_scaling)
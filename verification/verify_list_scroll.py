@@ -0,0 +1,179 @@
+"""How do long lists scroll?
+
+Three targets, each with 1k / 10k / 50k rows:
+
+    virtual    VirtualList / useVirtualScroll on its own root
+               (src/lib/bench/virtual-list-probe.tsx)
+    tasks      the Tasks module with generated tasks in localStorage
+    shopping   the Shopping module with generated shopping items
+
+Each target gets programmatic flick-scrolls: the scroller jumps by a start
+velocity every frame and decelerates like a touch fling, turning around at
+either end. Reports scroll FPS, dropped frames and the worst frame
+(harness/frames.py), the number of rows in the DOM, and, for the virtual
+list, the time from each scroll event to the commit it causes (p95) and
+React's render time. The Tasks and Shopping modules render every row, so
+their mount time is reported instead. Sizes that no longer fit in
+localStorage are reported as quota failures.
+
+    LIS_SCROLL_SIZES=1000,10000,50000   LIS_SCROLL_TARGETS=virtual,tasks,shopping
+    LIS_SCROLL_FLICKS=6   LIS_SCROLL_VELOCITY=120 (px per frame)
+    LIS_SCROLL_MIN_FPS=50 fails the scenario when a target scrolls slower
+"""
+
+import os
+import time
+
+from harness import BASE_URL, open_module, record, run_standalone, scenario, wait_for_app_ready
+from harness.bench import env_ints, import_app_module, print_table, summarize, write_csv
+from harness.datasets import dataset_file
+from harness.frames import frame_stats
+
+SIZES = env_ints("LIS_SCROLL_SIZES", (1000, 10000, 50000))
+TARGETS = [t for t in os.environ.get("LIS_SCROLL_TARGETS", "virtual,tasks,shopping").split(",") if t]
+FLICKS = int(os.environ.get("LIS_SCROLL_FLICKS", 6))
+VELOCITY = float(os.environ.get("LIS_SCROLL_VELOCITY", 120))
+MIN_FPS = float(os.environ.get("LIS_SCROLL_MIN_FPS", 0))
+# Mounting tens of thousands of unvirtualized rows is slow; that is the point.
+MOUNT_TIMEOUT = 180_000
+
+# Module target -> (storage key, selector matching one element per rendered row).
+MODULES = {
+    "tasks": ("tasks", '[aria-label^="Mark \\""]'),
+    "shopping": ("shopping-items", '[id^="item-"]'),
+}
+NEUTRAL = "settings"
+
+SEED_JS = """
+([key, value]) => {
+  try {
+    localStorage.setItem(key, value)
+    return null
+  } catch (e) {
+    localStorage.removeItem(key)
+    return e.name
+  }
+}
+"""
+
+# Flicks ``scroller`` (or the nearest scrollable ancestor of #main-content)
+# and returns the rAF intervals it saw.
+FLING_JS = """
+async ([flicks, velocity]) => {
+  const frame = () => new Promise(requestAnimationFrame)
+  const scrollable = el => {
+    for (; el; el = el.parentElement) {
+      const overflow = getComputedStyle(el).overflowY
+      if ((overflow === 'auto' || overflow === 'scroll') && el.scrollHeight > el.clientHeight) return el
+    }
+    return document.scrollingElement
+  }
+  const el = window.__benchScroller ?? scrollable(document.getElementById('main-content'))
+  const intervals = []
+  let direction = 1
+  let last = await frame()
+  for (let f = 0; f < flicks; f++) {
+    for (let v = velocity; v > 0.5; v *= 0.95) {
+      const max = el.scrollHeight - el.clientHeight
+      if ((direction > 0 && el.scrollTop >= max) || (direction < 0 && el.scrollTop <= 0)) direction = -direction
+      el.scrollTop += direction * v
+      const now = await frame()
+      intervals.push(now - last)
+      last = now
+    }
+  }
+  return intervals
+}
+"""
+
+
+def scroll_virtual(page, size) -> dict:
+    page.evaluate(
+        "size => { window.__benchProbe = window.__bench.virtualList.mountVirtualListProbe(size);"
+        " window.__benchScroller = window.__benchProbe.scroller }",
+        size,
+    )
+    intervals = page.evaluate(FLING_JS, [FLICKS, VELOCITY])
+    probe = page.evaluate("""() => {
+        const p = window.__benchProbe
+        const result = { mountMs: p.mountMs, rows: p.rows(), commits: p.commits }
+        p.unmount()
+        delete window.__benchProbe
+        delete window.__benchScroller
+        return result
+    }""")
+    commits = probe["commits"]
+    return {
+        **frame_stats(intervals),
+        "mountMs": probe["mountMs"],
+        "rows": probe["rows"],
+        "commits": len(commits),
+        "commitP95Ms": summarize([c["handlerToCommitMs"] for c in commits])["p95"] if commits else None,
+        "renderP95Ms": summarize([c["renderMs"] for c in commits])["p95"] if commits else None,
+    }
+
+
+def scroll_module(page, module, size) -> dict:
+    key, row_selector = MODULES[module]
+    open_module(page, NEUTRAL)
+    error = page.evaluate(SEED_JS, [key, dataset_file(key, size, seed=size).read_text()])
+    if error:
+        return {"error": error}
+
+    started = time.perf_counter()
+    open_module(page, module, timeout=MOUNT_TIMEOUT)
+    page.wait_for_selector(row_selector, timeout=MOUNT_TIMEOUT)
+    mount_ms = (time.perf_counter() - started) * 1000
+
+    intervals = page.evaluate(FLING_JS, [FLICKS, VELOCITY])
+    return {
+        **frame_stats(intervals),
+        "mountMs": mount_ms,
+        "rows": page.locator(row_selector).count(),
+    }
+
+
+@scenario(fixtures=("onboarded",), tags=("bench", "dev-only"))
+def verify_list_scroll(page):
+    page.goto(BASE_URL)
+    wait_for_app_ready(page)
+    if "virtual" in TARGETS:
+        import_app_module(page, "/src/lib/bench/virtual-list-probe.tsx", "virtualList")
+
+    rows = []
+    for target in TARGETS:
+        for size in SIZES:
+            if target == "virtual":
+                row = scroll_virtual(page, size)
+            else:
+                row = scroll_module(page, target, size)
+            rows.append({"target": target, "size": size, **row})
+            if "error" in row:
+                break  # larger sizes will not fit either
+        if target in MODULES:
+            # Leave the next target (and the storage quota) a clean slate.
+            open_module(page, NEUTRAL)
+            page.evaluate("key => localStorage.removeItem(key)", MODULES[target][0])
+
+    columns = [
+        ("target", "target", "s"),
+        ("size", "items", ",d"),
+        ("rows", "DOM rows", ",d"),
+        ("mountMs", "mount ms", ".0f"),
+        ("fps", "fps", ".1f"),
+        ("droppedPct", "dropped %", ".1f"),
+        ("worstMs", "worst ms", ".1f"),
+        ("commitP95Ms", "commit p95", ".2f"),
+        ("renderP95Ms", "render p95", ".2f"),
+        ("error", "error", "s"),
+    ]
+    print_table(rows, columns)
+    record("listScroll", {target: [r for r in rows if r["target"] == target] for target in TARGETS})
+    print(f"Results written to {write_csv('list-scroll', rows, [c[0] for c in columns])}")
+
+    slow = [f"{r['target']}@{r['size']} {r['fps']}fps" for r in rows if r.get("fps") is not None and r["fps"] < MIN_FPS]
+    assert not slow, f"Scrolling below LIS_SCROLL_MIN_FPS={MIN_FPS}: " + ", ".join(slow)
+
+
+if __name__ == "__main__":
+    run_standalone(verify_list_scroll)
@@ -1,31 +1,30 @@
-import time
-from playwright.sync_api import sync_playwright
+from harness import BASE_URL, run_standalone, scenario, skip_loading_screen, use_virtual_clock
 
-def verify_loading_screen():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        # Create a context with iPhone 16 viewport as often requested by this user
-        context = browser.new_context(viewport={"width": 393, "height": 852}, device_scale_factor=3)
-        page = context.new_page()
+# Create a context with iPhone 16 viewport as often requested by this user
+@scenario(context={"viewport": {"width": 393, "height": 852}, "device_scale_factor": 3})
+def verify_loading_screen(page):
+    # Virtual time: the random quote is the same on every run, and the 3.5s
+    # minimum display is skipped instead of waited out.
+    use_virtual_clock(page)
 
-        # Navigate to home. Loading screen appears immediately.
-        try:
-            page.goto("http://localhost:5173", timeout=60000)
-        except Exception as e:
-            print(f"Navigation error: {e}")
-            # Try capturing anyway in case it's just a load event timeout
-            page.screenshot(path="verification/loading_screen_error.png")
-            return
+    # Navigate to home. Loading screen appears immediately.
+    try:
+        page.goto(BASE_URL, timeout=60000)
+    except Exception:
+        # Try capturing anyway in case it's just a load event timeout
+        page.screenshot(path="verification/loading_screen_error.png")
+        raise
 
-        # Give it a moment to render the initial frame, but catch it before 3.5s
-        time.sleep(1)
+    # Catch it as soon as the first frame is up, well before 3.5s
+    page.get_by_alt_text("Loading").wait_for(state="visible")
 
-        # Take screenshot
-        output_path = "verification/loading_screen.png"
-        page.screenshot(path=output_path)
-        print(f"Screenshot saved to {output_path}")
+    # Take screenshot
+    output_path = "verification/loading_screen.png"
+    page.screenshot(path=output_path)
+    print(f"Screenshot saved to {output_path}")
 
-        browser.close()
+    # And it does hand over to the app once the minimum time has passed.
+    skip_loading_screen(page)
 
 if __name__ == "__main__":
-    verify_loading_screen()
+    run_standalone(verify_loading_screen)
@@ -0,0 +1,153 @@
+"""What does the first tap on each FloatingDock module cost?
+
+App.tsx lazy-loads every module. For each one this taps the dock and
+measures tap to first paint after the module has mounted (two frames after
+the ``module-mounted`` signal), broken down into:
+
+    fetch     tap to the last byte of the requests the tap started
+    compile   last byte to the chunk's import resolving (parse, compile and
+              evaluate the module graph; ``module-load:<id>:end`` mark)
+    render    import resolved to ``module-mounted``
+
+in three rounds: ``cold`` (first tap after a reload, HTTP cache disabled over
+CDP, service worker blocked), ``warm`` (second tap, module already
+evaluated), and ``cold`` again with each prefetch mode of
+src/lib/module-prefetch.ts switched on. Predictive mode first gets one
+training walk to learn the dock order. Between taps the scenario dwells
+for ``LIS_CHUNK_DWELL_MS``, like a user reading the screen, so idle
+prefetching has time to work.
+
+    LIS_CHUNK_MODULES=habits,finance,...   LIS_CHUNK_PREFETCH=off,idle,predictive
+    LIS_CHUNK_DWELL_MS=1500
+"""
+
+import os
+import statistics
+
+from harness import BASE_URL, record, run_standalone, scenario, wait_for_app_ready
+from harness.bench import print_table, write_csv
+
+DOCK_MODULES = "habits,finance,tasks,workouts,knox,shopping,calendar,golf,connections,settings"
+MODULES = [m for m in os.environ.get("LIS_CHUNK_MODULES", DOCK_MODULES).split(",") if m]
+MODES = [m for m in os.environ.get("LIS_CHUNK_PREFETCH", "off,idle,predictive").split(",") if m]
+DWELL_MS = int(os.environ.get("LIS_CHUNK_DWELL_MS", 1500))
+MOUNT_TIMEOUT = 60_000
+
+# Clicks the dock button for ``id`` and returns the tap's timings.
+TAP_JS = """
+async ([id, timeout]) => {
+  const frame = () => new Promise(requestAnimationFrame)
+  const button = document.querySelector(`nav[aria-label="Main Navigation"] [aria-label="${id}"]`)
+  const loadedBefore = performance.getEntriesByName(`module-load:${id}:end`).length > 0
+
+  const mounted = new Promise((resolve, reject) => {
+    const timer = setTimeout(() => reject(new Error(`${id} did not mount in ${timeout}ms`)), timeout)
+    const onSignal = e => {
+      if (e.detail.signal !== 'module-mounted' || e.detail.detail !== id) return
+      window.removeEventListener('app-readiness', onSignal)
+      clearTimeout(timer)
+      resolve(e.detail.at)
+    }
+    window.addEventListener('app-readiness', onSignal)
+  })
+  const tappedAt = performance.now()
+  button.click()
+  const mountedAt = await mounted
+  await frame()
+  await frame()
+  const paintAt = performance.now()
+
+  const requests = performance.getEntriesByType('resource').filter(r => r.startTime >= tappedAt && r.startTime <= mountedAt)
+  const fetchEnd = requests.length ? Math.max(...requests.map(r => r.responseEnd)) : tappedAt
+  const loadEnd = loadedBefore ? tappedAt : (performance.getEntriesByName(`module-load:${id}:end`).at(-1)?.startTime ?? fetchEnd)
+  return {
+    prefetched: loadedBefore,
+    requests: requests.length,
+    kb: requests.reduce((sum, r) => sum + (r.transferSize || r.encodedBodySize || 0), 0) / 1024,
+    fetchMs: fetchEnd - tappedAt,
+    compileMs: Math.max(0, loadEnd - fetchEnd),
+    renderMs: mountedAt - Math.max(loadEnd, tappedAt),
+    paintMs: paintAt - tappedAt,
+  }
+}
+"""
+
+
+def boot(page, mode):
+    page.evaluate(
+        "mode => mode === 'off' ? localStorage.removeItem('module-prefetch') : localStorage.setItem('module-prefetch', mode)",
+        mode,
+    )
+    page.reload()
+    wait_for_app_ready(page)
+    page.wait_for_timeout(DWELL_MS)
+
+
+def walk(page, mode, round_name):
+    rows = []
+    for module in MODULES:
+        timings = page.evaluate(TAP_JS, [module, MOUNT_TIMEOUT])
+        rows.append({"mode": mode, "round": round_name, "module": module, **timings})
+        # Deliberate think time between taps: this is what prefetching gets to use.
+        page.wait_for_timeout(DWELL_MS)
+    return rows
+
+
+@scenario(context={"service_workers": "block"}, fixtures=("onboarded",), tags=("bench",))
+def verify_module_chunks(page):
+    cdp = page.context.new_cdp_session(page)
+    cdp.send("Network.enable")
+    cdp.send("Network.setCacheDisabled", {"cacheDisabled": True})
+    page.goto(BASE_URL)
+    wait_for_app_ready(page)
+
+    rows = []
+    for mode in MODES:
+        if mode == "predictive":
+            page.evaluate("() => localStorage.removeItem('module-transitions')")
+            boot(page, mode)
+            walk(page, mode, "training")
+        boot(page, mode)
+        rows += walk(page, mode, "cold")
+        if mode == "off":
+            rows += walk(page, mode, "warm")
+    page.evaluate("() => localStorage.removeItem('module-prefetch')")
+
+    columns = [
+        ("mode", "prefetch", "s"),
+        ("round", "round", "s"),
+        ("module", "module", "s"),
+        ("prefetched", "ready", "d"),
+        ("requests", "reqs", "d"),
+        ("kb", "KB", ",.0f"),
+        ("fetchMs", "fetch ms", ".0f"),
+        ("compileMs", "compile ms", ".0f"),
+        ("renderMs", "render ms", ".0f"),
+        ("paintMs", "tap→paint ms", ".0f"),
+    ]
+    print_table(rows, columns)
+
+    summary = []
+    for mode, round_name in dict.fromkeys((r["mode"], r["round"]) for r in rows):
+        group = [r for r in rows if r["mode"] == mode and r["round"] == round_name]
+        summary.append({
+            "mode": mode,
+            "round": round_name,
+            "prefetched": f"{sum(r['prefetched'] for r in group)}/{len(group)}",
+            "paintMs": statistics.median(r["paintMs"] for r in group),
+            "worstMs": max(r["paintMs"] for r in group),
+        })
+    print_table(summary, [
+        ("mode", "prefetch", "s"),
+        ("round", "round", "s"),
+        ("prefetched", "ready", "s"),
+        ("paintMs", "median tap→paint", ".0f"),
+        ("worstMs", "worst", ".0f"),
+    ])
+
+    record("moduleChunks", {"taps": rows, "summary": summary})
+    print(f"Results written to {write_csv('module-chunks', rows, [c[0] for c in columns])}")
+
+
+if __name__ == "__main__":
+    run_standalone(verify_module_chunks)
@@ -0,0 +1,102 @@
+"""How does golf swing analysis cost scale with frame count?
+
+Feeds seeded synthetic swings (harness/pose.py) to analyzePoseData and
+calculateInstantaneousMetrics inside the page and records latency per frame
+count. Sizes and knobs come from the environment:
+
+    LIS_POSE_FRAMES=240,960,3840,7680   frames per swing (240fps -> 1s..32s)
+    LIS_POSE_NOISE=0.004                 landmark jitter (normalised units)
+    LIS_POSE_DROPOUT=0.02                per-landmark occlusion probability
+    LIS_POSE_REPEATS=5                   timed runs per size (after one warm-up)
+"""
+
+import os
+
+from harness import BASE_URL, record, run_standalone, scenario, wait_for_app_ready
+from harness.bench import env_ints, import_app_module, print_table, summarize
+from harness.pose import UNPACK_FRAMES_JS, generate_swing, pack_frames
+
+FRAME_COUNTS = env_ints("LIS_POSE_FRAMES", (240, 960, 3840, 7680))
+NOISE = float(os.environ.get("LIS_POSE_NOISE", 0.004))
+DROPOUT = float(os.environ.get("LIS_POSE_DROPOUT", 0.02))
+REPEATS = int(os.environ.get("LIS_POSE_REPEATS", 5))
+FPS = 240.0
+
+# Frames are unpacked before the clock starts so only the analysis is timed.
+# performance.now() is coarsened in the page, so the per-frame pass is timed
+# as a whole and divided by the frame count.
+BENCH_JS = """
+async ({ packed, repeats, unpack }) => {
+  const { analyzePoseData, calculateInstantaneousMetrics } = window.__bench.swing
+  const frames = (0, eval)(unpack)(packed)
+
+  const run = fn => {
+    fn() // warm-up so the JIT has seen the code
+    const samples = []
+    for (let r = 0; r < repeats; r++) {
+      const t0 = performance.now()
+      fn()
+      samples.push(performance.now() - t0)
+    }
+    return samples
+  }
+
+  try {
+    const analyze = run(() => analyzePoseData(frames))
+    const instant = run(() => {
+      for (let i = 0; i < frames.length; i++) calculateInstantaneousMetrics(frames[i])
+    })
+    return { analyze, instant }
+  } catch (e) {
+    return { error: `${e.name}: ${e.message}` }
+  }
+}
+"""
+
+
+@scenario(tags=("bench", "dev-only"))
+def verify_pose_analysis_scaling(page):
+    page.goto(BASE_URL)
+    wait_for_app_ready(page)
+    import_app_module(page, "/src/lib/golf/swing-analyzer.ts", "swing")
+
+    rows = []
+    for frames in FRAME_COUNTS:
+        swing = generate_swing(frames, fps=FPS, seed=frames, noise=NOISE, dropout=DROPOUT)
+        timings = page.evaluate(BENCH_JS, {"packed": pack_frames(swing), "repeats": REPEATS, "unpack": UNPACK_FRAMES_JS})
+        if "error" in timings:
+            rows.append({"frames": frames, "error": timings["error"]})
+            continue
+
+        analyze = summarize(timings["analyze"])
+        instant = summarize(timings["instant"])
+        rows.append({
+            "frames": frames,
+            "durationS": frames / FPS,
+            "analyzeMs": analyze["median"],
+            "analyzeP95Ms": analyze["p95"],
+            "analyzeUsPerFrame": analyze["median"] * 1000 / frames,
+            "instantTotalMs": instant["median"],
+            "instantUsPerFrame": instant["median"] * 1000 / frames,
+            "totalMs": analyze["median"] + instant["median"],
+        })
+
+    print_table(rows, [
+        ("frames", "frames", "d"),
+        ("analyzeMs", "analyze ms", ".2f"),
+        ("analyzeP95Ms", "p95", ".2f"),
+        ("analyzeUsPerFrame", "us/frame", ".2f"),
+        ("instantTotalMs", "instant ms", ".2f"),
+        ("instantUsPerFrame", "us/frame", ".2f"),
+        ("totalMs", "total ms", ".2f"),
+        ("error", "error", "s"),
+    ])
+    record("poseAnalysis", {"fps": FPS, "noise": NOISE, "dropout": DROPOUT, "rows": rows})
+
+    failed = [r for r in rows if "error" in r]
+    if failed:
+        raise AssertionError(f"Analysis failed at {failed[0]['frames']} frames: {failed[0]['error']}")
+
+
+if __name__ == "__main__":
+    run_standalone(verify_pose_analysis_scaling)
@@ -0,0 +1,287 @@
+"""Does the swing overlay keep up with playback, and what does each draw cost?
+
+Plays a synthetic swing clip (harness/clips.py) under a pose track of
+thousands of frames (harness/pose.py) spread over the clip, on two targets:
+
+    cockpit        the analysis cockpit (VideoPlayerContainer + OverlayCanvas),
+                   opened on a completed analysis seeded into localStorage
+    pose-overlay   PoseOverlay on its own root (src/lib/bench/pose-overlay-probe.tsx),
+                   with the frames passed in directly
+
+The probe wraps the overlay canvas's context and watches the video with
+requestVideoFrameCallback:
+
+    drawMs         one overlay draw (first clearRect to the end of that task)
+    budgetPct      p95 draw time as a share of one display frame
+    drawsPerFrame  overlay draws per presented video frame
+    duplicatePct   extra draws within one video frame
+    missedPct      presented video frames the overlay did not redraw for
+    skipped        video frames the compositor dropped (presentedFrames gaps)
+    droppedPct     display frames dropped during playback (harness/frames.py)
+    seekDrawMs     paused seek to the overlay's first draw of the new frame
+
+The pose track always runs faster than the clip's 30fps, so every video frame
+shows a new pose frame and should get exactly one draw; the run fails when
+duplicates or missed frames pass their budgets. Sizes that no longer fit in
+localStorage are reported as quota failures for the cockpit.
+
+    LIS_OVERLAY_FRAMES=600,2400,9600   LIS_OVERLAY_TARGETS=cockpit,pose-overlay
+    LIS_OVERLAY_CLIP_S=10   LIS_OVERLAY_PLAY_S=8   LIS_OVERLAY_SEEKS=20
+    LIS_OVERLAY_MAX_DUPLICATE_PCT=1   LIS_OVERLAY_MAX_MISSED_PCT=5
+"""
+
+import os
+
+from harness import BASE_URL, open_module, record, run_standalone, scenario, wait_for_app_ready
+from harness.bench import env_ints, import_app_module, print_table, summarize, write_csv
+from harness.clips import swing_clip
+from harness.frames import DEFAULT_REFRESH_HZ, frame_stats
+from harness.pose import UNPACK_FRAMES_JS, generate_swing, pack_frames
+
+FRAME_COUNTS = env_ints("LIS_OVERLAY_FRAMES", (600, 2400, 9600))
+TARGETS = [t for t in os.environ.get("LIS_OVERLAY_TARGETS", "cockpit,pose-overlay").split(",") if t]
+CLIP_S = float(os.environ.get("LIS_OVERLAY_CLIP_S", 10))
+PLAY_S = float(os.environ.get("LIS_OVERLAY_PLAY_S", 8))
+SEEKS = int(os.environ.get("LIS_OVERLAY_SEEKS", 20))
+MAX_DUPLICATE_PCT = float(os.environ.get("LIS_OVERLAY_MAX_DUPLICATE_PCT", 1))
+MAX_MISSED_PCT = float(os.environ.get("LIS_OVERLAY_MAX_MISSED_PCT", 5))
+VIDEO_PATH = "/__bench/swing.webm"
+FRAME_BUDGET_MS = 1000 / DEFAULT_REFRESH_HZ
+
+# Stores one completed analysis of the unpacked frames under the app's key.
+SEED_JS = """
+({ packed, unpack, videoUrl }) => {
+  const { analyzePoseData } = window.__bench.swing
+  const poseData = (0, eval)(unpack)(packed)
+  const now = new Date().toISOString()
+  const analysis = {
+    id: 'bench-swing',
+    videoId: 'bench-swing',
+    videoUrl,
+    club: 'Driver',
+    status: 'completed',
+    uploadedAt: now,
+    processedAt: now,
+    poseData,
+    metrics: analyzePoseData(poseData),
+    feedback: { overallScore: 80, strengths: [], improvements: [], drills: [], aiInsights: '' },
+    processingProgress: 100,
+  }
+  const value = JSON.stringify([analysis])
+  try {
+    localStorage.setItem('golf-swing-analyses', value)
+  } catch (e) {
+    return { error: `${e.name}: ${e.message} (${value.length.toLocaleString()} chars)` }
+  }
+  return { chars: value.length }
+}
+"""
+
+PLAYBACK_JS = """
+async ({ playMs, seeks }) => {
+  const probe = window.__benchProbe
+  const video = probe ? probe.video : document.querySelector('video')
+  const canvas = probe ? probe.canvas : video.parentElement.querySelector('canvas')
+  const ctx = canvas.getContext('2d')
+  const frame = () => new Promise(requestAnimationFrame)
+  if (!('requestVideoFrameCallback' in video)) return { error: 'requestVideoFrameCallback is not available' }
+
+  // A draw starts at its first clearRect and ends when its task does.
+  let videoFrames = 0
+  let drawing = false
+  const draws = []
+  const clearRect = ctx.clearRect
+  ctx.clearRect = function (...args) {
+    if (!drawing) {
+      drawing = true
+      const started = performance.now()
+      const videoFrame = videoFrames
+      queueMicrotask(() => {
+        drawing = false
+        draws.push({ videoFrame, started, ms: performance.now() - started })
+      })
+    }
+    return clearRect.apply(this, args)
+  }
+
+  // Video frames and display frames while playing.
+  let watching = true, lastPresented = null, skipped = 0
+  const onVideoFrame = (_now, metadata) => {
+    if (!watching) return
+    if (lastPresented !== null) skipped += Math.max(0, metadata.presentedFrames - lastPresented - 1)
+    lastPresented = metadata.presentedFrames
+    videoFrames++
+    video.requestVideoFrameCallback(onVideoFrame)
+  }
+
+  video.currentTime = 0
+  await new Promise(resolve => video.addEventListener('seeked', resolve, { once: true }))
+  await video.play()
+  video.requestVideoFrameCallback(onVideoFrame)
+  const rafIntervals = []
+  let last = await frame()
+  const end = last + playMs
+  while (last < end) {
+    const now = await frame()
+    rafIntervals.push(now - last)
+    last = now
+  }
+  watching = false
+  const played = videoFrames
+
+  // Draws per interval between consecutive video frames (the first and last are partial).
+  const perFrame = new Array(played + 1).fill(0)
+  for (const d of draws) if (d.videoFrame <= played) perFrame[d.videoFrame]++
+  const intervals = perFrame.slice(1, -1)
+  const playDraws = draws.filter(d => d.videoFrame >= 1 && d.videoFrame < played)
+
+  // Paused seeks: time to the overlay's first draw of the new position.
+  video.pause()
+  await frame()
+  const seekDraws = [], seekDrawMs = []
+  for (let i = 0; i < seeks; i++) {
+    const before = draws.length
+    const started = performance.now()
+    video.currentTime = ((i + 0.5) / seeks) * video.duration
+    await new Promise(resolve => video.addEventListener('seeked', resolve, { once: true }))
+    await frame()
+    await frame()
+    const mine = draws.slice(before)
+    seekDraws.push(mine.length)
+    if (mine.length) seekDrawMs.push(mine[0].started + mine[0].ms - started)
+  }
+  ctx.clearRect = clearRect
+
+  return {
+    videoFrames: intervals.length,
+    draws: playDraws.length,
+    drawMs: playDraws.map(d => d.ms),
+    duplicates: intervals.reduce((sum, n) => sum + Math.max(0, n - 1), 0),
+    missed: intervals.filter(n => n === 0).length,
+    skipped,
+    rafIntervals,
+    seekDraws,
+    seekDrawMs,
+  }
+}
+"""
+
+
+def playback(page):
+    result = page.evaluate(PLAYBACK_JS, {"playMs": PLAY_S * 1000, "seeks": SEEKS})
+    if "error" in result:
+        return {"error": result["error"]}
+    video_frames = result["videoFrames"]
+    if not video_frames:
+        return {"error": f"no video frames presented in {PLAY_S:g}s"}
+
+    draw = summarize(result["drawMs"]) if result["drawMs"] else {"median": None, "p95": None}
+    return {
+        "videoFrames": video_frames,
+        "draws": result["draws"],
+        "drawMs": draw["median"],
+        "drawP95Ms": draw["p95"],
+        "budgetPct": 100 * draw["p95"] / FRAME_BUDGET_MS if draw["p95"] is not None else None,
+        "drawsPerFrame": result["draws"] / video_frames,
+        "duplicatePct": 100 * result["duplicates"] / video_frames,
+        "missedPct": 100 * result["missed"] / video_frames,
+        "skipped": result["skipped"],
+        "droppedPct": frame_stats(result["rafIntervals"])["droppedPct"],
+        "drawsPerSeek": sum(result["seekDraws"]) / len(result["seekDraws"]) if result["seekDraws"] else None,
+        "seekDrawMs": summarize(result["seekDrawMs"])["median"] if result["seekDrawMs"] else None,
+    }
+
+
+def swing(frames):
+    track = generate_swing(frames, fps=frames / CLIP_S, seed=frames, world=False, precision=4)
+    return {"packed": pack_frames(track), "unpack": UNPACK_FRAMES_JS, "videoUrl": VIDEO_PATH}
+
+
+def play_cockpit(page, frames):
+    page.goto(BASE_URL)
+    wait_for_app_ready(page)
+    import_app_module(page, "/src/lib/golf/swing-analyzer.ts", "swing")
+    seeded = page.evaluate(SEED_JS, swing(frames))
+    if "error" in seeded:
+        return {"error": f"quota: {seeded['error']}"}
+
+    open_module(page, "golf")
+    page.get_by_text("Driver").first.click()
+    page.wait_for_function("() => document.querySelector('video')?.readyState >= 2")
+    row = playback(page)
+    page.evaluate("() => localStorage.removeItem('golf-swing-analyses')")
+    return row
+
+
+def play_pose_overlay(page, frames):
+    page.evaluate(
+        "({ packed, unpack, videoUrl }) => {"
+        " window.__benchProbe = window.__bench.poseOverlay.mountPoseOverlayProbe(videoUrl, (0, eval)(unpack)(packed)) }",
+        swing(frames),
+    )
+    page.wait_for_function("() => window.__benchProbe.video.readyState >= 2")
+    row = playback(page)
+    page.evaluate("() => { window.__benchProbe.unmount(); delete window.__benchProbe }")
+    return row
+
+
+@scenario(context={"viewport": {"width": 1280, "height": 800}}, tags=("bench", "dev-only"))
+def verify_pose_overlay(page):
+    page.goto(BASE_URL)
+    wait_for_app_ready(page)
+    clip = swing_clip(page, CLIP_S)
+    page.route(f"**{VIDEO_PATH}", lambda route: route.fulfill(path=clip, content_type="video/webm"))
+
+    rows = []
+    for target in TARGETS:
+        if target == "pose-overlay":
+            page.goto(BASE_URL)
+            wait_for_app_ready(page)
+            import_app_module(page, "/src/lib/bench/pose-overlay-probe.tsx", "poseOverlay")
+        for frames in FRAME_COUNTS:
+            row = play_cockpit(page, frames) if target == "cockpit" else play_pose_overlay(page, frames)
+            rows.append({"target": target, "frames": frames, **row})
+            if row.get("error", "").startswith("quota"):
+                break  # larger tracks will not fit either
+
+    columns = [
+        ("target", "target", "s"),
+        ("frames", "pose frames", ",d"),
+        ("videoFrames", "video frames", "d"),
+        ("drawMs", "draw ms", ".3f"),
+        ("drawP95Ms", "p95", ".3f"),
+        ("budgetPct", "% budget", ".1f"),
+        ("drawsPerFrame", "draws/frame", ".2f"),
+        ("duplicatePct", "dup %", ".1f"),
+        ("missedPct", "missed %", ".1f"),
+        ("skipped", "skipped", "d"),
+        ("droppedPct", "dropped %", ".1f"),
+        ("drawsPerSeek", "draws/seek", ".2f"),
+        ("seekDrawMs", "seek->draw ms", ".1f"),
+        ("error", "error", "s"),
+    ]
+    print(f"Overlay during {PLAY_S:g}s of playback, {FRAME_BUDGET_MS:.1f}ms frame budget:")
+    print_table(rows, columns)
+    record("poseOverlay", {
+        "clipS": CLIP_S,
+        "playS": PLAY_S,
+        "frameBudgetMs": FRAME_BUDGET_MS,
+        **{target: [r for r in rows if r["target"] == target] for target in TARGETS},
+    })
+    print(f"Results written to {write_csv('pose-overlay', rows, [c[0] for c in columns])}")
+
+    failed = [r for r in rows if "error" in r and not r["error"].startswith("quota")]
+    assert not failed, f"{failed[0]['target']}@{failed[0]['frames']} failed: {failed[0]['error']}"
+    over = [
+        f"{r['target']}@{r['frames']} {r['duplicatePct']:.1f}% duplicate, {r['missedPct']:.1f}% missed"
+        for r in rows
+        if "error" not in r and (r["duplicatePct"] > MAX_DUPLICATE_PCT or r["missedPct"] > MAX_MISSED_PCT)
+    ]
+    assert not over, (
+        f"Overlay is not drawing once per video frame (LIS_OVERLAY_MAX_DUPLICATE_PCT={MAX_DUPLICATE_PCT:g}, "
+        f"LIS_OVERLAY_MAX_MISSED_PCT={MAX_MISSED_PCT:g}): " + ", ".join(over)
+    )
+
+
+if __name__ == "__main__":
+    run_standalone(verify_pose_overlay)
@@ -0,0 +1,86 @@
+"""Does a huge program stall at START SESSION?
+
+Builds plans with 10 to 2000 exercises (harness/datasets.py
+``workout_plan``) in blocks that cycle strength -> superset -> circuit, each
+move with ``LIS_QUEUE_SETS`` sets or rounds, and measures in the browser:
+
+    queue    generateSessionQueue() on the plan's blocks (median of 5)
+    mount    ActiveWorkout's first commit, queue building included
+             (src/lib/bench/active-workout-probe.tsx), plus React's render time
+
+and prints both against plan size, with the number of steps the queue holds.
+
+    LIS_QUEUE_EXERCISES=10,100,500,2000   LIS_QUEUE_SETS=5   LIS_QUEUE_BLOCK=4
+    LIS_QUEUE_MAX_MOUNT_MS=0 fails the scenario when a mount is slower
+"""
+
+import os
+
+from harness import BASE_URL, open_module, record, run_standalone, scenario, wait_for_app_ready
+from harness.bench import env_ints, import_app_module, print_table, write_csv
+from harness.datasets import workout_plan
+
+EXERCISES = env_ints("LIS_QUEUE_EXERCISES", (10, 100, 500, 2000))
+SETS = int(os.environ.get("LIS_QUEUE_SETS", 5))
+BLOCK = int(os.environ.get("LIS_QUEUE_BLOCK", 4))
+MAX_MOUNT_MS = float(os.environ.get("LIS_QUEUE_MAX_MOUNT_MS", 0))
+REPEATS = 5
+
+MEASURE_JS = """
+([plan, repeats]) => {
+  const session = {
+    id: plan.id, title: plan.name, description: plan.focus,
+    totalDurationMin: plan.estimatedDuration, difficulty: plan.difficulty, blocks: plan.blocks,
+  }
+  const times = []
+  let steps = 0
+  for (let i = 0; i < repeats; i++) {
+    const started = performance.now()
+    steps = window.__bench.queue.generateSessionQueue(session).length
+    times.push(performance.now() - started)
+  }
+  times.sort((a, b) => a - b)
+
+  const probe = window.__bench.activeWorkout.mountActiveWorkoutProbe(plan)
+  probe.unmount()
+  return { steps, queueMs: times[Math.floor(times.length / 2)], mountMs: probe.mountMs, renderMs: probe.renderMs }
+}
+"""
+
+
+@scenario(fixtures=("onboarded",), tags=("bench", "dev-only"))
+def verify_session_queue(page):
+    page.goto(BASE_URL)
+    wait_for_app_ready(page)
+    open_module(page, "settings")
+    import_app_module(page, "/src/lib/workout/session-queue.ts", "queue")
+    import_app_module(page, "/src/lib/bench/active-workout-probe.tsx", "activeWorkout")
+
+    rows = []
+    for exercises in EXERCISES:
+        plan = workout_plan(exercises, sets=SETS, block_size=BLOCK, seed=exercises)
+        rows.append({
+            "exercises": exercises,
+            "blocks": len(plan["blocks"]),
+            **page.evaluate(MEASURE_JS, [plan, REPEATS]),
+        })
+
+    columns = [
+        ("exercises", "exercises", ",d"),
+        ("blocks", "blocks", ",d"),
+        ("steps", "steps", ",d"),
+        ("queueMs", "queue ms", ".2f"),
+        ("mountMs", "mount ms", ".1f"),
+        ("renderMs", "render ms", ".1f"),
+    ]
+    print_table(rows, columns)
+    record("sessionQueue", rows)
+    print(f"Results written to {write_csv('session-queue', rows, [c[0] for c in columns])}")
+
+    if MAX_MOUNT_MS:
+        slow = [f"{r['exercises']} exercises: {r['mountMs']:.0f}ms" for r in rows if r["mountMs"] > MAX_MOUNT_MS]
+        assert not slow, f"ActiveWorkout mount above LIS_QUEUE_MAX_MOUNT_MS={MAX_MOUNT_MS}: " + ", ".join(slow)
+
+
+if __name__ == "__main__":
+    run_standalone(verify_session_queue)
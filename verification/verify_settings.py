@@ -1,37 +1,23 @@
-import time
-from playwright.sync_api import sync_playwright
+from harness import BASE_URL, open_module, run_standalone, scenario, wait_for_animation_idle
 
-def verify_settings():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        # Emulate iPhone 16
-        iphone_16 = p.devices['iPhone 14 Pro Max'] # Close enough approximation
-        # Override viewport in the device dict if needed, or pass explicitly
-        # device_dict already has viewport, so we shouldn't pass it again as kwarg
+# Emulate iPhone 16
+@scenario(device='iPhone 14 Pro Max') # Close enough approximation
+def verify_settings(page):
+    # Navigate
+    page.goto(BASE_URL)
 
-        context = browser.new_context(**iphone_16)
-        page = context.new_page()
+    # Wait for load and go to Settings
+    open_module(page, "settings")
 
-        # Navigate
-        page.goto("http://localhost:5173")
+    # Scroll to Module Data section - use a more specific selector
+    # The CardTitle has "Module Data"
+    page.locator('div', has_text="Module Data").first.scroll_into_view_if_needed()
 
-        # Wait for load
-        page.wait_for_load_state('domcontentloaded')
+    # Wait for animations
+    wait_for_animation_idle(page)
 
-        # Go to Settings
-        page.click('button[aria-label="settings"]')
-
-        # Scroll to Module Data section - use a more specific selector
-        # The CardTitle has "Module Data"
-        page.locator('div', has_text="Module Data").first.scroll_into_view_if_needed()
-
-        # Wait a bit for animations
-        time.sleep(1)
-
-        # Screenshot
-        page.screenshot(path="verification/settings_module_reset.png", full_page=True)
-
-        browser.close()
+    # Screenshot
+    page.screenshot(path="verification/settings_module_reset.png", full_page=True)
 
 if __name__ == "__main__":
-    verify_settings()
+    run_standalone(verify_settings)
@@ -0,0 +1,217 @@
+"""Throughput of the real SwingVideoProcessor.processVideo in headless Chromium.
+
+Pushes dummy_swing.mp4 and longer synthetic clips (harness/clips.py) through
+the processor with the MediaPipe model served locally (harness/offline.py),
+and records per clip:
+
+    fps            frames processed per second of wall time (excluding warm-up)
+    seekMs         currentTime assignment -> 'seeked', per frame
+    inferenceMs    pose.send() round trip, per frame
+    drawMs         drawImage of the frame onto the processing canvas
+    initMs         pose.initialize() (model download + graph setup)
+    peakHeapMB     peak JS heap sampled every 50ms
+    peakWasmMB     peak size of the WebAssembly memories MediaPipe allocates
+
+Sources come from the environment. LIS_SWING_CLIPS sets the lengths of the
+generated clips in seconds. LIS_SWING_VIDEOS replaces dummy_swing.mp4 with real recordings.
+
+    LIS_SWING_CLIPS=2,10,30   LIS_SWING_VIDEOS=/path/a.mp4,/path/b.mov
+    LIS_SWING_TIMEOUT_S=600   per-clip limit before a hung seek is reported
+"""
+
+import base64
+import mimetypes
+import os
+from pathlib import Path
+
+from harness import BASE_URL, record, run_standalone, scenario, use_offline, wait_for_app_ready
+from harness.bench import env_ints, import_app_module, print_table, summarize
+from harness.clips import swing_clip
+from harness.config import REPO_ROOT
+
+CLIP_SECONDS = env_ints("LIS_SWING_CLIPS", (2, 10))
+TIMEOUT_S = float(os.environ.get("LIS_SWING_TIMEOUT_S", 600))
+VIDEOS = [Path(p) for p in os.environ.get("LIS_SWING_VIDEOS", "").split(",") if p] or [REPO_ROOT / "dummy_swing.mp4"]
+
+# Installed once: tracks every WebAssembly.Memory so its growth can be sampled.
+WASM_TRACKING_JS = """
+() => {
+  if (window.__benchWasmMemories) return
+  const memories = (window.__benchWasmMemories = new Set())
+  const collect = result => {
+    const instance = result.instance ?? result
+    for (const value of Object.values(instance.exports ?? {})) {
+      if (value instanceof WebAssembly.Memory) memories.add(value)
+    }
+    return result
+  }
+  const Memory = WebAssembly.Memory
+  WebAssembly.Memory = function (descriptor) {
+    const memory = new Memory(descriptor)
+    memories.add(memory)
+    return memory
+  }
+  WebAssembly.Memory.prototype = Memory.prototype
+  const instantiate = WebAssembly.instantiate
+  WebAssembly.instantiate = (...args) => instantiate(...args).then(collect)
+  const instantiateStreaming = WebAssembly.instantiateStreaming
+  if (instantiateStreaming) {
+    WebAssembly.instantiateStreaming = (...args) => instantiateStreaming(...args).then(collect)
+  }
+}
+"""
+
+PROCESS_JS = """
+async ({ data, name, type, timeoutMs }) => {
+  const bytes = Uint8Array.from(atob(data), c => c.charCodeAt(0))
+  const file = new File([bytes], name, { type })
+  const { SwingVideoProcessor } = window.__bench.video
+
+  const seeks = [], inference = [], draws = []
+  let initMs = null
+
+  // Seek latency: time from the currentTime assignment to 'seeked'.
+  const currentTime = Object.getOwnPropertyDescriptor(HTMLMediaElement.prototype, 'currentTime')
+  Object.defineProperty(HTMLMediaElement.prototype, 'currentTime', {
+    configurable: true,
+    get: currentTime.get,
+    set(value) {
+      const t0 = performance.now()
+      this.addEventListener('seeked', () => seeks.push(performance.now() - t0), { once: true })
+      currentTime.set.call(this, value)
+    },
+  })
+
+  const processor = new SwingVideoProcessor()
+  const pose = processor.pose
+  const send = pose.send.bind(pose)
+  pose.send = async input => {
+    const t0 = performance.now()
+    await send(input)
+    inference.push(performance.now() - t0)
+  }
+  const initialize = pose.initialize.bind(pose)
+  pose.initialize = async () => {
+    const t0 = performance.now()
+    await initialize()
+    initMs = performance.now() - t0
+  }
+  const ctx = processor.ctx
+  const drawImage = ctx.drawImage.bind(ctx)
+  ctx.drawImage = (...args) => {
+    const t0 = performance.now()
+    drawImage(...args)
+    draws.push(performance.now() - t0)
+  }
+
+  let peakHeap = 0, peakWasm = 0
+  const sample = () => {
+    peakHeap = Math.max(peakHeap, performance.memory?.usedJSHeapSize ?? 0)
+    let wasm = 0
+    window.__benchWasmMemories.forEach(m => { wasm += m.buffer.byteLength })
+    peakWasm = Math.max(peakWasm, wasm)
+  }
+  const sampler = setInterval(sample, 50)
+
+  const started = performance.now()
+  let frames = null, error = null
+  try {
+    const timeout = new Promise((_, reject) =>
+      setTimeout(() => reject(new Error(`no result after ${timeoutMs / 1000}s`)), timeoutMs))
+    frames = await Promise.race([processor.processVideo(file, () => {}), timeout])
+  } catch (e) {
+    error = `${e.name}: ${e.message}`
+  } finally {
+    clearInterval(sampler)
+    sample()
+    Object.defineProperty(HTMLMediaElement.prototype, 'currentTime', currentTime)
+  }
+  const totalMs = performance.now() - started
+
+  return {
+    error,
+    frames: frames?.length ?? 0,
+    detected: frames?.filter(f => f.landmarks.length).length ?? 0,
+    totalMs,
+    initMs,
+    seeks,
+    inference,
+    draws,
+    peakHeapMB: peakHeap / 1048576,
+    peakWasmMB: peakWasm / 1048576,
+  }
+}
+"""
+
+
+def _median(samples):
+    return summarize(samples)["median"] if samples else None
+
+
+def _p95(samples):
+    return summarize(samples)["p95"] if samples else None
+
+
+def process(page, path):
+    result = page.evaluate(PROCESS_JS, {
+        "data": base64.b64encode(path.read_bytes()).decode(),
+        "name": path.name,
+        "type": mimetypes.guess_type(path.name)[0] or "video/webm",
+        "timeoutMs": TIMEOUT_S * 1000,
+    })
+    row = {"clip": path.name, "bytes": path.stat().st_size, "error": result["error"]}
+    if result["error"]:
+        return row
+
+    work_s = (result["totalMs"] - (result["initMs"] or 0)) / 1000
+    return {
+        **row,
+        "frames": result["frames"],
+        "detected": result["detected"],
+        "totalS": result["totalMs"] / 1000,
+        "initMs": result["initMs"],
+        "fps": result["frames"] / work_s if work_s > 0 else None,
+        "seekMs": _median(result["seeks"]),
+        "seekP95Ms": _p95(result["seeks"]),
+        "inferenceMs": _median(result["inference"]),
+        "inferenceP95Ms": _p95(result["inference"]),
+        "drawMs": _median(result["draws"]),
+        "peakHeapMB": result["peakHeapMB"],
+        "peakWasmMB": result["peakWasmMB"],
+    }
+
+
+@scenario(tags=("bench", "dev-only"))
+def verify_swing_processing(page):
+    use_offline(page)
+    page.goto(BASE_URL)
+    wait_for_app_ready(page)
+    import_app_module(page, "/src/lib/golf/video-processor.ts", "video")
+    page.evaluate(WASM_TRACKING_JS)
+
+    sources = VIDEOS + [swing_clip(page, seconds) for seconds in CLIP_SECONDS]
+    rows = [process(page, path) for path in sources]
+
+    print_table(rows, [
+        ("clip", "clip", "s"),
+        ("frames", "frames", "d"),
+        ("detected", "posed", "d"),
+        ("fps", "fps", ".1f"),
+        ("seekMs", "seek ms", ".1f"),
+        ("seekP95Ms", "p95", ".1f"),
+        ("inferenceMs", "infer ms", ".1f"),
+        ("inferenceP95Ms", "p95", ".1f"),
+        ("drawMs", "draw ms", ".2f"),
+        ("initMs", "init ms", ".0f"),
+        ("peakHeapMB", "heap MB", ".1f"),
+        ("peakWasmMB", "wasm MB", ".1f"),
+        ("error", "error", "s"),
+    ])
+    record("swingProcessing", rows)
+
+    if not any(r.get("frames") for r in rows):
+        raise AssertionError("No clip could be processed: " + "; ".join(f"{r['clip']}: {r['error']}" for r in rows))
+
+
+if __name__ == "__main__":
+    run_standalone(verify_swing_processing)
@@ -0,0 +1,126 @@
+"""How does AccountantSync's IndexedDB queue hold up after a week offline?
+
+Queues 1k / 10k / 50k transactions through ``accountantSync``
+(src/lib/finance/sync-storage.ts) twice: one IDB transaction per entry
+(``queueTransaction`` / ``updateTransactionStatus``), and batched
+(``queueTransactions`` / ``updateTransactionStatuses``). For each it reports:
+
+    queue      time to queue every entry, and entries per second
+    pending    getPendingTransactions() latency (median of 5 reads)
+    flush      getQueueForFlush() + marking every entry synced + clearSyncedTransactions()
+
+The store is emptied before every run, so runs do not see each other's rows.
+
+    LIS_SYNC_SIZES=1000,10000,50000   LIS_SYNC_MODES=single,batched
+"""
+
+import os
+
+from harness import BASE_URL, open_module, record, run_standalone, scenario, wait_for_app_ready
+from harness.bench import env_ints, import_app_module, print_table, write_csv
+
+SIZES = env_ints("LIS_SYNC_SIZES", (1000, 10000, 50000))
+MODES = [m for m in os.environ.get("LIS_SYNC_MODES", "single,batched").split(",") if m]
+PENDING_READS = 5
+
+# Runs one queue / read / flush cycle and returns its timings.
+CYCLE_JS = """
+async ([size, batched, reads]) => {
+  const sync = window.__bench.sync.accountantSync
+  const clear = () => new Promise((resolve, reject) => {
+    const open = indexedDB.open('finance-v3-db')
+    open.onerror = () => reject(open.error)
+    open.onsuccess = () => {
+      const tx = open.result.transaction('transaction_queue', 'readwrite')
+      tx.objectStore('transaction_queue').clear()
+      tx.oncomplete = () => { open.result.close(); resolve() }
+      tx.onerror = () => reject(tx.error)
+    }
+  })
+  const entries = Array.from({ length: size }, (_, i) => ({
+    amount: (i % 97) + 0.99,
+    categoryName: ['Food', 'Transport', 'Housing', 'Fun'][i % 4],
+    description: `Offline entry ${i}`,
+  }))
+  await sync.getPendingTransactions()  // open the database outside the timings
+  await clear()
+
+  let started = performance.now()
+  if (batched) {
+    await sync.queueTransactions(entries)
+  } else {
+    for (const e of entries) await sync.queueTransaction(e.amount, e.categoryName, e.description)
+  }
+  const queueMs = performance.now() - started
+
+  const pendingTimes = []
+  let pending = 0
+  for (let i = 0; i < reads; i++) {
+    started = performance.now()
+    pending = (await sync.getPendingTransactions()).length
+    pendingTimes.push(performance.now() - started)
+  }
+  pendingTimes.sort((a, b) => a - b)
+
+  started = performance.now()
+  const queue = await sync.getQueueForFlush()
+  if (batched) {
+    await sync.updateTransactionStatuses(queue.map(tx => tx.id), 'synced')
+  } else {
+    for (const tx of queue) await sync.updateTransactionStatus(tx.id, 'synced')
+  }
+  const updateMs = performance.now() - started
+  started = performance.now()
+  await sync.clearSyncedTransactions()
+  const clearMs = performance.now() - started
+
+  return {
+    queueMs,
+    pending,
+    pendingMs: pendingTimes[Math.floor(pendingTimes.length / 2)],
+    updateMs,
+    clearMs,
+    left: (await sync.getPendingTransactions()).length,
+  }
+}
+"""
+
+
+@scenario(fixtures=("onboarded",), tags=("bench", "dev-only"))
+def verify_sync_queue(page):
+    page.goto(BASE_URL)
+    wait_for_app_ready(page)
+    open_module(page, "settings")
+    import_app_module(page, "/src/lib/finance/sync-storage.ts", "sync")
+
+    rows = []
+    for size in SIZES:
+        for mode in MODES:
+            result = page.evaluate(CYCLE_JS, [size, mode == "batched", PENDING_READS])
+            rows.append({
+                "size": size,
+                "mode": mode,
+                **result,
+                "queuePerS": size / result["queueMs"] * 1000 if result["queueMs"] else None,
+                "flushMs": result["updateMs"] + result["clearMs"],
+            })
+            assert result["pending"] == size, f"{mode}@{size}: {result['pending']} pending after queueing"
+            assert result["left"] == 0, f"{mode}@{size}: {result['left']} still pending after the flush"
+
+    columns = [
+        ("size", "entries", ",d"),
+        ("mode", "mode", "s"),
+        ("queueMs", "queue ms", ".0f"),
+        ("queuePerS", "queued/s", ",.0f"),
+        ("pendingMs", "pending ms", ".1f"),
+        ("updateMs", "update ms", ".0f"),
+        ("clearMs", "clear ms", ".0f"),
+        ("flushMs", "flush ms", ".0f"),
+    ]
+    print_table(rows, columns)
+    record("syncQueue", rows)
+    print(f"Results written to {write_csv('sync-queue', rows, [c[0] for c in columns])}")
+
+
+if __name__ == "__main__":
+    run_standalone(verify_sync_queue)
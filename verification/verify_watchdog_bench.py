@@ -0,0 +1,216 @@
+"""How expensive is BudgetWatchdog with a big ledger?
+
+Generates completed audits with hundreds of categories, each with dated
+subcategory spends (harness/datasets.py ``finance_audit``), and measures:
+
+    checks     BudgetWatchdog.runChecks() per call, with incremental parsing
+               off (both blobs and every date re-parsed per check) and on
+               (re-parsed only when the stored strings change)
+    cooldown   a burst of checks against a ledger that trips the runway
+               alert: it must fire exactly once, and nothing else may
+    burst      window.triggerWatchdog() fired repeatedly on the Finance
+               module, all in one task or one per frame: dispatch time,
+               time until The Accountant modal is on screen, and how many
+               modals and alert bubbles it leaves behind
+
+The app runs on the virtual clock starting at the datasets' EPOCH (the 1st
+of the month), so the variance check is active and every run scans the same
+entries. The large ledgers hold enough liquid assets for their size and
+nothing spent this month, so they raise no alert and every check does its
+full scan; the benchmark fails if one does. Cooldowns are cleared before
+each mode.
+
+    LIS_WATCHDOG_CATEGORIES=50,200,800   LIS_WATCHDOG_SUBCATEGORIES=10
+    LIS_WATCHDOG_CHECKS=50   LIS_WATCHDOG_BURST=20
+"""
+
+import json
+import os
+
+from playwright.sync_api import expect
+
+from harness import (
+    BASE_URL,
+    open_module,
+    record,
+    run_standalone,
+    scenario,
+    skip_loading_screen,
+    use_virtual_clock,
+)
+from harness.bench import env_ints, import_app_module, print_table, summarize, write_csv
+from harness.datasets import finance_audit
+
+CATEGORIES = env_ints("LIS_WATCHDOG_CATEGORIES", (50, 200, 800))
+SUBCATEGORIES = int(os.environ.get("LIS_WATCHDOG_SUBCATEGORIES", 10))
+CHECKS = int(os.environ.get("LIS_WATCHDOG_CHECKS", 50))
+BURST = int(os.environ.get("LIS_WATCHDOG_BURST", 20))
+NEUTRAL = "settings"
+BLUEPRINT_TIMEOUT = 60_000
+
+CLEAR_COOLDOWNS_JS = """
+() => {
+  localStorage.removeItem('watchdog-cooldown-Runway')
+  localStorage.removeItem('watchdog-cooldown-Variance')
+}
+"""
+
+SEED_JS = """
+([audit, report]) => {
+  localStorage.setItem('finance-audit-v2', audit)
+  localStorage.setItem('finance-report-v2', report)
+}
+"""
+
+CHECKS_JS = """
+async ([checks, incremental]) => {
+  const watchdog = window.__bench.watchdog.BudgetWatchdog
+  watchdog.configure({ incremental })
+  watchdog.stats.checks = 0
+  watchdog.stats.parses = 0
+  let alerts = 0
+  const count = () => alerts++
+  window.addEventListener('finance-intervention', count)
+  const times = []
+  for (let i = 0; i < checks; i++) {
+    const started = performance.now()
+    await watchdog.runChecks()
+    times.push(performance.now() - started)
+  }
+  window.removeEventListener('finance-intervention', count)
+  return { times, parses: watchdog.stats.parses, alerts }
+}
+"""
+
+COOLDOWN_JS = """
+async checks => {
+  const fired = {}
+  const count = e => { fired[e.detail.type] = (fired[e.detail.type] ?? 0) + 1 }
+  window.addEventListener('finance-intervention', count)
+  for (let i = 0; i < checks; i++) await window.__bench.watchdog.BudgetWatchdog.runChecks()
+  window.removeEventListener('finance-intervention', count)
+  return fired
+}
+"""
+
+# Fires ``count`` manual triggers, alternating Runway and Variance, either
+# back to back or one per frame, then waits for the consultation modal.
+BURST_JS = """
+async ([count, spaced]) => {
+  const frame = () => new Promise(requestAnimationFrame)
+  const modals = () => [...document.querySelectorAll('h2')].filter(h => h.textContent === 'The Accountant').length
+  let events = 0
+  const onEvent = () => events++
+  window.addEventListener('finance-intervention', onEvent)
+
+  const started = performance.now()
+  let dispatchMs = 0
+  for (let i = 0; i < count; i++) {
+    const t = performance.now()
+    window.triggerWatchdog({ type: i % 2 ? 'Variance' : 'Runway' })
+    dispatchMs += performance.now() - t
+    if (spaced) await frame()
+  }
+  while (!modals()) await frame()
+  const modalMs = performance.now() - started
+  await frame()
+  await frame()
+
+  window.removeEventListener('finance-intervention', onEvent)
+  return {
+    events,
+    dispatchMs,
+    modalMs,
+    modals: modals(),
+    bubbles: document.body.innerText.split('TEST ALERT').length - 1,
+  }
+}
+"""
+
+
+def seed(page, audit, report):
+    page.evaluate(SEED_JS, [json.dumps(audit), json.dumps(report)])
+    page.evaluate(CLEAR_COOLDOWNS_JS)
+
+
+def open_blueprint(page):
+    """(Re)mount BudgetManager, which starts the watchdog and registers window.triggerWatchdog."""
+    page.reload()
+    skip_loading_screen(page)
+    open_module(page, "finance")
+    expect(page.get_by_text("The Blueprint")).to_be_visible(timeout=BLUEPRINT_TIMEOUT)
+
+
+@scenario(fixtures=("onboarded", "gemini_key"), tags=("bench", "dev-only"))
+def verify_watchdog_bench(page):
+    use_virtual_clock(page)
+    page.goto(BASE_URL)
+    skip_loading_screen(page)
+    open_module(page, NEUTRAL)
+    import_app_module(page, "/src/services/accountant/BudgetWatchdog.ts", "watchdog")
+
+    check_rows = []
+    for categories in CATEGORIES:
+        seed(page, *finance_audit(categories, SUBCATEGORIES, seed=categories))
+        for incremental in (False, True):
+            page.evaluate(CLEAR_COOLDOWNS_JS)
+            result = page.evaluate(CHECKS_JS, [CHECKS, incremental])
+            check_rows.append({
+                "categories": categories,
+                "entries": categories * SUBCATEGORIES,
+                "mode": "incremental" if incremental else "full",
+                "checks": CHECKS,
+                "parses": result["parses"],
+                "alerts": result["alerts"],
+                **{f"{k}Ms": v for k, v in summarize(result["times"]).items()},
+            })
+    print_table(check_rows, [
+        ("categories", "categories", ",d"),
+        ("entries", "entries", ",d"),
+        ("mode", "mode", "s"),
+        ("parses", "parses", "d"),
+        ("alerts", "alerts", "d"),
+        ("medianMs", "median ms", ".3f"),
+        ("p95Ms", "p95 ms", ".3f"),
+        ("maxMs", "max ms", ".3f"),
+    ])
+
+    # A ledger that runs out of money: the first check raises the runway alert,
+    # and every later check in the burst must stay quiet. Nothing is spent this
+    # month, so the variance alert never fires.
+    seed(page, *finance_audit(CATEGORIES[0], SUBCATEGORIES, seed=0, liquid_assets=100))
+    fired = page.evaluate(COOLDOWN_JS, BURST)
+    print(f"Cooldown: {BURST} checks raised {fired or 'nothing'}")
+
+    burst_rows = []
+    seed(page, *finance_audit(CATEGORIES[-1], SUBCATEGORIES, seed=CATEGORIES[-1]))
+    for spaced in (False, True):
+        open_blueprint(page)
+        burst_rows.append({
+            "categories": CATEGORIES[-1],
+            "burst": "per frame" if spaced else "one task",
+            "triggers": BURST,
+            **page.evaluate(BURST_JS, [BURST, spaced]),
+        })
+    print_table(burst_rows, [
+        ("categories", "categories", ",d"),
+        ("burst", "burst", "s"),
+        ("triggers", "triggers", "d"),
+        ("events", "events", "d"),
+        ("dispatchMs", "dispatch ms", ".2f"),
+        ("modalMs", "to modal ms", ".1f"),
+        ("modals", "modals", "d"),
+        ("bubbles", "alert bubbles", "d"),
+    ])
+
+    record("watchdogBench", {"checks": check_rows, "cooldown": fired, "burst": burst_rows})
+    print(f"Results written to {write_csv('watchdog-checks', check_rows)}")
+
+    alerting = [f"{row['categories']} {row['mode']}" for row in check_rows if row["alerts"]]
+    assert not alerting, f"Alerts fired during timed checks, so some checks skipped work: {alerting}"
+    assert fired == {"Runway": 1}, f"Expected one runway alert in {BURST} checks, got {fired or 'none'}"
+    assert all(row["modals"] == 1 for row in burst_rows), f"Expected one consultation modal: {burst_rows}"
+
+
+if __name__ == "__main__":
+    run_standalone(verify_watchdog_bench)
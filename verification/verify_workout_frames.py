@@ -0,0 +1,83 @@
+"""How smooth is a real ActiveWorkout session?
+
+Walks the same path as verify_session.py (setup -> active reps -> "Rest &
+Prepare" -> timed plank "Seconds"). On each screen it samples
+requestAnimationFrame intervals for a dwell time while the countdown timers
+and framer-motion animations run (harness/frames.py). Reports FPS, dropped-
+frame percentage and the worst frame per stage.
+
+The rest (60s) and plank (30s) timers keep running during the dwell, so
+dwells must stay below them. Set one dwell for all stages or override
+single ones:
+
+    LIS_FRAMES_DWELL_MS=5000                 every stage
+    LIS_FRAMES_DWELL_MS=3000,rest=20000      rest 20s, the others 3s
+    LIS_FRAMES_REFRESH_HZ=60                 display the drop budget assumes
+"""
+
+import os
+
+from harness import BASE_URL, IPHONE_16, open_module, record, run_standalone, scenario
+from harness.bench import print_table
+from harness.frames import sample_frames
+
+STAGES = ("setup", "active", "rest", "timer")
+REFRESH_HZ = float(os.environ.get("LIS_FRAMES_REFRESH_HZ", 60))
+
+
+def dwell_times(spec, default=5000) -> dict:
+    """Parse ``LIS_FRAMES_DWELL_MS``: a bare number is the default, ``stage=ms`` overrides."""
+    overrides = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        if "=" not in part:
+            default = int(part)
+            continue
+        stage, ms = part.split("=", 1)
+        if stage not in STAGES:
+            raise ValueError(f"Unknown stage {stage!r}; expected one of {', '.join(STAGES)}")
+        overrides[stage] = int(ms)
+    return {stage: overrides.get(stage, default) for stage in STAGES}
+
+
+DWELL_MS = dwell_times(os.environ.get("LIS_FRAMES_DWELL_MS", ""))
+
+
+@scenario(context=IPHONE_16, fixtures=("workout_circuit", "onboarded"), tags=("bench",))
+def verify_workout_frames(page):
+    page.goto(BASE_URL)
+    open_module(page, "workouts")
+    page.wait_for_selector("text=Test Circuit")
+
+    stages = {}
+
+    page.get_by_label("Start workout").click()
+    page.wait_for_selector("text=Session Setup")
+    stages["setup"] = sample_frames(page, DWELL_MS["setup"], REFRESH_HZ)
+
+    page.get_by_text("START SESSION").click()
+    page.wait_for_selector("text=Target Reps")
+    stages["active"] = sample_frames(page, DWELL_MS["active"], REFRESH_HZ)
+
+    page.get_by_text("Set Complete").click()
+    page.wait_for_selector("text=Rest & Prepare")
+    stages["rest"] = sample_frames(page, DWELL_MS["rest"], REFRESH_HZ)
+
+    page.get_by_text("Skip Rest").click()
+    page.wait_for_selector("text=Seconds")
+    stages["timer"] = sample_frames(page, DWELL_MS["timer"], REFRESH_HZ)
+
+    rows = [{"stage": stage, "dwellMs": DWELL_MS[stage], **stats} for stage, stats in stages.items()]
+    print_table(rows, [
+        ("stage", "stage", "s"),
+        ("dwellMs", "dwell ms", "d"),
+        ("frames", "frames", "d"),
+        ("fps", "fps", ".1f"),
+        ("droppedPct", "dropped %", ".2f"),
+        ("p95Ms", "p95 ms", ".1f"),
+        ("worstMs", "worst ms", ".1f"),
+    ])
+    record("workoutFrames", {row.pop("stage"): row for row in rows})
+
+
+if __name__ == "__main__":
+    run_standalone(verify_workout_frames)